@@ -0,0 +1,21 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmarks for Mansa Genesis
+
+These are not tests. Each module is a standalone script that prints its
+measurements, run from the repository root with:
+    python -m benchmarks.<name>
+"""
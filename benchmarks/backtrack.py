@@ -0,0 +1,110 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Cost of lookahead and backtracking on a CharStream, by input size.
+
+Each case runs at positions spread over the input, so its time per
+operation should not grow with the input. For contrast, "fresh stream"
+backtracks the way it was done without marks: a new stream over the same
+source, moved to the saved offset, which has to rebuild its line index.
+
+    python -m benchmarks.backtrack [--repeat N]
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from functools import partial
+
+from mansa.lexer.stream import CharStream
+
+SIZES = (10_000, 1_000_000, 10_000_000)
+LINE = "let value_42 = other_name + 12345\n"
+# Characters scanned speculatively before backing off.
+SPECULATE = 16
+
+
+def positions(size: int, count: int) -> list[int]:
+    """``count`` offsets spread evenly over ``size`` characters."""
+    return [size * i // count for i in range(count)]
+
+
+def mark_reset(stream: CharStream, offsets: list[int]) -> None:
+    for offset in offsets:
+        object.__setattr__(stream, "current_index", offset)
+        stream.reset(stream.mark())
+
+
+def backtrack(stream: CharStream, offsets: list[int]) -> None:
+    for offset in offsets:
+        object.__setattr__(stream, "current_index", offset)
+        mark = stream.mark()
+        for _ in range(SPECULATE):
+            stream.advance()
+        stream.reset(mark)
+
+
+def lookahead(stream: CharStream, offsets: list[int]) -> None:
+    for offset in offsets:
+        object.__setattr__(stream, "current_index", offset)
+        stream.peek(4)
+        stream.peek_str(4)
+
+
+def fresh_stream(stream: CharStream, offsets: list[int]) -> None:
+    for offset in offsets:
+        copy = CharStream(stream.source)
+        object.__setattr__(copy, "current_index", offset)
+        copy.line  # noqa: B018 - resolving the line builds the index
+
+
+CASES: dict[str, tuple[Callable[[CharStream, list[int]], None], int]] = {
+    # name: (run, operations per run)
+    "mark + reset": (mark_reset, 1000),
+    f"mark + {SPECULATE} advances + reset": (backtrack, 1000),
+    "peek(4) + peek_str(4)": (lookahead, 1000),
+    "fresh stream (before)": (fresh_stream, 5),
+}
+
+
+def best(repeat: int, run: Callable[[], None]) -> float:
+    """Best wall time of ``repeat`` calls to ``run``."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5, help="Best of N runs.")
+    args = parser.parse_args()
+
+    sources = {size: (LINE * (size // len(LINE) + 1))[:size] for size in SIZES}
+    print(f"{'case':>34}" + "".join(f"{size:>12,} ch" for size in SIZES))
+    for name, (run, count) in CASES.items():
+        cells = []
+        for size in SIZES:
+            stream = CharStream(sources[size])
+            offsets = positions(size, count)
+            seconds = best(args.repeat, partial(run, stream, offsets))
+            cells.append(f"{seconds / count * 1e6:>12.2f} µs")
+        print(f"{name:>34}" + "".join(cells))
+
+
+if __name__ == "__main__":
+    main()
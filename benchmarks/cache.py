@@ -0,0 +1,55 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Cold versus warm ``lex_files`` runs through the on-disk token cache.
+
+    python -m benchmarks.cache [--files N] [--kb N] [--jobs N]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.lex_files import build_tree
+from mansa.lexer.batch import discover, lex_files
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=2000)
+    parser.add_argument("--kb", type=int, default=8, help="Size of each file.")
+    parser.add_argument("--jobs", type=int, default=1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        build_tree(os.path.join(root, "src"), args.files, args.kb * 1024)
+        paths = discover([os.path.join(root, "src")])
+        cache_dir = os.path.join(root, "cache")
+        timings = {}
+        for label, directory in (
+            ("no cache", None),
+            ("cold", cache_dir),
+            ("warm", cache_dir),
+        ):
+            start = time.perf_counter()
+            results = lex_files(paths, args.jobs, directory)
+            timings[label] = elapsed = time.perf_counter() - start
+            hits = sum(r.cached for r in results)
+            print(f"{label:<9} {elapsed * 1000:9.1f} ms  hits {hits}/{len(results)}")
+        print(f"warm speedup {timings['no cache'] / timings['warm']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
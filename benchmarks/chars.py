@@ -0,0 +1,127 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Cost of classifying identifier characters, on ASCII and mixed-script text.
+
+Compares the generated tables of ``mansa.lexer.chars`` with classifying
+through ``str.isidentifier`` and ``unicodedata``, then times the reference
+lexer with Unicode identifiers against its ASCII grammar.
+
+    python -m benchmarks.chars [--kb N] [--repeat N]
+"""
+
+import argparse
+import random
+import time
+import unicodedata
+from collections.abc import Callable
+
+from benchmarks.tokenize import corpus
+from mansa.lexer.chars import class_run, is_xid_continue
+from mansa.lexer.lexer import Lexer
+from mansa.lexer.stream import CharStream
+
+_MIXED_WORDS = ["value", "café", "naïve", "λόγος", "Σ_total", "東京", "данные", "x١٢"]
+
+
+def mixed_corpus(size: int, seed: int = 0) -> str:
+    """Generate ``size`` characters of identifiers in several scripts."""
+    rng = random.Random(seed)
+    parts = []
+    while size > 0:
+        part = rng.choice(_MIXED_WORDS) + ("\n" if rng.random() < 0.1 else " ")
+        parts.append(part)
+        size -= len(part)
+    return "".join(parts)
+
+
+def by_isidentifier(ch: str) -> bool:
+    return ("a" + ch).isidentifier()
+
+
+_CONTINUE_CATEGORIES = frozenset(
+    {"Lu", "Ll", "Lt", "Lm", "Lo", "Nl", "Mn", "Mc", "Nd", "Pc"}
+)
+
+
+def by_category(ch: str) -> bool:
+    # Close to, but not exactly, XID_Continue.
+    return unicodedata.category(ch) in _CONTINUE_CATEGORIES
+
+
+def by_runs(text: str) -> int:
+    """Split ``text`` into runs of XID_Continue and other characters."""
+    members, others = class_run("XID_CONTINUE"), class_run("XID_CONTINUE", True)
+    pos, runs, size = 0, 0, len(text)
+    while pos < size:
+        for run in (members, others):
+            match = run.match(text, pos)
+            if match is not None and match.end() > pos:
+                pos = match.end()
+                runs += 1
+    return runs
+
+
+def best(repeat: int, run: Callable[[], object]) -> float:
+    """Best wall time of ``repeat`` calls to ``run``."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--kb", type=int, default=256, help="Size of each corpus.")
+    parser.add_argument("--repeat", type=int, default=3, help="Best of N runs.")
+    args = parser.parse_args()
+
+    size = args.kb * 1024
+    corpora = {"ascii": corpus(size), "mixed": mixed_corpus(size)}
+    classifiers: dict[str, Callable[[str], bool]] = {
+        "tables": is_xid_continue,
+        "str.isidentifier": by_isidentifier,
+        "unicodedata.category": by_category,
+    }
+    print(f"{'classify XID_Continue':<26}" + "".join(f"{n:>16}" for n in corpora))
+    for name, member in classifiers.items():
+        cells = []
+        for text in corpora.values():
+            seconds = best(args.repeat, lambda: list(map(member, text)))  # noqa: B023
+            cells.append(f"{seconds / len(text) * 1e9:>11.1f} ns/ch")
+        print(f"{name:<26}" + "".join(cells))
+    # The same tables as run patterns, classifying whole runs in C.
+    cells = []
+    for text in corpora.values():
+        seconds = best(args.repeat, lambda: by_runs(text))  # noqa: B023
+        cells.append(f"{seconds / len(text) * 1e9:>11.1f} ns/ch")
+    print(f"{'tables, as run patterns':<26}" + "".join(cells))
+
+    print(f"\n{'reference lexer':<26}" + "".join(f"{n:>16}" for n in corpora))
+    for name, unicode_identifiers in (("ASCII grammar", False), ("Unicode", True)):
+        cells = []
+        for text in corpora.values():
+            seconds = best(
+                args.repeat,
+                lambda: list(Lexer(CharStream(text), unicode_identifiers)),  # noqa: B023
+            )
+            cells.append(f"{len(text) / seconds / 1e6:>11.2f} Mch/s")
+        print(f"{name:<26}" + "".join(cells))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Throughput of ``lex_files`` over a generated tree as worker count grows.
+
+    python -m benchmarks.lex_files [--files N] [--kb N] [--max-jobs N]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.tokenize import corpus
+from mansa.lexer.batch import discover, lex_files
+
+
+def build_tree(root: str, files: int, size: int) -> None:
+    """Write ``files`` generated sources of ``size`` chars, 100 per directory."""
+    for i in range(files):
+        directory = os.path.join(root, f"pkg{i // 100:04d}")
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, f"mod{i:05d}.mansa"), "w") as f:
+            f.write(corpus(size, seed=i))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=2000)
+    parser.add_argument("--kb", type=int, default=8, help="Size of each file.")
+    parser.add_argument("--max-jobs", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        build_tree(root, args.files, args.kb * 1024)
+        paths = discover([root])
+        jobs_list = sorted({1, *(2**k for k in range(8)), args.max_jobs})
+        baseline = 0.0
+        for jobs in (j for j in jobs_list if j <= args.max_jobs):
+            start = time.perf_counter()
+            results = lex_files(paths, jobs)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            size = sum(r.size for r in results) / 2**20
+            print(
+                f"-j {jobs:<3} {len(results) / elapsed:8.0f} files/s"
+                f" {size / elapsed:7.2f} MB/s  speedup {baseline / elapsed:5.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+INT literals on numeric-heavy code: values re-parsed from the source at
+every use against the ``IntPool`` constant pool, which stores each distinct
+literal once and decodes it once.
+
+    python -m benchmarks.literals [--mb N] [--repeat N] [--uses N]
+"""
+
+import argparse
+import random
+import sys
+
+from benchmarks.symbols import best, traced
+from mansa.lexer.buffer import KIND_CODES
+from mansa.lexer.literals import IntPool
+from mansa.lexer.scanner import scan
+from mansa.lexer.token import TokenKind
+
+# Literals that recur throughout real code: flags, widths, shifts, masks.
+_COMMON = ["0", "1", "2", "4", "8", "16", "32", "64", "255", "65535", "4294967295"]
+
+
+def numeric_corpus(size: int, seed: int = 0) -> str:
+    """Generate ``size`` characters of table-like code, mostly literals.
+
+    Two thirds of the literals are common ones, most others are random
+    32-bit values and about one in a thousand is a 300-digit constant.
+    """
+    rng = random.Random(seed)
+    words = ["mask", "width", "shift", "entry", "table", "k"]
+    parts = []
+    total = 0
+    while total < size:
+        roll = rng.random()
+        if roll < 0.25:
+            part = rng.choice(words)
+        elif roll < 0.75:
+            part = rng.choice(_COMMON)
+        elif roll < 0.999:
+            part = str(rng.randrange(2**32))
+        else:
+            part = str(rng.randrange(10**299, 10**300))
+        part += "\n" if rng.random() < 0.1 else " "
+        parts.append(part)
+        total += len(part)
+    return "".join(parts)[:size]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--mb", type=float, default=4, help="Corpus size in MB.")
+    parser.add_argument("--repeat", type=int, default=3, help="Best of N runs.")
+    parser.add_argument(
+        "--uses", type=int, default=3, help="Times each literal's value is read."
+    )
+    args = parser.parse_args()
+    sys.set_int_max_str_digits(0)
+
+    source = corpus_source = numeric_corpus(int(args.mb * 1024 * 1024))
+    plain = scan(source)
+    integer = KIND_CODES[TokenKind.INT]
+    spans = [
+        (start, end)
+        for code, start, end in zip(plain.kinds, plain.starts, plain.ends)
+        if code == integer
+    ]
+    indices = [i for i, code in enumerate(plain.kinds) if code == integer]
+    print(f"{len(plain):,} tokens, {len(spans):,} INT literals")
+
+    scanned = best(args.repeat, lambda: scan(source))
+    pooled = best(args.repeat, lambda: scan(source, pool=IntPool()))
+    print(f"scan: {scanned:.3f}s plain, {pooled:.3f}s pooling")
+
+    def reparse() -> list[int]:
+        values = []
+        for _ in range(args.uses):
+            values = [int(corpus_source[s:e]) for s, e in spans]
+        return values
+
+    def from_pool() -> list[int]:
+        pool = IntPool()
+        literals = scan(source, pool=pool).literals
+        value = pool.value
+        values = []
+        for _ in range(args.uses):
+            values = [value(literals[i]) for i in indices]
+        return values
+
+    parsed = best(args.repeat, lambda: (scan(source), reparse()))
+    lazy = best(args.repeat, from_pool)
+    print(
+        f"scan and read every value {args.uses}x: {parsed:.3f}s re-parsing,"
+        f" {lazy:.3f}s from the pool ({parsed / lazy:.2f}x)"
+    )
+
+    pool = IntPool()
+    literals = scan(source, pool=pool).literals
+    long = [(s, e, literals[i]) for (s, e), i in zip(spans, indices) if e - s > 20]
+    parsed = best(
+        args.repeat, lambda: [int(source[s:e]) for s, e, _ in long for _ in range(3)]
+    )
+    decoded = best(
+        args.repeat, lambda: [pool.value(k) for _, _, k in long for _ in range(3)]
+    )
+    print(
+        f"{len(long):,} long literals read 3x: {parsed * 1e3:.1f} ms parsing,"
+        f" {decoded * 1e3:.2f} ms from the pool"
+    )
+
+    _, values_bytes = traced(lambda: [int(source[s:e]) for s, e in spans])
+    pool = IntPool()
+    _, pooled_bytes = traced(lambda: scan(source, pool=pool).literals)
+    for literal in range(len(pool)):
+        pool.value(literal)
+    print(
+        f"memory: {values_bytes / 2**20:.1f} MiB of per-token values,"
+        f" {pooled_bytes / 2**20:.1f} MiB of literal ids and pool"
+        f" ({len(pool):,} distinct literals)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Incremental re-lexing after a small edit against a full re-lex.
+
+Edits land in the middle of a generated file of ``--lines`` lines.
+
+    python -m benchmarks.relex [--lines N] [--repeat N]
+"""
+
+import argparse
+import time
+from collections.abc import Callable
+from functools import partial
+
+from benchmarks.tokenize import corpus
+from mansa.lexer.incremental import Edit, relex
+from mansa.lexer.scanner import scan
+
+EDITS: dict[str, Callable[[int], Edit]] = {
+    "insert char": lambda mid: Edit(mid, mid, "q"),
+    "replace char": lambda mid: Edit(mid, mid + 1, "7"),
+    "delete line": lambda mid: Edit(mid, mid + 40, ""),
+    "paste 5 lines": lambda mid: Edit(mid, mid, "let pasted = 1\n" * 5),
+}
+
+
+def best(repeat: int, run: Callable[[], object]) -> float:
+    """Best wall time of ``repeat`` calls to ``run``."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def source_of(lines: int, width: int = 40) -> str:
+    """Generated source of exactly ``lines`` lines of ``width`` characters."""
+    text = corpus(lines * width).replace("\n", " ")
+    return "\n".join(text[i : i + width - 1] for i in range(0, len(text), width))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lines", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=5, help="Best of N runs.")
+    args = parser.parse_args()
+
+    source = source_of(args.lines)
+    buffer = scan(source)
+    mid = len(source) // 2
+    print(f"{source.count(chr(10)) + 1:,} lines, {len(buffer):,} tokens")
+    for label, make in EDITS.items():
+        edit = make(mid)
+        new_source = edit.apply(source)
+        assert relex(buffer, new_source, edit) == scan(new_source)
+        full = best(args.repeat, partial(scan, new_source))
+        incremental = best(args.repeat, partial(relex, buffer, new_source, edit))
+        print(
+            f"{label:>14}: full {full * 1e3:8.2f} ms"
+            f"  incremental {incremental * 1e3:7.2f} ms  ({full / incremental:5.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Throughput of ``scan_split`` on one large generated file as worker count
+grows. One job is plain ``scan_bytes`` of the mapped file.
+
+    python -m benchmarks.split [--mb N] [--max-jobs N]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.tokenize import corpus
+from mansa.lexer.split import scan_split
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--mb", type=int, default=256, help="Size of the file.")
+    parser.add_argument("--max-jobs", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        path = os.path.join(root, "big.mansa")
+        block = corpus(1024 * 1024)
+        with open(path, "w") as f:
+            f.writelines(block for _ in range(args.mb))
+        jobs_list = sorted({1, *(2**k for k in range(8)), args.max_jobs})
+        baseline = 0.0
+        for jobs in (j for j in jobs_list if j <= args.max_jobs):
+            start = time.perf_counter()
+            tokens = scan_split(path, jobs)
+            elapsed = time.perf_counter() - start
+            baseline = baseline or elapsed
+            print(
+                f"-j {jobs:<3} {args.mb / elapsed:7.2f} MB/s"
+                f" {len(tokens.buffer) / elapsed / 1e6:6.2f} Mtok/s"
+                f"  speedup {baseline / elapsed:5.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
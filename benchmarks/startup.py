@@ -0,0 +1,86 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Startup cost of the ``mansa`` CLI.
+
+Times whole ``python -m mansa`` processes against a bare interpreter, then
+lists the slowest imports of ``mansa --version`` from ``-X importtime``.
+
+    python -m benchmarks.startup [--runs N] [--top N]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+CALLS = {
+    "python -c pass": ["-c", "pass"],
+    "mansa --version": ["-m", "mansa", "--version"],
+    "mansa -h": ["-m", "mansa", "-h"],
+}
+
+
+def wall_times(args: list[str], runs: int) -> list[float]:
+    """Wall-clock seconds of ``runs`` fresh interpreters running ``args``."""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *args], check=False, capture_output=True)
+        times.append(time.perf_counter() - start)
+    return times
+
+
+def slowest_imports(args: list[str], top: int) -> list[tuple[int, str]]:
+    """The ``top`` imports by cumulative microseconds under ``-X importtime``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        check=False,
+        capture_output=True,
+        text=True,
+    )
+    imports = []
+    for line in result.stderr.splitlines()[1:]:
+        _, cumulative, name = line.split("|")
+        imports.append((int(cumulative), name.rstrip()))
+    return sorted(imports, reverse=True)[:top]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        with open(os.path.join(root, "one.mansa"), "w") as f:
+            f.write("alpha 1\n")
+        calls = {**CALLS, "mansa lex (1 file)": ["-m", "mansa", "lex", "-j1", root]}
+        for label, call in calls.items():
+            times = wall_times(call, args.runs)
+            print(
+                f"{label:>20}: min {min(times) * 1e3:6.1f} ms"
+                f"  median {statistics.median(times) * 1e3:6.1f} ms"
+            )
+
+    print("\nslowest imports of `mansa --version` (cumulative):")
+    for micros, name in slowest_imports(CALLS["mansa --version"], args.top):
+        print(f"{micros / 1e3:8.2f} ms {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Peak RSS of a CharStream per MB of input.
+
+Compares the zero-copy stream against the previous layout, which kept a
+``list(source)`` alongside the source string. Each measurement runs in a
+fresh interpreter so peak RSS is not polluted by earlier runs.
+
+    python -m benchmarks.stream_memory [--mb N]
+"""
+
+import argparse
+import subprocess
+import sys
+
+_CHILD = """
+import resource, sys
+from mansa.lexer.stream import CharStream
+
+def peak_kib():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+mode, size = sys.argv[1], int(sys.argv[2])
+before = peak_kib()
+line = "let value_42 = other_name + 12345\\n"
+source = line * (size // len(line))
+stream = CharStream(source)
+if mode == "list":
+    chars = list(source)
+while not stream.is_eof():
+    stream.advance()
+print(peak_kib() - before)
+"""
+
+
+def measure(mode: str, size: int) -> int:
+    """Return the peak RSS growth in KiB for one stream over ``size`` chars."""
+    result = subprocess.run(
+        [sys.executable, "-c", _CHILD, mode, str(size)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return int(result.stdout)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--mb", type=int, default=16, help="Input size in MB.")
+    args = parser.parse_args()
+
+    size = args.mb * 1024 * 1024
+    print(f"input: {args.mb} MB ASCII source")
+    for label, mode in (("list(source) (before)", "list"), ("zero-copy", "view")):
+        kib = measure(mode, size)
+        print(f"{label:>22}: {kib / 1024 / args.mb:6.2f} MB peak RSS per MB input")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,285 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Lexer benchmark suite over reproducible synthetic corpora.
+
+Times each case on each corpus (best of ``--repeat`` runs), then reruns it
+once under ``tracemalloc`` for peak Python memory. Results can be saved as
+a JSON baseline and later runs compared against it; the exit status is 1
+when any figure regresses by more than ``--threshold``.
+
+    python -m benchmarks.suite [--kb N] [--save FILE] [--compare FILE]
+"""
+
+import argparse
+import gc
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from collections.abc import Callable
+
+from mansa.lexer.lexer import IDENT_CONTINUE, WHITESPACE, Lexer
+from mansa.lexer.scanner import scan, tokenize
+from mansa.lexer.stream import CharStream, Position
+
+# Bump when corpora or cases change, so stale baselines are not compared.
+SUITE_VERSION = 3
+
+_WORDS = ["value", "x", "_tmp", "counter_42", "Alpha", "b2", "result_total"]
+_PUNCT = "+-*/=(){};,.<>!&|"
+
+
+def _ident_heavy(rng: random.Random, size: int) -> str:
+    parts = []
+    while size > 0:
+        part = rng.choice(_WORDS) + ("\n" if rng.random() < 0.1 else " ")
+        parts.append(part)
+        size -= len(part)
+    return "".join(parts)
+
+
+def _digit_heavy(rng: random.Random, size: int) -> str:
+    parts = []
+    while size > 0:
+        part = str(rng.randrange(10**12)) + ("\n" if rng.random() < 0.1 else " ")
+        parts.append(part)
+        size -= len(part)
+    return "".join(parts)
+
+
+def _long_lines(rng: random.Random, size: int) -> str:
+    return _ident_heavy(rng, size).replace("\n", " ")[: size - 1] + "\n"
+
+
+def _short_lines(rng: random.Random, size: int) -> str:
+    return "".join(rng.choice(["x\n", "1\n", ";\n", "\n"]) for _ in range(size // 2))
+
+
+def _non_ascii(rng: random.Random, size: int) -> str:
+    words = [*_WORDS, "café", "naïve", "λ", "Σ_total", "東京", "emoji🙂"]
+    parts = []
+    while size > 0:
+        part = rng.choice(words) + ("\n" if rng.random() < 0.1 else " ")
+        parts.append(part)
+        size -= len(part)
+    return "".join(parts)
+
+
+def _pathological(rng: random.Random, size: int) -> str:
+    # A quarter each: one huge identifier, one huge number, one huge run of
+    # punctuation (a single ILLEGAL token) and whitespace only.
+    quarter = size // 4
+    return "".join(
+        [
+            "a" * quarter,
+            " ",
+            "9" * quarter,
+            " ",
+            "".join(rng.choice(_PUNCT) for _ in range(quarter)),
+            " \t\r\n" * (quarter // 4),
+        ]
+    )
+
+
+CORPORA: dict[str, Callable[[random.Random, int], str]] = {
+    "ident_heavy": _ident_heavy,
+    "digit_heavy": _digit_heavy,
+    "long_lines": _long_lines,
+    "short_lines": _short_lines,
+    "non_ascii": _non_ascii,
+    "pathological": _pathological,
+}
+
+
+def make_corpus(name: str, size: int, seed: int = 0) -> str:
+    """Generate ``size`` characters of the named corpus, the same every time."""
+    return CORPORA[name](random.Random(seed), size)[:size]
+
+
+def _advance(source: str) -> int:
+    stream = CharStream(source)
+    while not stream.is_eof():
+        stream.advance()
+    return 0
+
+
+def _skip_while(source: str) -> int:
+    stream = CharStream(source)
+    while True:
+        stream.skip_while(WHITESPACE)
+        if stream.is_eof():
+            return 0
+        run = stream.skip_while(IDENT_CONTINUE)
+        if run.start == run.end:  # punctuation or non-ASCII
+            stream.advance()
+
+
+def _iterate(source: str) -> int:
+    for _ in CharStream(source):
+        pass
+    return 0
+
+
+def _positions(source: str) -> int:
+    for i in range(len(source)):
+        Position(i, i + 1, 1, i + 1)
+    return 0
+
+
+def _lexer(source: str) -> int:
+    return sum(1 for _ in Lexer(CharStream(source)))
+
+
+def _scan(source: str) -> int:
+    return len(scan(source))
+
+
+def _tokenize(source: str) -> int:
+    return len(tokenize(source))
+
+
+# Each case returns the number of tokens it produced, or 0 if it does not lex.
+CASES: dict[str, Callable[[str], int]] = {
+    "stream.advance": _advance,
+    "stream.__iter__": _iterate,
+    "stream.skip_while": _skip_while,
+    "Position": _positions,
+    "Lexer": _lexer,
+    "scan": _scan,
+    "tokenize": _tokenize,
+}
+
+# Higher is better for throughput, lower for memory.
+_HIGHER_IS_BETTER = {"chars_per_sec": True, "tokens_per_sec": True, "peak_bytes": False}
+# Peak memory growth below this many bytes is noise, whatever the ratio.
+_MEMORY_SLACK = 64 * 1024
+
+
+def measure(case: Callable[[str], int], source: str, repeat: int) -> dict[str, float]:
+    """Return throughput and peak traced memory of ``case`` over ``source``."""
+    elapsed = float("inf")
+    gc.collect()
+    gc.disable()  # as timeit does, so collections do not land in one run
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            tokens = case(source)
+            elapsed = min(elapsed, time.perf_counter() - start)
+    finally:
+        gc.enable()
+    tracemalloc.start()
+    try:
+        case(source)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    result = {"chars_per_sec": len(source) / elapsed, "peak_bytes": float(peak)}
+    if tokens:
+        result["tokens_per_sec"] = tokens / elapsed
+    return result
+
+
+def run(size: int, repeat: int) -> dict[str, dict[str, float]]:
+    """Measure every case on every corpus, keyed ``"corpus/case"``."""
+    results = {}
+    for corpus_name in CORPORA:
+        source = make_corpus(corpus_name, size)
+        for case_name, case in CASES.items():
+            key = f"{corpus_name}/{case_name}"
+            results[key] = measure(case, source, repeat)
+            print(_format(key, results[key]), flush=True)
+    return results
+
+
+def compare(
+    baseline: dict[str, dict[str, float]],
+    results: dict[str, dict[str, float]],
+    threshold: float,
+) -> list[str]:
+    """Describe each figure in ``results`` worse than ``baseline`` by > threshold."""
+    regressions = []
+    for key, metrics in results.items():
+        for metric, value in metrics.items():
+            before = baseline.get(key, {}).get(metric)
+            if not before:
+                continue
+            if _HIGHER_IS_BETTER[metric]:
+                change = before / value - 1 if value else float("inf")
+            elif value - before > _MEMORY_SLACK:
+                change = value / before - 1
+            else:
+                continue
+            if change > threshold:
+                regressions.append(
+                    f"{key} {metric}: {before:,.0f} -> {value:,.0f} ({change:+.0%})"
+                )
+    return regressions
+
+
+def _format(key: str, metrics: dict[str, float]) -> str:
+    tokens = metrics.get("tokens_per_sec")
+    return (
+        f"{key:<30} {metrics['chars_per_sec'] / 1e6:8.2f} Mchar/s"
+        + (f"  {tokens / 1e6:8.2f} Mtok/s" if tokens else " " * 16)
+        + f"  {metrics['peak_bytes'] / 2**20:8.2f} MiB peak"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--kb", type=int, default=64, help="Size of each corpus.")
+    parser.add_argument("--repeat", type=int, default=5, help="Best of N runs.")
+    parser.add_argument("--save", metavar="FILE", help="Write results as JSON.")
+    parser.add_argument("--compare", metavar="FILE", help="Baseline JSON to check.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="Allowed slowdown or memory growth as a fraction (default 0.25).",
+    )
+    args = parser.parse_args()
+
+    size = args.kb * 1024
+    results = run(size, args.repeat)
+    if args.save:
+        report = {
+            "suite_version": SUITE_VERSION,
+            "size": size,
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "results": results,
+        }
+        with open(args.save, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+            f.write("\n")
+    if not args.compare:
+        return 0
+
+    with open(args.compare) as f:
+        baseline = json.load(f)
+    if (baseline.get("suite_version"), baseline.get("size")) != (SUITE_VERSION, size):
+        print(f"{args.compare}: baseline is for another suite version or size")
+        return 1
+    regressions = compare(baseline["results"], results, args.threshold)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    print(f"{len(regressions)} regression(s) beyond {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,104 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Memory and lookup cost of identifier names: per-token strings, as cut out
+of the source with ``CharStream.sub``, against interned symbol ids.
+
+    python -m benchmarks.symbols [--mb N] [--repeat N]
+"""
+
+import argparse
+import time
+import tracemalloc
+from collections.abc import Callable
+
+from benchmarks.tokenize import corpus
+from mansa.lexer.buffer import KIND_CODES
+from mansa.lexer.scanner import scan
+from mansa.lexer.symbols import SymbolTable
+from mansa.lexer.token import TokenKind
+
+
+def best(repeat: int, run: Callable[[], object]) -> float:
+    """Best wall time of ``repeat`` calls to ``run``."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def traced[T](build: Callable[[], T]) -> tuple[T, int]:
+    """Return what ``build`` returns and the memory it keeps alive."""
+    tracemalloc.start()
+    try:
+        result = build()
+        return result, tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--mb", type=float, default=4, help="Corpus size in MB.")
+    parser.add_argument("--repeat", type=int, default=3, help="Best of N runs.")
+    args = parser.parse_args()
+
+    source = corpus(int(args.mb * 1024 * 1024))
+    buffer = scan(source)
+    ident = KIND_CODES[TokenKind.IDENT]
+    spans = [
+        (start, end)
+        for code, start, end in zip(buffer.kinds, buffer.starts, buffer.ends)
+        if code == ident
+    ]
+    print(f"{len(spans):,} identifiers")
+
+    plain = best(args.repeat, lambda: scan(source))
+    interned = best(args.repeat, lambda: scan(source, SymbolTable()))
+    print(f"scan: {plain:.3f}s plain, {interned:.3f}s interning")
+
+    names, names_bytes = traced(lambda: [source[s:e] for s, e in spans])
+    table = SymbolTable()
+    symbols, symbols_bytes = traced(lambda: scan(source, table).symbols)
+    print(
+        f"memory: {names_bytes / 2**20:.1f} MiB of per-token strings,"
+        f" {symbols_bytes / 2**20:.1f} MiB of symbol ids and table"
+        f" ({len(table)} distinct names)"
+    )
+
+    ids = [symbol for symbol in symbols if symbol >= 0]
+    by_name = dict.fromkeys(names, 0)
+    by_id = dict.fromkeys(ids, 0)
+    target_name, target_id = names[0], ids[0]
+    timings = {
+        "dict lookup": (
+            best(args.repeat, lambda: [by_name[n] for n in names]),
+            best(args.repeat, lambda: [by_id[i] for i in ids]),
+        ),
+        "equality": (
+            best(args.repeat, lambda: sum(n == target_name for n in names)),
+            best(args.repeat, lambda: sum(i == target_id for i in ids)),
+        ),
+    }
+    for label, (by_string, by_symbol) in timings.items():
+        print(
+            f"{label:>12}: strings {by_string * 1e3:7.1f} ms,"
+            f" symbols {by_symbol * 1e3:7.1f} ms ({by_string / by_symbol:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Thread and process workers compared as worker count grows.
+
+Times ``lex_files`` over a generated tree and ``scan_split`` over one
+generated file in both modes. Threads only scale on a free-threaded
+interpreter; run this under both builds to compare:
+
+    python -m benchmarks.threads [--files N] [--kb N] [--mb N] [--max-jobs N]
+    python3.13t -m benchmarks.threads ...
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+
+from benchmarks.lex_files import build_tree
+from benchmarks.tokenize import corpus
+from mansa.lexer.batch import discover, lex_files
+from mansa.lexer.split import scan_split
+
+
+def gil_enabled() -> bool:
+    """Whether this interpreter runs with the GIL."""
+    is_gil_enabled: Callable[[], bool] | None = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled() if is_gil_enabled is not None else True
+
+
+def timed(run: Callable[[int, bool], object], jobs: int, threads: bool) -> float:
+    """Wall time of one ``run(jobs, threads)``."""
+    start = time.perf_counter()
+    run(jobs, threads)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=2000)
+    parser.add_argument("--kb", type=int, default=8, help="Size of each file.")
+    parser.add_argument("--mb", type=int, default=64, help="Size of the big file.")
+    parser.add_argument("--max-jobs", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    print(f"Python {sys.version.split()[0]}, GIL {'on' if gil_enabled() else 'off'}")
+    jobs_list = [
+        j for j in sorted({1, 2, 4, 8, 16, args.max_jobs}) if j <= args.max_jobs
+    ]
+    with tempfile.TemporaryDirectory() as root:
+        build_tree(os.path.join(root, "tree"), args.files, args.kb * 1024)
+        paths = discover([os.path.join(root, "tree")])
+        big = os.path.join(root, "big.mansa")
+        with open(big, "w") as f:
+            f.write(corpus(1024 * 1024) * args.mb)
+
+        cases: dict[str, Callable[[int, bool], object]] = {
+            f"lex_files ({args.files} files)": lambda jobs, threads: lex_files(
+                paths, jobs, threads=threads
+            ),
+            f"scan_split ({args.mb} MB)": lambda jobs, threads: scan_split(
+                big, jobs, threads=threads
+            ),
+        }
+        for name, run in cases.items():
+            print(f"\n{name}")
+            baseline = timed(run, 1, False)
+            print(f"  -j 1    {baseline:7.2f} s")
+            for jobs in jobs_list[1:]:
+                cells = []
+                for mode, threads in (("processes", False), ("threads", True)):
+                    elapsed = timed(run, jobs, threads)
+                    cells.append(
+                        f"{mode} {elapsed:6.2f} s ({baseline / elapsed:4.2f}x)"
+                    )
+                print(f"  -j {jobs:<3}  " + "   ".join(cells))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Memory and pickling cost of a TokenBuffer against a list of Token objects.
+
+    python -m benchmarks.token_buffer [--mb N]
+"""
+
+import argparse
+import pickle
+import time
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from benchmarks.tokenize import corpus
+from mansa.lexer.scanner import scan
+
+
+def traced(build: Callable[[], Any]) -> tuple[Any, int]:
+    """Return ``build()`` and the bytes it left allocated."""
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--mb", type=float, default=5, help="Corpus size in MB.")
+    args = parser.parse_args()
+
+    source = corpus(int(args.mb * 1024 * 1024))
+    buffer, buffer_bytes = traced(lambda: scan(source))
+    tokens, token_bytes = traced(buffer.tokens)
+    print(f"{len(buffer):,} tokens from {args.mb} MB")
+    print(f"{'':>12} {'memory':>12} {'B/token':>8} {'pickle':>12} {'dump+load':>10}")
+    for label, value, size in (
+        ("list[Token]", tokens, token_bytes),
+        ("TokenBuffer", buffer, buffer_bytes),
+    ):
+        start = time.perf_counter()
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        pickle.loads(data)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{label:>12} {size / 2**20:10.1f}MB {size / len(buffer):8.1f}"
+            f" {len(data) / 2**20:10.1f}MB {elapsed:9.3f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
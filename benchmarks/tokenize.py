@@ -0,0 +1,86 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Tokens per second of the bulk tokenizer against the reference lexer.
+
+``scan`` only fills a TokenBuffer; ``tokenize`` also materializes Tokens.
+
+The reference lexer runs over the same corpus by default, which takes a
+minute or two at 10 MB; ``--reference-mb`` times it on a prefix instead.
+Each figure is the best of ``--repeat`` runs.
+
+    python -m benchmarks.tokenize [--mb N] [--reference-mb N]
+"""
+
+import argparse
+import random
+import time
+from collections.abc import Callable, Sized
+
+from mansa.lexer.lexer import Lexer
+from mansa.lexer.scanner import scan, tokenize
+from mansa.lexer.stream import CharStream
+
+
+def corpus(size: int, seed: int = 0) -> str:
+    """Generate ``size`` characters of identifier/number/punctuation soup."""
+    rng = random.Random(seed)
+    words = ["value", "x", "_tmp", "counter_42", "Alpha", "b2"]
+    parts = []
+    total = 0
+    while total < size:
+        roll = rng.random()
+        if roll < 0.55:
+            part = rng.choice(words)
+        elif roll < 0.85:
+            part = str(rng.randrange(100_000))
+        else:
+            part = rng.choice("+-*/=(){};,")
+        part += "\n" if rng.random() < 0.1 else " "
+        parts.append(part)
+        total += len(part)
+    return "".join(parts)[:size]
+
+
+def rate(label: str, source: str, lex: Callable[[str], Sized], repeat: int) -> float:
+    """Print and return the best tokens/sec of ``repeat`` runs."""
+    elapsed = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        count = len(lex(source))
+        elapsed = min(elapsed, time.perf_counter() - start)
+    per_sec = count / elapsed
+    print(f"{label:>10}: {count:>9} tokens in {elapsed:7.3f}s = {per_sec:12,.0f} tok/s")
+    return per_sec
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--mb", type=float, default=10, help="Corpus size in MB.")
+    parser.add_argument("--reference-mb", type=float, default=None)
+    parser.add_argument("--repeat", type=int, default=1, help="Best of N runs.")
+    args = parser.parse_args()
+
+    source = corpus(int(args.mb * 1024 * 1024))
+    reference_mb = args.mb if args.reference_mb is None else args.reference_mb
+    prefix = source[: int(reference_mb * 1024 * 1024)]
+    rate("scan", source, scan, args.repeat)
+    fast = rate("tokenize", source, tokenize, args.repeat)
+    slow = rate("reference", prefix, lambda s: list(Lexer(CharStream(s))), args.repeat)
+    print(f"speedup: {fast / slow:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Trivia kept in a side table against trivia kept in the token stream, on
+whitespace-heavy sources.
+
+The side table (``scan_trivia``) leaves a parser only significant tokens;
+the alternative lexes whitespace runs as tokens of their own, which
+every pass over the stream has to step over.
+
+    python -m benchmarks.trivia [--mb N] [--repeat N]
+"""
+
+import argparse
+import random
+import re
+from array import array
+
+from benchmarks.symbols import best
+from mansa.lexer.scanner import scan
+from mansa.lexer.trivia import scan_trivia
+
+# Whitespace runs as tokens (group 1) next to the others.
+_LOSSLESS = re.compile(r"([ \t\r\n]+)|([A-Za-z_]\w*)|(\d+)|([^ \t\r\n\w]+)", re.ASCII)
+_WHITESPACE_CODE = 1
+
+
+def aligned(size: int, seed: int = 0) -> str:
+    """Short statements padded into columns, in blocks between blank lines."""
+    rng = random.Random(seed)
+    lines, total = [], 0
+    while total < size:
+        name = f"v{'_' * rng.randrange(12)}{rng.randrange(100)}"
+        line = f"set {name:<16}{rng.randrange(1000):>8}"
+        if rng.random() < 0.1:
+            line += "\n"  # a blank line
+        lines.append(line)
+        total += len(line) + 1
+    return "\n".join(lines)[:size]
+
+
+def indented(size: int, seed: int = 0) -> str:
+    """Deeply nested blocks: most of each line is leading whitespace."""
+    rng = random.Random(seed)
+    lines, total, depth = [], 0, 0
+    while total < size:
+        depth = max(0, min(12, depth + rng.choice([-1, 0, 1])))
+        line = "    " * depth + f"x{rng.randrange(10)} = {rng.randrange(100)}"
+        if rng.random() < 0.2:
+            line += "\n"  # a blank line
+        lines.append(line)
+        total += len(line) + 1
+    return "\n".join(lines)[:size]
+
+
+def lossless(source: str) -> array[int]:
+    """Lex ``source`` with trivia as tokens, returning the kind codes."""
+    kinds, starts, ends = array("B"), array("I"), array("I")
+    add_kind, add_start, add_end = kinds.append, starts.append, ends.append
+    for match in _LOSSLESS.finditer(source):
+        start, end = match.span()
+        add_kind(match.lastindex or 0)
+        add_start(start)
+        add_end(end)
+    return kinds
+
+
+def walk(kinds: array[int]) -> int:
+    """A parser's pass over a stream of significant tokens."""
+    count = 0
+    for _ in kinds:
+        count += 1
+    return count
+
+
+def walk_skipping(kinds: array[int]) -> int:
+    """The same pass over a stream that holds trivia too."""
+    count = 0
+    for code in kinds:
+        if code == _WHITESPACE_CODE:
+            continue
+        count += 1
+    return count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--mb", type=float, default=2, help="Corpus size in MB.")
+    parser.add_argument("--repeat", type=int, default=3, help="Best of N runs.")
+    args = parser.parse_args()
+    size = int(args.mb * 1024 * 1024)
+
+    for name, source in (("aligned", aligned(size)), ("indented", indented(size))):
+        buffer, trivia = scan_trivia(source)
+        kinds = lossless(source)
+        assert walk_skipping(kinds) == len(buffer) - 1  # all but EOF
+        print(
+            f"{name}: {len(buffer):,} tokens, {len(trivia):,} trivia entries"
+            f" ({trivia.rebuild(buffer, source) == source and 'rebuilt exactly'})"
+        )
+        scanned = best(args.repeat, lambda: scan(source))  # noqa: B023
+        side = best(args.repeat, lambda: scan_trivia(source))  # noqa: B023
+        inline = best(args.repeat, lambda: lossless(source))  # noqa: B023
+        print(
+            f"  lex: {scanned:.3f}s dropping trivia, {side:.3f}s side table,"
+            f" {inline:.3f}s trivia tokens"
+        )
+        significant = best(args.repeat, lambda: walk(buffer.kinds))  # noqa: B023
+        skipping = best(args.repeat, lambda: walk_skipping(kinds))  # noqa: B023
+        print(
+            f"  parser pass: {significant * 1e3:.1f} ms over tokens,"
+            f" {skipping * 1e3:.1f} ms stepping over trivia"
+            f" ({len(kinds):,} stream entries)"
+        )
+        side_bytes = sum(
+            len(a) * a.itemsize for a in (trivia.starts, trivia.ends, trivia.tokens)
+        )
+        print(
+            f"  trivia: {side_bytes / 2**20:.1f} MiB side table,"
+            f" {(len(kinds) - len(buffer)) * 9 / 2**20:.1f} MiB as stream tokens"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Byte-oriented ``scan_bytes`` against ``scan`` of a mapped or decoded source.
+
+Each corpus is written to a temporary file and mapped, as ``mansa lex``
+does: ``scan`` reads it through a ``MappedSource`` (decoding chunk by
+chunk), ``scan_bytes`` lexes the mapped bytes directly. ``decode+scan``
+decodes the whole file to a ``str`` first. Each figure is the best of
+``--repeat`` runs.
+
+    python -m benchmarks.utf8 [--mb N] [--repeat N]
+"""
+
+import argparse
+import mmap
+import os
+import tempfile
+import time
+from collections.abc import Callable
+
+from benchmarks.tokenize import corpus
+from mansa.lexer.mapped import MappedSource
+from mansa.lexer.scanner import scan
+from mansa.lexer.utf8 import scan_bytes
+
+
+def best(run: Callable[[], object], repeat: int) -> float:
+    """The shortest of ``repeat`` runs, in seconds."""
+    elapsed = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        elapsed = min(elapsed, time.perf_counter() - start)
+    return elapsed
+
+
+def compare(label: str, data: bytes, repeat: int) -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "corpus.mansa")
+        with open(path, "wb") as out:
+            out.write(data)
+        with (
+            open(path, "rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m,
+        ):
+            mapped = best(lambda: scan(MappedSource(m)), repeat)
+            decoded = best(lambda: scan(m[:].decode("utf-8")), repeat)
+            raw = best(lambda: scan_bytes(m), repeat)
+    print(
+        f"{label:>10}: mapped {mapped:6.3f}s  decode+scan {decoded:6.3f}s  "
+        f"bytes {raw:6.3f}s  ({mapped / raw:.2f}x vs mapped)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--mb", type=float, default=10, help="Corpus size in MB.")
+    parser.add_argument("--repeat", type=int, default=3, help="Best of N runs.")
+    args = parser.parse_args()
+
+    source = corpus(int(args.mb * 1024 * 1024))
+    compare("ascii", source.encode(), args.repeat)
+    # One non-ASCII character in roughly every 50.
+    mixed = source.replace("Alpha", "Älpha").replace(";", "€")
+    compare("mixed", mixed.encode(), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Generate ``src/mansa/lexer/unicode_tables.py`` from this Python's
+``unicodedata``.
+
+XID_Start and XID_Continue are taken from ``str.isidentifier``, which
+follows them exactly, and digits are the Nd category. Rerun after
+upgrading Python to pick up a newer Unicode version:
+
+    python scripts/gen_unicode_tables.py [--check]
+"""
+
+import argparse
+import sys
+import unicodedata
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+OUTPUT = Path(__file__).parent.parent / "src" / "mansa" / "lexer" / "unicode_tables.py"
+HEADER = (Path(__file__).read_text().split('"""', 1)[0]).rstrip() + "\n"
+
+# Must match the flag constants of mansa.lexer.chars.
+XID_START, XID_CONTINUE, DIGIT = 1, 2, 4
+
+CLASSES: dict[str, Callable[[str], bool]] = {
+    "XID_START": lambda ch: ch != "_" and ch.isidentifier(),
+    "XID_CONTINUE": lambda ch: ("a" + ch).isidentifier(),
+    "DIGIT": lambda ch: unicodedata.category(ch) == "Nd",
+}
+
+
+def boundaries(member: Callable[[str], bool]) -> Iterator[int]:
+    """Start and end of every run of non-ASCII members, ends exclusive."""
+    inside = False
+    for code in range(128, sys.maxunicode + 1):
+        if member(chr(code)) != inside:
+            inside = not inside
+            yield code
+    if inside:
+        yield sys.maxunicode + 1
+
+
+def ascii_flags() -> bytes:
+    flags = bytearray(128)
+    for code in range(128):
+        ch = chr(code)
+        for flag, name in (
+            (XID_START, "XID_START"),
+            (XID_CONTINUE, "XID_CONTINUE"),
+            (DIGIT, "DIGIT"),
+        ):
+            if CLASSES[name](ch):
+                flags[code] |= flag
+    return bytes(flags)
+
+
+def render() -> str:
+    lines = [
+        HEADER,
+        '"""',
+        "Unicode character classes for identifiers and digits.",
+        "",
+        "Generated by scripts/gen_unicode_tables.py; do not edit. Each range",
+        "table lists the boundaries of runs of non-ASCII members: a code point",
+        "is a member when ``bisect_right`` of it is odd. See ``chars``.",
+        '"""',
+        "",
+        f'UNICODE_VERSION = "{unicodedata.unidata_version}"',
+        "",
+        "# fmt: off",
+        "# Flags of each ASCII code point: 1 XID_Start, 2 XID_Continue, 4 digit.",
+        "ASCII_FLAGS = (",
+    ]
+    flags = ascii_flags()
+    for i in range(0, 128, 16):
+        lines.append('    b"' + "".join(f"\\x{b:02x}" for b in flags[i : i + 16]) + '"')
+    lines.append(")")
+    for name, member in CLASSES.items():
+        values = [f"0x{code:X}," for code in boundaries(member)]
+        lines.append("")
+        lines.append(f"{name} = (")
+        for i in range(0, len(values), 10):
+            lines.append("    " + " ".join(values[i : i + 10]))
+        lines.append(")")
+    lines.append("# fmt: on")
+    return "\n".join(lines) + "\n"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--check", action="store_true", help="Fail if the tables are out of date."
+    )
+    args = parser.parse_args()
+
+    text = render()
+    if args.check:
+        if OUTPUT.read_text() != text:
+            print(f"{OUTPUT} is out of date; rerun {sys.argv[0]}", file=sys.stderr)
+            return 1
+        return 0
+    OUTPUT.write_text(text)
+    print(f"wrote {OUTPUT} (Unicode {unicodedata.unidata_version})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,11 +12,62 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import argparse
+from __future__ import annotations
+
+import sys
+
 from . import __version__
+from .commands import COMMANDS, load
+
+# Names only needed by annotations; ``typing`` itself is too slow to import.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import argparse
+    from collections.abc import Sequence
+
+VERSION = f"Mansa Genesis {__version__}"
+
+
+def add_help_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "-h",
+        "--help",
+        action="help",
+        help="Show this help message and exit.",
+    )
+
+
+def add_stats_arguments(parser: argparse.ArgumentParser) -> None:
+    group = parser.add_argument_group("instrumentation")
+    group.add_argument(
+        "--stats",
+        action="store_true",
+        help="Print phase timings and counters to stderr when done.",
+    )
+    group.add_argument(
+        "--stats-json",
+        default=None,
+        metavar="FILE",
+        help="Write phase timings and counters as JSON to FILE.",
+    )
+    group.add_argument(
+        "--trace",
+        default=None,
+        metavar="FILE",
+        help="Write a Chrome trace-event file of every phase to FILE.",
+    )
+    group.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="Also record peak traced memory (slows the command down; implies --stats).",
+    )
 
 
 def build_argparser() -> argparse.ArgumentParser:
+    # Imported here: argparse pulls in re and enum, which ``--version``
+    # should not pay for.
+    import argparse
+
     parser = argparse.ArgumentParser(
         prog="mansa",
         description="Mansa: Building the PERFECT systems language.",
@@ -28,33 +79,67 @@ def build_argparser() -> argparse.ArgumentParser:
         "-V",
         "--version",
         action="version",
-        version=f"Mansa Genesis {__version__}",
+        version=VERSION,
         help="Show the version number and exit.",
     )
 
-    parser.add_argument(
-        "-h",
-        "--help",
-        action="help",
-        default=argparse.SUPPRESS,
-        help="Show this help message and exit.",
+    add_help_argument(parser)
+
+    commands = parser.add_subparsers(
+        dest="command", title="commands", metavar="<command>"
     )
+    for name, (_, summary) in COMMANDS.items():
+        command = commands.add_parser(
+            name, help=summary, description=summary, add_help=False
+        )
+        add_help_argument(command)
+        load(name).configure(command)
+        add_stats_arguments(command)
 
     return parser
 
 
-def main() -> int:
-    parser = build_argparser()
-    args, argv = parser.parse_known_args()
+def main(argv: Sequence[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv in (["-V"], ["--version"]):
+        # The common wrapper-script call, answered before building a parser.
+        print(VERSION)
+        raise SystemExit(0)  # as argparse's version action does
 
-    if argv:
-        print(f"Command: '{argv[0]}' not yet implemented.")
+    command = next((arg for arg in argv if not arg.startswith("-")), None)
+    if command is not None and command not in COMMANDS:
+        print(f"Command: '{command}' not yet implemented.")
         print("Empire still rising. Patience, citizen.")
         return 1
-    if getattr(args, "command", None) is not None:
-        if args.command == "help" or args.command is None:
-            parser.print_help()
-            return 0
+
+    parser = build_argparser()
+    args = parser.parse_args(argv)
+    if args.command is not None:
+        return run_command(args)
 
     parser.print_help()
     return 1
+
+
+def run_command(args: argparse.Namespace) -> int:
+    """Run the chosen command, instrumented if any stats flag was given."""
+    command = load(args.command)
+    # --trace-memory on its own still needs somewhere to report to.
+    show_stats = args.stats or (
+        args.trace_memory and not (args.stats_json or args.trace)
+    )
+    if not (show_stats or args.stats_json or args.trace):
+        status: int = command.run(args)
+        return status
+
+    from .instrument import Recorder, write_json
+
+    with Recorder(args.trace_memory) as recorder, recorder.phase(args.command):
+        status = command.run(args)
+    if show_stats:
+        print(recorder.summary(), file=sys.stderr)
+    if args.stats_json:
+        write_json(args.stats_json, recorder.stats())
+    if args.trace:
+        write_json(args.trace, recorder.trace())
+    return status
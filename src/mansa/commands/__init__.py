@@ -0,0 +1,78 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Subcommands of the ``mansa`` CLI.
+
+Each command is a module with ``configure(parser)``, which adds its
+arguments, and ``run(args) -> int``. Modules are imported only when their
+command runs or help is shown, and should import the lexer and other
+heavy dependencies inside ``run``.
+"""
+
+import importlib
+from types import ModuleType
+
+# Command name -> (module, one-line help). Plain data, so that listing the
+# commands imports nothing.
+COMMANDS = {
+    "lex": ("mansa.commands.lex", "Lex source files and report token counts."),
+    "watch": (
+        "mansa.commands.watch",
+        "Keep source files lexed and re-lex them as they change.",
+    ),
+}
+
+
+def _require_at_least(value: float, least: int, text: str, noun: str) -> None:
+    import argparse  # only parsers call this, and ``--version`` avoids them
+
+    # Written so that nan and inf fail too: no count or wait can use them.
+    if not least <= value < float("inf"):
+        raise argparse.ArgumentTypeError(f"expected {noun} >= {least}, got {text!r}")
+
+
+def _int_from(text: str, least: int) -> int:
+    """``int(text)``, as an argument that must be at least ``least``."""
+    try:
+        value = int(text)
+    except ValueError:
+        value = least - 1
+    _require_at_least(value, least, text, "an integer")
+    return value
+
+
+def non_negative_int(text: str) -> int:
+    """Argument type accepting integers from 0 up."""
+    return _int_from(text, 0)
+
+
+def positive_int(text: str) -> int:
+    """Argument type accepting integers from 1 up."""
+    return _int_from(text, 1)
+
+
+def load(name: str) -> ModuleType:
+    """Import the module implementing command ``name``."""
+    return importlib.import_module(COMMANDS[name][0])
+
+
+def non_negative_float(text: str) -> float:
+    """Argument type accepting finite numbers from 0 up."""
+    try:
+        value = float(text)
+    except ValueError:
+        value = -1.0
+    _require_at_least(value, 0, text, "a number")
+    return value
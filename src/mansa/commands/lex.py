@@ -0,0 +1,110 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+``mansa lex``: lex source files and report token counts.
+"""
+
+import argparse
+import sys
+
+from . import non_negative_int, positive_int
+
+
+def configure(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        metavar="PATH",
+        help="Source files, or directories to search for *.mansa files.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=positive_int,
+        default=None,
+        metavar="N",
+        help="Number of worker processes (default: CPU count).",
+    )
+    parser.add_argument(
+        "--threads",
+        action="store_true",
+        help="Use worker threads instead of processes (for free-threaded Python).",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        metavar="DIR",
+        help="Token cache directory (default: $MANSA_CACHE_DIR or ~/.cache/mansa).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Lex every file without reading or writing the token cache.",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=positive_int,
+        default=None,
+        metavar="MB",
+        help="Evict least recently used entries beyond this size (default: 256).",
+    )
+    parser.add_argument(
+        "--max-errors",
+        type=non_negative_int,
+        default=None,
+        metavar="N",
+        help="Stop lexing a file after N illegal tokens (default: 100).",
+    )
+
+
+def run(args: argparse.Namespace) -> int:
+    from ..instrument import current
+    from ..lexer.batch import DEFAULT_MAX_ERRORS, discover, lex_files
+    from ..lexer.cache import DEFAULT_MAX_BYTES, TokenCache, default_cache_dir
+
+    recorder = current()
+    with recorder.phase("lex.discover"):
+        paths = discover(args.paths)
+    if not paths:
+        print("No source files found.", file=sys.stderr)
+        return 1
+
+    cache_dir = None if args.no_cache else args.cache_dir or default_cache_dir()
+    with recorder.phase("lex.files", jobs=args.jobs, threads=args.threads):
+        max_errors = DEFAULT_MAX_ERRORS if args.max_errors is None else args.max_errors
+        results = lex_files(paths, args.jobs, cache_dir, max_errors, args.threads)
+    # Only new entries can push the directory over its limit.
+    if cache_dir is not None and any(result.stored for result in results):
+        max_bytes = DEFAULT_MAX_BYTES
+        if args.cache_size is not None:
+            max_bytes = args.cache_size * 2**20
+        with recorder.phase("lex.evict"):
+            TokenCache(cache_dir, max_bytes).evict()
+    for result in results:
+        if result.error is not None:
+            print(f"mansa lex: {result.error}", file=sys.stderr)
+
+    size = sum(result.size for result in results)
+    tokens = sum(result.tokens for result in results)
+    illegal = sum(result.illegal for result in results)
+    failed = sum(result.error is not None for result in results)
+    print(
+        f"files: {len(results):,}  bytes: {size:,}  "
+        f"tokens: {tokens:,}  illegal: {illegal:,}"
+    )
+    if cache_dir is not None:
+        hits = sum(result.cached for result in results)
+        print(f"cache: hits: {hits:,}  misses: {len(results) - hits - failed:,}")
+    return 1 if illegal or failed else 0
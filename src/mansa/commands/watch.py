@@ -0,0 +1,117 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+``mansa watch``: keep source files lexed and re-lex them as they change.
+"""
+
+import argparse
+import sys
+import time
+
+from . import non_negative_float, non_negative_int
+
+# Names only needed by annotations; the lexer is imported when the command runs.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from ..lexer.watch import Workspace
+
+
+def configure(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        metavar="PATH",
+        help="Source files, or directories to search for *.mansa files.",
+    )
+    parser.add_argument(
+        "--interval",
+        type=non_negative_float,
+        default=None,
+        metavar="SECONDS",
+        help="Longest wait between checks for changes (default: 0.5).",
+    )
+    parser.add_argument(
+        "--poll",
+        action="store_true",
+        help="Check for changes on a timer instead of filesystem notifications.",
+    )
+    parser.add_argument(
+        "--memory",
+        type=non_negative_int,
+        default=None,
+        metavar="MB",
+        help="Keep at most this much source and tokens in memory (default: 64).",
+    )
+    parser.add_argument(
+        "--max-errors",
+        type=non_negative_int,
+        default=None,
+        metavar="N",
+        help="Stop lexing a file after N illegal tokens (default: 100).",
+    )
+
+
+def run(args: argparse.Namespace) -> int:
+    from ..lexer.batch import DEFAULT_MAX_ERRORS
+    from ..lexer.watch import (
+        DEFAULT_HELD_BYTES,
+        DEFAULT_INTERVAL,
+        PollWaiter,
+        Workspace,
+        make_waiter,
+    )
+
+    workspace = Workspace(
+        args.paths,
+        DEFAULT_HELD_BYTES if args.memory is None else args.memory * 2**20,
+        DEFAULT_MAX_ERRORS if args.max_errors is None else args.max_errors,
+    )
+    interval = DEFAULT_INTERVAL if args.interval is None else args.interval
+    waiter = PollWaiter(interval) if args.poll else make_waiter(interval)
+    try:
+        changes = workspace.poll()
+        if not len(workspace):
+            print("No source files found.", file=sys.stderr)
+            return 1
+        while True:
+            if changes.changed or changes.removed:
+                _report(workspace, changes.changed, changes.removed, changes.seconds)
+            waiter.watch(workspace.directories())
+            waiter.wait()
+            changes = workspace.poll()
+    except KeyboardInterrupt:
+        return 0
+    finally:
+        waiter.close()
+
+
+def _report(
+    workspace: "Workspace", changed: list[str], removed: list[str], seconds: float
+) -> None:
+    """Print diagnostics of the changed files and a summary line."""
+    for path in changed:
+        for line in workspace.diagnostics(path):
+            print(f"mansa watch: {line}", file=sys.stderr)
+    results = workspace.results()
+    tokens = sum(result.tokens for result in results)
+    illegal = sum(result.illegal for result in results)
+    failed = sum(result.error is not None for result in results)
+    print(
+        f"[{time.strftime('%H:%M:%S')}] changed: {len(changed):,}  "
+        f"removed: {len(removed):,}  in {seconds * 1000:.1f} ms  "
+        f"files: {len(results):,}  tokens: {tokens:,}  "
+        f"illegal: {illegal:,}  errors: {failed:,}",
+        flush=True,
+    )
@@ -0,0 +1,211 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Phase timing, counters and memory instrumentation.
+
+Stages report into the current ``Recorder``: ``phase`` times a block of
+work and ``count`` adds to a named counter. Until a ``Recorder`` is entered,
+the current one is a ``NullRecorder`` that does nothing, so instrumented
+code costs one method call per phase when stats are off.
+"""
+
+import json
+import os
+import threading
+import time
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from types import TracebackType
+from typing import ClassVar, Self
+
+# A phase's totals: [calls, wall ns, CPU ns].
+type PhaseTotals = list[int]
+
+
+class Recorder:
+    """Collects phase timings, counters and trace events while entered.
+
+    ``with Recorder() as recorder:`` makes it the current recorder of this
+    thread. With ``trace_memory``, ``tracemalloc`` runs meanwhile (slowing
+    the program down) and the peak is kept. Recorders pickle, so worker
+    processes, like worker threads, record separately and ``merge`` into
+    the parent's.
+    """
+
+    __slots__ = (
+        "_owns_tracing",
+        "_previous",
+        "counters",
+        "events",
+        "peak_traced",
+        "phases",
+        "trace_memory",
+    )
+
+    enabled: ClassVar[bool] = True
+
+    def __init__(self, trace_memory: bool = False) -> None:
+        self.trace_memory = trace_memory
+        self.phases: dict[str, PhaseTotals] = {}
+        self.counters: dict[str, int] = {}
+        self.events: list[dict[str, object]] = []
+        self.peak_traced: int | None = None
+        self._previous: Recorder | None = None
+        self._owns_tracing = False
+
+    def __enter__(self) -> Self:
+        self._previous, _state.recorder = _state.recorder, self
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracing = True
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if self.trace_memory:
+            peak = tracemalloc.get_traced_memory()[1]
+            self.peak_traced = max(self.peak_traced or 0, peak)
+            if self._owns_tracing:
+                tracemalloc.stop()
+                self._owns_tracing = False
+        _state.recorder, self._previous = self._previous or NULL_RECORDER, None
+
+    @contextmanager
+    def _timed(self, name: str, args: dict[str, object]) -> Iterator[None]:
+        # Taken on entry so phases are listed in the order they start.
+        totals = self.phases.setdefault(name, [0, 0, 0])
+        wall, cpu = time.perf_counter_ns(), time.process_time_ns()
+        try:
+            yield
+        finally:
+            wall_ns = time.perf_counter_ns() - wall
+            totals[0] += 1
+            totals[1] += wall_ns
+            totals[2] += time.process_time_ns() - cpu
+            self.events.append(
+                {
+                    "name": name,
+                    "ph": "X",
+                    "ts": wall / 1000,
+                    "dur": wall_ns / 1000,
+                    "pid": os.getpid(),
+                    "tid": threading.get_native_id(),
+                    "args": args,
+                }
+            )
+
+    def phase(self, name: str, **args: object) -> AbstractContextManager[None]:
+        """Time the enclosed block as one call of phase ``name``.
+
+        ``args`` are attached to its trace event.
+        """
+        return self._timed(name, args)
+
+    def count(self, name: str, n: int = 1) -> None:
+        """Add ``n`` to counter ``name``."""
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def merge(self, other: "Recorder") -> None:
+        """Add everything ``other`` recorded into this recorder."""
+        for name, (calls, wall_ns, cpu_ns) in other.phases.items():
+            totals = self.phases.setdefault(name, [0, 0, 0])
+            totals[0] += calls
+            totals[1] += wall_ns
+            totals[2] += cpu_ns
+        for name, n in other.counters.items():
+            self.count(name, n)
+        self.events.extend(other.events)
+        if other.peak_traced is not None:
+            self.peak_traced = max(self.peak_traced or 0, other.peak_traced)
+
+    def stats(self) -> dict[str, object]:
+        """The totals as plain data, for JSON."""
+        return {
+            "phases": {
+                name: {"calls": calls, "wall_s": wall / 1e9, "cpu_s": cpu / 1e9}
+                for name, (calls, wall, cpu) in self.phases.items()
+            },
+            "counters": dict(sorted(self.counters.items())),
+            "peak_traced_bytes": self.peak_traced,
+        }
+
+    def trace(self) -> dict[str, object]:
+        """The recorded events in Chrome trace-event format."""
+        return {
+            "traceEvents": self.events,
+            "displayTimeUnit": "ms",
+            "otherData": {"counters": dict(sorted(self.counters.items()))},
+        }
+
+    def summary(self) -> str:
+        """A human-readable table of phases, counters and memory."""
+        lines = [f"{'phase':<24} {'calls':>8} {'wall ms':>10} {'cpu ms':>10}"]
+        for name, (calls, wall, cpu) in self.phases.items():
+            lines.append(
+                f"{name:<24} {calls:>8,} {wall / 1e6:>10.1f} {cpu / 1e6:>10.1f}"
+            )
+        lines.append("")
+        lines.extend(
+            f"{name:<24} {n:>19,}" for name, n in sorted(self.counters.items())
+        )
+        if self.peak_traced is not None:
+            lines.append(
+                f"{'peak traced memory':<24} {self.peak_traced / 2**20:>15.1f} MiB"
+            )
+        return "\n".join(lines)
+
+
+class NullRecorder(Recorder):
+    """The recorder while none is entered: it records nothing."""
+
+    __slots__ = ()
+
+    enabled: ClassVar[bool] = False
+
+    def phase(self, name: str, **args: object) -> AbstractContextManager[None]:
+        return _NULL_PHASE
+
+    def count(self, name: str, n: int = 1) -> None:
+        pass
+
+
+_NULL_PHASE = nullcontext()
+NULL_RECORDER = NullRecorder()
+
+
+class _State(threading.local):
+    """The current recorder, one per thread."""
+
+    recorder: Recorder = NULL_RECORDER
+
+
+_state = _State()
+
+
+def current() -> Recorder:
+    """The recorder stages on this thread should report into."""
+    return _state.recorder
+
+
+def write_json(path: str, data: dict[str, object]) -> None:
+    """Write ``data`` as JSON to ``path``."""
+    with open(path, "w") as f:
+        json.dump(data, f, indent=1)
+        f.write("\n")
@@ -0,0 +1,89 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import codecs
+import time
+from collections.abc import AsyncIterable, AsyncIterator
+
+from .mapped import DEFAULT_CHUNK_SIZE
+from .streaming import StreamTokenizer
+from .symbols import SymbolTable
+from .token import Token
+
+# Tokens, or seconds, between yields to the event loop; whichever is first.
+DEFAULT_YIELD_TOKENS = 1024
+DEFAULT_YIELD_SECONDS = 0.002
+
+# Characters handed to the tokenizer at once. Small enough that scanning
+# one slice stays well under the time slice.
+_SLICE = 4096
+
+
+async def aiter_chunks(
+    source: asyncio.StreamReader | AsyncIterable[str],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> AsyncIterator[str]:
+    """Yield the non-empty text chunks of ``source`` in order.
+
+    A ``StreamReader`` is read ``chunk_size`` bytes at a time and decoded as
+    UTF-8, with characters split between reads carried over. As in
+    ``scan_bytes``, a BOM is skipped and invalid bytes become U+FFFD.
+    """
+    if isinstance(source, asyncio.StreamReader):
+        decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+        while data := await source.read(chunk_size):
+            if text := decoder.decode(data):
+                yield text
+        if text := decoder.decode(b"", final=True):
+            yield text
+    else:
+        async for text in source:
+            if text:
+                yield text
+
+
+async def atokenize(
+    source: asyncio.StreamReader | AsyncIterable[str],
+    *,
+    yield_tokens: int = DEFAULT_YIELD_TOKENS,
+    yield_seconds: float = DEFAULT_YIELD_SECONDS,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    table: SymbolTable | None = None,
+) -> AsyncIterator[Token]:
+    """Lex an async source for ``async for``, ending with EOF.
+
+    Yields the same tokens as ``tokenize`` on the whole text. Lexing hands
+    control back to the event loop after every ``yield_tokens`` tokens or
+    ``yield_seconds`` of work, so other tasks, including other documents
+    being lexed, keep running; cancelling the consuming task stops it at
+    the next such point. With a ``table``, identifiers are interned into it.
+    """
+    tokenizer = StreamTokenizer(table)
+    clock = time.perf_counter
+    budget, deadline = yield_tokens, clock() + yield_seconds
+    async for text in aiter_chunks(source, chunk_size):
+        for i in range(0, len(text), _SLICE):
+            for token in tokenizer.feed(text[i : i + _SLICE]):
+                yield token
+                budget -= 1
+                if budget <= 0 or clock() >= deadline:
+                    await asyncio.sleep(0)
+                    budget, deadline = yield_tokens, clock() + yield_seconds
+            # Also between slices, which a long token may leave tokenless.
+            if clock() >= deadline:
+                await asyncio.sleep(0)
+                budget, deadline = yield_tokens, clock() + yield_seconds
+    for token in tokenizer.finish():
+        yield token
@@ -0,0 +1,208 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import mmap
+import os
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from typing import NamedTuple
+
+from ..instrument import Recorder, current
+from .cache import TokenCache
+from .mapped import map_file
+from .split import scan_split
+from .token import TokenKind
+from .utf8 import BINARY_PREFIX, Utf8Index, looks_binary, scan_bytes
+
+# File suffixes picked up when walking directories.
+SOURCE_SUFFIXES = frozenset({".mansa"})
+
+# ILLEGAL tokens per file after which ``mansa lex`` stops lexing it.
+DEFAULT_MAX_ERRORS = 100
+
+
+class FileResult(NamedTuple):
+    """Summary of lexing one file.
+
+    Only these few fields cross the process boundary, never the tokens.
+    """
+
+    path: str
+    size: int
+    tokens: int
+    illegal: int
+    cached: bool = False
+    error: str | None = None
+    # Whether this call wrote a new cache entry.
+    stored: bool = False
+
+
+def discover(paths: Iterable[str | os.PathLike[str]]) -> list[str]:
+    """Expand ``paths`` into source files, in a deterministic order.
+
+    Files are taken as given; directories are walked in sorted order for
+    files with a ``SOURCE_SUFFIXES`` suffix.
+    """
+    found = []
+    for entry in paths:
+        path = os.fspath(entry)
+        if not os.path.isdir(path):
+            found.append(path)
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            found.extend(
+                os.path.join(root, name)
+                for name in sorted(files)
+                if os.path.splitext(name)[1] in SOURCE_SUFFIXES
+            )
+    return found
+
+
+def lex_file(
+    path: str,
+    cache_dir: str | None = None,
+    max_errors: int | None = None,
+    jobs: int = 1,
+    threads: bool = False,
+) -> FileResult:
+    """Lex the file at ``path`` and summarize the result.
+
+    With ``cache_dir``, tokens are looked up in and stored to a
+    ``TokenCache`` there, and a hit skips lexing entirely. Phases and counts
+    are reported to the current ``Recorder``.
+
+    The mapped bytes are lexed with ``scan_bytes``, never decoded; invalid
+    UTF-8 shows up as ILLEGAL tokens rather than as an error. A file that
+    ``looks_binary`` is rejected without lexing, and ``max_errors`` caps the
+    ILLEGAL tokens of the rest as ``scan`` does.
+
+    With more than one job, a large file is lexed by ``scan_split`` on that
+    many worker processes, or threads with ``threads``.
+    """
+    recorder = current()
+    cache = TokenCache(cache_dir) if cache_dir is not None else None
+    try:
+        with recorder.phase("file", path=path):
+            with recorder.phase("file.map"):
+                data = map_file(path)
+            try:
+                size = len(data)
+                if looks_binary(data):
+                    recorder.count("files.binary")
+                    error = f"{path}: binary file (NUL in first {BINARY_PREFIX} bytes)"
+                    return FileResult(path, size, 0, 0, error=error)
+                buffer = None
+                if cache is not None:
+                    with recorder.phase("file.cache_get"):
+                        key = TokenCache.key(data)
+                        buffer = cache.get(key)
+                    # Entries are never capped, so they suit any max_errors.
+                    if buffer is not None and max_errors is not None:
+                        buffer.cap_errors(max_errors)
+                cached = buffer is not None
+                stored = False
+                utf8 = None
+                if buffer is None:
+                    with recorder.phase("file.scan"):
+                        if jobs > 1:
+                            buffer, utf8 = scan_split(
+                                path, jobs, max_errors, threads=threads
+                            )
+                        else:
+                            buffer, utf8 = scan_bytes(data, max_errors=max_errors)
+                    capped = (
+                        max_errors is not None
+                        and buffer.count(TokenKind.ILLEGAL) > max_errors
+                    )
+                    if cache is not None and not capped:
+                        with recorder.phase("file.cache_put"):
+                            try:
+                                cache.put(key, buffer)
+                                stored = True
+                            except OSError:
+                                # A full or read-only cache costs only the entry.
+                                recorder.count("cache.put_errors")
+                if recorder.enabled and utf8 is None:
+                    utf8 = Utf8Index.from_buffer(buffer, data)
+            finally:
+                if isinstance(data, mmap.mmap):
+                    data.close()
+    except OSError as error:
+        recorder.count("files.failed")
+        return FileResult(path, 0, 0, 0, error=str(error))
+    if recorder.enabled:
+        recorder.count("files")
+        recorder.count("files.cached", cached)
+        recorder.count("bytes", size)
+        recorder.count("chars", utf8.char_offset(size) if utf8 is not None else size)
+        for kind in TokenKind:
+            recorder.count(f"tokens.{kind}", buffer.count(kind))
+    # The final EOF token is not counted.
+    tokens = len(buffer) - 1
+    illegal = buffer.count(TokenKind.ILLEGAL)
+    return FileResult(path, size, tokens, illegal, cached, stored=stored)
+
+
+def _lex_recorded(
+    path: str, cache_dir: str | None, max_errors: int | None, trace_memory: bool
+) -> tuple[FileResult, Recorder]:
+    """``lex_file`` under a fresh ``Recorder``, returned for the parent to merge."""
+    with Recorder(trace_memory) as recorder:
+        result = lex_file(path, cache_dir, max_errors)
+    return result, recorder
+
+
+def lex_files(
+    paths: Sequence[str],
+    jobs: int | None = None,
+    cache_dir: str | None = None,
+    max_errors: int | None = None,
+    threads: bool = False,
+) -> list[FileResult]:
+    """Lex ``paths`` on ``jobs`` worker processes, in the order given.
+
+    ``jobs`` defaults to the CPU count; with one job the work stays in this
+    process, and a single file is split across the workers instead.
+    ``cache_dir`` and ``max_errors`` are passed on to ``lex_file``. What
+    workers record is merged into the current ``Recorder``.
+
+    With ``threads``, the workers are threads, which pickle nothing but
+    only run in parallel on a free-threaded build of Python.
+    """
+    lex = partial(lex_file, cache_dir=cache_dir, max_errors=max_errors)
+    jobs = jobs or os.cpu_count() or 1
+    if len(paths) == 1:
+        return [lex(paths[0], jobs=jobs, threads=threads)]
+    if jobs == 1 or not paths:
+        return list(map(lex, paths))
+    # Batch files per task so small files do not pay one round trip each.
+    chunksize = max(1, len(paths) // (jobs * 8))
+    recorder = current()
+    executor = ThreadPoolExecutor if threads else ProcessPoolExecutor
+    with executor(max_workers=jobs) as pool:
+        if not recorder.enabled:
+            return list(pool.map(lex, paths, chunksize=chunksize))
+        recorded = partial(
+            _lex_recorded,
+            cache_dir=cache_dir,
+            max_errors=max_errors,
+            trace_memory=recorder.trace_memory,
+        )
+        results = []
+        for result, worker in pool.map(recorded, paths, chunksize=chunksize):
+            recorder.merge(worker)
+            results.append(result)
+        return results
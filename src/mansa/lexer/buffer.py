@@ -0,0 +1,315 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import struct
+import sys
+from array import array
+from bisect import bisect_right
+from collections.abc import Buffer, Iterator
+from dataclasses import dataclass, field
+from itertools import repeat
+from typing import overload
+
+from .lines import LineIndex
+from .literals import NO_LITERAL, IntPool
+from .symbols import SymbolTable
+from .token import NO_SYMBOL, Span, Token, TokenKind
+
+# Compact integer code of each TokenKind, as stored in TokenBuffer.kinds.
+TOKEN_KINDS = tuple(TokenKind)
+KIND_CODES = {kind: code for code, kind in enumerate(TOKEN_KINDS)}
+
+# Tokens materialized at a time while iterating a TokenBuffer.
+_BLOCK = 4096
+
+# Errors
+ERR_INVALID_BUFFER_DATA = ValueError("Data is not a serialized TokenBuffer.")
+ERR_NEGATIVE_MAX_ERRORS = ValueError("The error cap must not be negative.")
+
+# Serialized layout: header (magic, token count, line count, source length),
+# then the raw kinds, starts, ends and line-start arrays in native byte order.
+_MAGIC = b"MTB" + (b"<" if sys.byteorder == "little" else b">")
+_HEADER = struct.Struct("<4sQQQ")
+
+
+@dataclass(frozen=True, slots=True)
+class TokenBuffer:
+    """Tokens stored as parallel arrays instead of one object per token.
+
+    ``kinds`` holds ``KIND_CODES`` values, ``starts``/``ends`` hold source
+    offsets and ``lines`` resolves line/column on demand. A token costs
+    9 bytes here, and the whole buffer pickles as a handful of byte strings.
+    ``Token`` objects are only built when indexed or iterated.
+
+    A buffer lexed with a ``table`` also keeps the symbol id of every token
+    in ``symbols`` (``NO_SYMBOL`` unless it is an IDENT), 4 more bytes each.
+    Likewise, a buffer lexed with a ``pool`` keeps the id of every INT
+    literal in ``literals`` (``NO_LITERAL`` for other kinds).
+    """
+
+    kinds: array[int] = field(default_factory=lambda: array("B"))
+    starts: array[int] = field(default_factory=lambda: array("I"))
+    ends: array[int] = field(default_factory=lambda: array("I"))
+    lines: LineIndex = field(default_factory=lambda: LineIndex.from_text(""))
+    symbols: array[int] = field(default_factory=lambda: array("i"))
+    table: SymbolTable | None = field(default=None, repr=False, compare=False)
+    literals: array[int] = field(default_factory=lambda: array("i"))
+    pool: IntPool | None = field(default=None, repr=False, compare=False)
+
+    def append(
+        self,
+        kind: TokenKind,
+        start: int,
+        end: int,
+        symbol: int = NO_SYMBOL,
+        literal: int = NO_LITERAL,
+    ) -> None:
+        """Append one token."""
+        self.kinds.append(KIND_CODES[kind])
+        self.starts.append(start)
+        self.ends.append(end)
+        if self.table is not None:
+            self.symbols.append(symbol)
+        if self.pool is not None:
+            self.literals.append(literal)
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def kind(self, index: int) -> TokenKind:
+        """The kind of the token at ``index``."""
+        return TOKEN_KINDS[self.kinds[index]]
+
+    def span(self, index: int) -> Span:
+        """The span of the token at ``index``."""
+        return self.lines.span(self.starts[index], self.ends[index])
+
+    def symbol(self, index: int) -> int:
+        """The symbol id of the token at ``index``, or ``NO_SYMBOL``."""
+        return self.symbols[index] if self.table is not None else NO_SYMBOL
+
+    def literal(self, index: int) -> int:
+        """The pool id of the INT token at ``index``, or ``NO_LITERAL``."""
+        return self.literals[index] if self.pool is not None else NO_LITERAL
+
+    def value(self, index: int) -> int | None:
+        """The value of the INT token at ``index``, decoded by the pool.
+
+        None for other kinds and for buffers lexed without a pool.
+        """
+        pool = self.pool
+        if pool is None:
+            return None
+        literal = self.literals[index]
+        return None if literal == NO_LITERAL else pool.value(literal)
+
+    def count(self, kind: TokenKind) -> int:
+        """Number of tokens of ``kind``."""
+        return self.kinds.count(KIND_CODES[kind])
+
+    def cap_errors(self, max_errors: int) -> int:
+        """Keep at most ``max_errors`` ILLEGAL tokens before a final one.
+
+        The ILLEGAL token after the first ``max_errors`` is extended to the
+        end of the source and every token after it but EOF is dropped, in
+        place. Returns the index of that token, or -1 if the buffer was
+        within the cap.
+        """
+        if max_errors < 0:
+            raise ERR_NEGATIVE_MAX_ERRORS
+        code = KIND_CODES[TokenKind.ILLEGAL]
+        kinds = self.kinds
+        index = -1
+        for _ in range(max_errors + 1):
+            try:
+                index = kinds.index(code, index + 1)
+            except ValueError:
+                return -1
+        last = len(kinds) - 1  # EOF
+        self.ends[index] = self.lines.length
+        del kinds[index + 1 : last], self.starts[index + 1 : last]
+        del self.ends[index + 1 : last]
+        if self.table is not None:
+            del self.symbols[index + 1 : last]
+        if self.pool is not None:
+            del self.literals[index + 1 : last]
+        return index
+
+    @overload
+    def __getitem__(self, index: int) -> Token: ...
+    @overload
+    def __getitem__(self, index: slice) -> "TokenBuffer": ...
+    def __getitem__(self, index: int | slice) -> "Token | TokenBuffer":
+        if isinstance(index, slice):
+            return TokenBuffer(
+                self.kinds[index],
+                self.starts[index],
+                self.ends[index],
+                self.lines,
+                self.symbols[index],
+                self.table,
+                self.literals[index],
+                self.pool,
+            )
+        return Token(self.kind(index), self.span(index), self.symbol(index))
+
+    def records(self) -> Iterator[tuple[TokenKind, int, int]]:
+        """Yield lightweight ``(kind, start, end)`` tuples without spans."""
+        return zip(map(TOKEN_KINDS.__getitem__, self.kinds), self.starts, self.ends)
+
+    def _materialize(self, first: int, stop: int, first_line: int = 1) -> list[Token]:
+        """Build the tokens in ``[first, stop)``, resolving lines in one sweep.
+
+        ``first_line`` is the line number of ``lines.starts[0]``, for buffers
+        indexing only a window of a larger source.
+        """
+        tokens: list[Token] = []
+        if first >= stop:
+            return tokens
+        line_starts = self.lines.starts
+        line_count = len(line_starts)
+        line = bisect_right(line_starts, self.starts[first])
+        line_start = line_starts[line - 1]
+        next_line_start = line_starts[line] if line < line_count else sys.maxsize
+        number = line + first_line - 1
+        if self.table is not None:
+            symbols: Iterator[int] = iter(self.symbols[first:stop])
+        else:
+            symbols = repeat(NO_SYMBOL)
+
+        append = tokens.append
+        kinds = TOKEN_KINDS
+        # Build each Span and Token without their Python-level constructors
+        # (the NamedTuple __new__ and the frozen dataclass __init__): this
+        # loop runs once per token and those calls would dominate it.
+        new_tuple, new_object = tuple.__new__, object.__new__
+        set_kind, set_span = vars(Token)["kind"].__set__, vars(Token)["span"].__set__
+        set_symbol = vars(Token)["symbol"].__set__
+        for code, start, end, symbol in zip(
+            self.kinds[first:stop],
+            self.starts[first:stop],
+            self.ends[first:stop],
+            symbols,
+        ):
+            if start >= next_line_start:
+                while line < line_count and line_starts[line] <= start:
+                    line += 1
+                line_start = line_starts[line - 1]
+                next_line_start = (
+                    line_starts[line] if line < line_count else sys.maxsize
+                )
+                number = line + first_line - 1
+            token = new_object(Token)
+            set_kind(token, kinds[code])
+            set_span(
+                token, new_tuple(Span, (start, end, number, start - line_start + 1))
+            )
+            set_symbol(token, symbol)
+            append(token)
+        return tokens
+
+    def __iter__(self) -> Iterator[Token]:
+        """Yield each token as a ``Token``, a block at a time."""
+        for first in range(0, len(self), _BLOCK):
+            yield from self._materialize(first, first + _BLOCK)
+
+    def tokens(self) -> list[Token]:
+        """Materialize every token."""
+        return self._materialize(0, len(self))
+
+    def intern(self, source: str, table: SymbolTable) -> "TokenBuffer":
+        """Return this buffer with its IDENT tokens of ``source`` interned."""
+        intern, ident = table.intern, KIND_CODES[TokenKind.IDENT]
+        symbols = array(
+            "i",
+            [
+                intern(source[start:end]) if code == ident else NO_SYMBOL
+                for code, start, end in zip(self.kinds, self.starts, self.ends)
+            ],
+        )
+        return TokenBuffer(
+            self.kinds,
+            self.starts,
+            self.ends,
+            self.lines,
+            symbols,
+            table,
+            self.literals,
+            self.pool,
+        )
+
+    def intern_literals(self, source: str, pool: IntPool) -> "TokenBuffer":
+        """Return this buffer with its INT tokens of ``source`` pooled."""
+        intern, integer = pool.intern, KIND_CODES[TokenKind.INT]
+        literals = array(
+            "i",
+            [
+                intern(source[start:end]) if code == integer else NO_LITERAL
+                for code, start, end in zip(self.kinds, self.starts, self.ends)
+            ],
+        )
+        return TokenBuffer(
+            self.kinds,
+            self.starts,
+            self.ends,
+            self.lines,
+            self.symbols,
+            self.table,
+            literals,
+            pool,
+        )
+
+    def to_bytes(self) -> bytes:
+        """Serialize the buffer into a compact binary form.
+
+        Symbol and literal ids are left out, as they only mean something in
+        their table or pool; ``intern`` and ``intern_literals`` a loaded
+        buffer again to restore them.
+        """
+        header = _HEADER.pack(_MAGIC, len(self), len(self.lines), self.lines.length)
+        return b"".join(
+            (
+                header,
+                self.kinds.tobytes(),
+                self.starts.tobytes(),
+                self.ends.tobytes(),
+                self.lines.starts.tobytes(),
+            )
+        )
+
+    @classmethod
+    def from_bytes(cls, data: Buffer) -> "TokenBuffer":
+        """Load a buffer written by ``to_bytes``, copying each array once.
+
+        ``data`` may be a mapped file: no view of it outlives the call.
+        """
+        with memoryview(data) as view:
+            try:
+                magic, count, line_count, length = _HEADER.unpack_from(view)
+            except struct.error:
+                raise ERR_INVALID_BUFFER_DATA from None
+            layout = (("B", count), ("I", count), ("I", count), ("Q", line_count))
+            sizes = [n * array(typecode).itemsize for typecode, n in layout]
+            if magic != _MAGIC or _HEADER.size + sum(sizes) != len(view):
+                raise ERR_INVALID_BUFFER_DATA
+
+            arrays = []
+            pos = _HEADER.size
+            for (typecode, _), size in zip(layout, sizes):
+                values = array(typecode)
+                values.frombytes(view[pos : pos + size])
+                arrays.append(values)
+                pos += size
+        kinds, starts, ends, line_starts = arrays
+        return cls(kinds, starts, ends, LineIndex(line_starts, length))
@@ -0,0 +1,134 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import hashlib
+import mmap
+import os
+import tempfile
+from collections.abc import Buffer
+
+from .buffer import TokenBuffer
+from .mapped import map_file
+from .scanner import LEXER_VERSION
+from .token import TokenKind
+
+# Default size limit of a cache directory.
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Mixed into every key: a change to the lexer, to TokenKind or to the offset
+# unit of cached buffers (UTF-8 bytes, from scan_bytes) yields new keys.
+_KEY_SALT = f"mansa-tokens:{LEXER_VERSION}:utf8:{','.join(TokenKind)}".encode()
+
+_SUFFIX = ".tokens"
+
+
+def default_cache_dir() -> str:
+    """``$MANSA_CACHE_DIR``, else ``mansa`` under the user cache directory."""
+    explicit = os.environ.get("MANSA_CACHE_DIR")
+    if explicit:
+        return explicit
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "mansa")
+
+
+class TokenCache:
+    """Content-addressed on-disk store of lexed ``TokenBuffer``s.
+
+    Entries are keyed by a hash of the source bytes and the lexer version, so
+    unchanged files are never lexed twice and lexer changes never serve stale
+    tokens. Reads refresh an entry's mtime; ``evict`` drops the least recently
+    used entries until the directory fits in ``max_bytes``. Writes are atomic,
+    so several processes may share one directory.
+    """
+
+    __slots__ = ("directory", "hits", "max_bytes", "misses")
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(source: Buffer) -> str:
+        """The cache key of a source's raw bytes."""
+        digest = hashlib.blake2b(_KEY_SALT, digest_size=20)
+        digest.update(source)
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key[2:] + _SUFFIX)
+
+    def get(self, key: str) -> TokenBuffer | None:
+        """Load the entry for ``key``, or ``None`` on a miss."""
+        path = self._path(key)
+        try:
+            # Mapped rather than read, so each array is copied only once.
+            data = map_file(path)
+            try:
+                buffer = TokenBuffer.from_bytes(data)
+            finally:
+                if isinstance(data, mmap.mmap):
+                    data.close()
+            os.utime(path)
+        except (OSError, ValueError):
+            # Missing, unreadable or corrupt: a miss, which put() will replace.
+            self.misses += 1
+            return None
+        self.hits += 1
+        return buffer
+
+    def put(self, key: str, buffer: TokenBuffer) -> None:
+        """Store ``buffer`` under ``key``."""
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(buffer.to_bytes())
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def evict(self) -> int:
+        """Remove least recently used entries beyond ``max_bytes``.
+
+        Returns the number of entries removed.
+        """
+        entries = []
+        total = 0
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if not name.endswith(_SUFFIX):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime_ns, stat.st_size, path))
+                total += stat.st_size
+
+        removed = 0
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            removed += 1
+        return removed
@@ -0,0 +1,109 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unicode classes of identifier and digit characters.
+
+For scanners that classify one character at a time: ASCII is looked up in
+a 128-entry table, anything else is found with ``bisect`` in the range
+tables of ``unicode_tables`` (generated by scripts/gen_unicode_tables.py).
+Runs of a class are better matched all at once, by a pattern built from
+the same tables with ``class_run``.
+"""
+
+import re
+from bisect import bisect_right
+from functools import cache
+
+from .unicode_tables import ASCII_FLAGS, DIGIT, XID_CONTINUE, XID_START
+
+# Bits of ASCII_FLAGS.
+XID_START_FLAG = 1
+XID_CONTINUE_FLAG = 2
+DIGIT_FLAG = 4
+
+# First code point past the Basic Multilingual Plane.
+_ASTRAL = 0x10000
+
+# Range table and ASCII flag of each class, by name.
+_CLASSES = {
+    "XID_START": (XID_START, XID_START_FLAG),
+    "XID_CONTINUE": (XID_CONTINUE, XID_CONTINUE_FLAG),
+    "DIGIT": (DIGIT, DIGIT_FLAG),
+}
+
+
+def is_xid_start(ch: str) -> bool:
+    """Whether ``ch`` can start an identifier (XID_Start, without ``_``)."""
+    code = ord(ch)
+    if code < 128:
+        return ASCII_FLAGS[code] & XID_START_FLAG != 0
+    return bisect_right(XID_START, code) & 1 == 1
+
+
+def is_xid_continue(ch: str) -> bool:
+    """Whether ``ch`` can continue an identifier (XID_Continue)."""
+    code = ord(ch)
+    if code < 128:
+        return ASCII_FLAGS[code] & XID_CONTINUE_FLAG != 0
+    return bisect_right(XID_CONTINUE, code) & 1 == 1
+
+
+def is_digit(ch: str) -> bool:
+    """Whether ``ch`` is a decimal digit of any script (category Nd)."""
+    code = ord(ch)
+    if code < 128:
+        return ASCII_FLAGS[code] & DIGIT_FLAG != 0
+    return bisect_right(DIGIT, code) & 1 == 1
+
+
+def _class_parts(name: str) -> tuple[str, str]:
+    """Insides of regex classes of the BMP and astral members of ``name``."""
+    table, flag = _CLASSES[name]
+    bmp = [re.escape(chr(c)) for c in range(128) if ASCII_FLAGS[c] & flag]
+    astral = []
+    for lo, hi in zip(table[::2], table[1::2]):
+        if lo < _ASTRAL:
+            bmp.append(f"{chr(lo)}-{chr(min(hi, _ASTRAL) - 1)}")
+        if hi > _ASTRAL:
+            astral.append(f"{chr(max(lo, _ASTRAL))}-{chr(hi - 1)}")
+    return "".join(bmp), "".join(astral)
+
+
+@cache
+def class_run(
+    name: str | tuple[str, ...], negate: bool = False, extra: str = ""
+) -> re.Pattern[str]:
+    """Pattern matching a (possibly empty) run of class ``name`` or ``extra``.
+
+    ``name`` is ``"XID_START"``, ``"XID_CONTINUE"`` or ``"DIGIT"``, or a
+    tuple of them for their union. With ``negate``, the run is of characters
+    in neither instead.
+
+    ``re`` matches a class against a bitmap only up to U+FFFF and checks
+    wider ranges one by one, which for these tables would cost hundreds of
+    comparisons per non-member. Members past the BMP are therefore matched
+    separately, and only tried for characters past it.
+    """
+    parts = [_class_parts(one) for one in ((name,) if isinstance(name, str) else name)]
+    bmp, astral = ("".join(part) for part in zip(*parts))
+    extra = "".join(map(re.escape, extra))
+    beyond = f"[{chr(_ASTRAL)}-{chr(0x10FFFF)}]"
+    if negate:
+        run = f"[^{extra}{bmp}{chr(_ASTRAL)}-{chr(0x10FFFF)}]+|(?={beyond})"
+        run += f"[^{astral}]" if astral else "."
+    else:
+        run = f"[{extra}{bmp}]+"
+        run += f"|(?={beyond})[{astral}]" if astral else ""
+    return re.compile(f"(?:{run})*+")
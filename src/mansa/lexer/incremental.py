@@ -0,0 +1,113 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from bisect import bisect_left
+from typing import NamedTuple
+
+from .buffer import TokenBuffer
+from .lines import shift_offsets
+from .literals import NO_LITERAL
+from .scanner import _GROUP_CODES, _TOKEN_PATTERN
+from .token import NO_SYMBOL
+
+# Errors
+ERR_INVALID_EDIT_RANGE = ValueError("Edit range is outside the source.")
+ERR_EDIT_SOURCE_MISMATCH = ValueError("Source length does not match the edit.")
+
+
+class Edit(NamedTuple):
+    """Replacement of the source range ``[start, end)`` with ``text``."""
+
+    start: int
+    end: int
+    text: str
+
+    @property
+    def delta(self) -> int:
+        """Change in source length caused by the edit."""
+        return len(self.text) - (self.end - self.start)
+
+    def apply(self, source: str) -> str:
+        """Return ``source`` with the edit applied."""
+        if not 0 <= self.start <= self.end <= len(source):
+            raise ERR_INVALID_EDIT_RANGE
+        return source[: self.start] + self.text + source[self.end :]
+
+
+def relex(buffer: TokenBuffer, source: str, edit: Edit) -> TokenBuffer:
+    """Update ``buffer`` for ``edit``, re-scanning only the affected window.
+
+    ``buffer`` is the result of lexing the old source and ``source`` is the
+    new one, i.e. ``edit.apply(old_source)``. Scanning restarts after the last
+    token that ends before the edit and stops as soon as a new token starts
+    where a shifted old token did: from there on the text, and so the tokens,
+    are the same. Tokens outside the window are reused with shifted offsets.
+    The result equals ``scan(source)``, interned into the same table and
+    pool if ``buffer`` was.
+    """
+    old_length = buffer.lines.length
+    if not 0 <= edit.start <= edit.end <= old_length:
+        raise ERR_INVALID_EDIT_RANGE
+    delta = edit.delta
+    if len(source) != old_length + delta:
+        raise ERR_EDIT_SOURCE_MISMATCH
+
+    kinds, starts, ends = buffer.kinds, buffer.starts, buffer.ends
+    # The last token is EOF; only real tokens can be reused after the edit.
+    last = len(kinds) - 1
+    first = bisect_left(ends, edit.start, hi=last)
+    restart = ends[first - 1] if first else 0
+
+    new_kinds, new_starts, new_ends = kinds[:first], starts[:first], ends[:first]
+    table, symbols = buffer.table, buffer.symbols
+    new_symbols = symbols[:first]
+    pool, literals = buffer.pool, buffer.literals
+    new_literals = literals[:first]
+    edit_end = edit.start + len(edit.text)
+    # Without a resync point the scan runs to the end and only the old EOF,
+    # shifted, is reused.
+    resume = last
+    codes = _GROUP_CODES
+    for match in _TOKEN_PATTERN.finditer(source, restart):
+        start, end = match.span()
+        if start >= edit_end:
+            old = bisect_left(starts, start - delta, first, last)
+            if old < last and starts[old] == start - delta:
+                resume = old
+                break
+        new_kinds.append(codes[match.lastindex or 0])
+        new_starts.append(start)
+        new_ends.append(end)
+        if table is not None:
+            name = match[1]
+            new_symbols.append(NO_SYMBOL if name is None else table.intern(name))
+        if pool is not None:
+            digits = match[2]
+            new_literals.append(NO_LITERAL if digits is None else pool.intern(digits))
+
+    new_kinds.extend(kinds[resume:])
+    new_starts.extend(shift_offsets(starts[resume:], delta))
+    new_ends.extend(shift_offsets(ends[resume:], delta))
+    new_symbols.extend(symbols[resume:])
+    new_literals.extend(literals[resume:])
+    return TokenBuffer(
+        new_kinds,
+        new_starts,
+        new_ends,
+        buffer.lines.splice(edit.start, edit.end, edit.text),
+        new_symbols,
+        table,
+        new_literals,
+        pool,
+    )
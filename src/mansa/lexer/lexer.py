@@ -0,0 +1,111 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass
+from functools import cache
+from string import ascii_letters, digits
+
+from .chars import class_run, is_digit, is_xid_start
+from .stream import CharStream
+from .streaming import ChunkedCharStream
+from .token import Token, TokenKind
+
+# Character classes
+WHITESPACE = frozenset(" \t\r\n")
+DIGITS = frozenset(digits)
+IDENT_START = frozenset(ascii_letters + "_")
+IDENT_CONTINUE = IDENT_START | DIGITS
+# Characters that end a run of ILLEGAL ones: anything another token is made of.
+ILLEGAL_END = WHITESPACE | IDENT_CONTINUE
+
+
+@dataclass(slots=True)
+class Lexer:
+    """Reference lexer reading one character at a time from a CharStream.
+
+    This is the executable definition of the token grammar; faster engines
+    must produce exactly the same tokens.
+
+    With ``unicode_identifiers``, identifiers are Unicode ones (an XID_Start
+    character or ``_``, then XID_Continue characters) and integers are runs
+    of decimal digits of any script; an ILLEGAL run still ends only where
+    another token can start. On ASCII input the tokens are the same either
+    way. No other engine implements this grammar yet.
+    """
+
+    stream: CharStream | ChunkedCharStream
+    unicode_identifiers: bool = False
+
+    def next_token(self) -> Token:
+        """Scan and return the next token, or EOF at the end of input."""
+        if self.unicode_identifiers:
+            return self._next_unicode_token()
+        stream = self.stream
+        stream.skip_while(WHITESPACE)
+        if stream.is_eof():
+            return Token.eof(stream.peek()[2].span())
+
+        start, ch, _ = stream.advance()
+        if ch in IDENT_START:
+            kind = TokenKind.IDENT
+            stream.skip_while(IDENT_CONTINUE)
+        elif ch in DIGITS:
+            kind = TokenKind.INT
+            stream.skip_while(DIGITS)
+        else:
+            # A run of bad characters is one token, not one token apiece.
+            kind = TokenKind.ILLEGAL
+            stream.skip_until(ILLEGAL_END)
+        return Token(kind, stream.span(start, stream.current_index))
+
+    def _next_unicode_token(self) -> Token:
+        """``next_token`` with Unicode identifiers and digits."""
+        stream = self.stream
+        stream.skip_while(WHITESPACE)
+        if stream.is_eof():
+            return Token.eof(stream.peek()[2].span())
+
+        start, ch, _ = stream.advance()
+        ident_run, digit_run, illegal_run = _unicode_runs()
+        if ch == "_" or is_xid_start(ch):
+            kind = TokenKind.IDENT
+            stream.skip_pattern(ident_run)
+        elif is_digit(ch):
+            kind = TokenKind.INT
+            stream.skip_pattern(digit_run)
+        else:
+            kind = TokenKind.ILLEGAL
+            stream.skip_pattern(illegal_run)
+        return Token(kind, stream.span(start, stream.current_index))
+
+    def __iter__(self) -> Iterator[Token]:
+        """Yield every remaining token, ending with EOF."""
+        while True:
+            token = self.next_token()
+            yield token
+            if token.kind is TokenKind.EOF:
+                return
+
+
+@cache
+def _unicode_runs() -> tuple[re.Pattern[str], re.Pattern[str], re.Pattern[str]]:
+    """Runs continuing an IDENT, an INT and an ILLEGAL token, Unicode grammar."""
+    return (
+        class_run("XID_CONTINUE"),
+        class_run("DIGIT"),
+        # Up to a character that starts another token, as in the ASCII grammar.
+        class_run(("XID_START", "DIGIT"), negate=True, extra=" \t\r\n_"),
+    )
@@ -0,0 +1,124 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from .token import Span
+
+# Errors
+ERR_OFFSET_OUT_OF_RANGE = IndexError("Offset is outside the source.")
+
+
+def shift_offsets(values: array[int], delta: int) -> array[int]:
+    """Return a copy of ``values`` with ``delta`` added to every element.
+
+    Every result must fit the array's item type, as shifted source offsets
+    always do. The array is then added to as one big integer with ``delta``
+    repeated in each lane: no lane carries or borrows into the next, and the
+    work stays in C instead of one Python call per element.
+    """
+    if not delta or not values:
+        return values[:]
+    order = sys.byteorder
+    whole = int.from_bytes(values.tobytes(), order)
+    lanes = array(values.typecode, [abs(delta)]) * len(values)
+    pattern = int.from_bytes(lanes.tobytes(), order)
+    whole = whole + pattern if delta > 0 else whole - pattern
+    result = array(values.typecode)
+    result.frombytes(whole.to_bytes(len(values) * values.itemsize, order))
+    return result
+
+
+@dataclass(frozen=True, slots=True)
+class LineIndex:
+    """Start offset of every line in a source, for on-demand line/column lookup.
+
+    Built once in bulk by scanning for ``\\n``; lookups are binary searches, so
+    scanners only need to track offsets and resolve positions when asked.
+    """
+
+    starts: array[int]
+    length: int
+
+    @classmethod
+    def from_text(cls, text: str) -> "LineIndex":
+        """Index the lines of ``text``."""
+        return cls.from_chunks(((0, text),), len(text))
+
+    @classmethod
+    def from_chunks(cls, chunks: Iterable[tuple[int, str]], length: int) -> "LineIndex":
+        """Index a source given as ``(offset, text)`` chunks in order."""
+        starts = array("Q", [0])
+        for offset, text in chunks:
+            find = text.find
+            pos = find("\n")
+            while pos != -1:
+                starts.append(offset + pos + 1)
+                pos = find("\n", pos + 1)
+        return cls(starts, length)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def locate(self, offset: int) -> tuple[int, int]:
+        """Return the 1-based ``(line, column)`` of ``offset``."""
+        if not 0 <= offset <= self.length:
+            raise ERR_OFFSET_OUT_OF_RANGE
+        line = bisect_right(self.starts, offset)
+        return line, offset - self.starts[line - 1] + 1
+
+    def span(self, start: int, end: int) -> Span:
+        """Build the ``Span`` for the range ``[start, end)``."""
+        line, column = self.locate(start)
+        return Span(start, end, line, column)
+
+    def spans(self, ranges: Iterable[tuple[int, int]]) -> list[Span]:
+        """Build spans for many ranges at once, in the order given.
+
+        Ranges are resolved in start order so each search only looks past the
+        previous line, which makes batches of diagnostics cheap.
+        """
+        ranges = list(ranges)
+        result = [Span(0, 0, 1, 1)] * len(ranges)
+        starts = self.starts
+        line = 0
+        for i in sorted(range(len(ranges)), key=lambda i: ranges[i][0]):
+            start, end = ranges[i]
+            if not 0 <= start <= self.length:
+                raise ERR_OFFSET_OUT_OF_RANGE
+            line = bisect_right(starts, start, lo=line)
+            result[i] = Span(start, end, line, start - starts[line - 1] + 1)
+        return result
+
+    def splice(self, start: int, end: int, text: str) -> "LineIndex":
+        """Index of the source after replacing ``[start, end)`` with ``text``.
+
+        Line starts before the edit are kept, those after it are shifted, and
+        only ``text`` itself is scanned.
+        """
+        if not 0 <= start <= end <= self.length:
+            raise ERR_OFFSET_OUT_OF_RANGE
+        starts = self.starts
+        delta = len(text) - (end - start)
+        head = bisect_right(starts, start)
+        tail = bisect_right(starts, end)
+        inserted = LineIndex.from_text(text).starts[1:]
+        spliced = starts[:head]
+        spliced.extend(map((start).__add__, inserted))
+        spliced.extend(shift_offsets(starts[tail:], delta))
+        return LineIndex(spliced, self.length + delta)
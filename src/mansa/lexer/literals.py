@@ -0,0 +1,125 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+import threading
+from collections.abc import Iterator
+from functools import cache
+
+# Literal of tokens that are not pooled INT literals.
+NO_LITERAL = -1
+
+# Longest digit string decoded with one int() call. Below this threshold
+# int() never applies sys.get_int_max_str_digits(); longer literals are split.
+_DIGIT_LIMIT = sys.int_info.str_digits_check_threshold
+
+# Errors
+ERR_UNKNOWN_LITERAL = IndexError("Literal id is not in the pool.")
+
+# Serializes adding literals, for pools shared between threads, as the lock
+# of SymbolTable does; lookups of known literals never take it.
+_INTERN_LOCK = threading.Lock()
+
+
+@cache
+def _power_of_ten(exponent: int) -> int:
+    power: int = 10**exponent
+    return power
+
+
+def decode_int(digits: str) -> int:
+    """The value of the decimal ``digits``, however many there are.
+
+    Long literals are split in halves and recombined, so a value of any size
+    decodes without raising the interpreter's int/str conversion limit.
+    """
+    size = len(digits)
+    if size <= _DIGIT_LIMIT:
+        return int(digits)
+    low = size // 2
+    high = decode_int(digits[:-low])
+    return high * _power_of_ten(low) + decode_int(digits[-low:])
+
+
+class IntPool:
+    """Distinct INT literal texts, numbered from 0 in order of first use.
+
+    The constant pool of a build: share one pool across every file, like a
+    ``SymbolTable``, so each distinct literal is stored once. Values are
+    decoded on first request and kept, so a literal is parsed at most once
+    however often it occurs. Pools are safe to share between threads.
+    """
+
+    __slots__ = ("_ids", "_texts", "_values")
+
+    def __init__(self) -> None:
+        self._ids: dict[str, int] = {}
+        self._texts: list[str] = []
+        self._values: list[int | None] = []
+
+    def intern(self, text: str) -> int:
+        """Return the id of the literal ``text``, adding it if it is new."""
+        literal = self._ids.get(text)
+        if literal is None:
+            # acquire/release rather than ``with``: this runs once per
+            # distinct literal, and the context manager costs twice as much.
+            _INTERN_LOCK.acquire()
+            try:
+                literal = self._ids.get(text)
+                if literal is None:
+                    # Stored before it is published, so ids always resolve.
+                    literal = len(self._texts)
+                    self._texts.append(text)
+                    self._values.append(None)
+                    self._ids[text] = literal
+            finally:
+                _INTERN_LOCK.release()
+        return literal
+
+    def lookup(self, text: str) -> int | None:
+        """Return the id of ``text``, or None if it was never interned."""
+        return self._ids.get(text)
+
+    def text(self, literal: int) -> str:
+        """Return the source text interned as ``literal``."""
+        if not 0 <= literal < len(self._texts):
+            raise ERR_UNKNOWN_LITERAL
+        return self._texts[literal]
+
+    def value(self, literal: int) -> int:
+        """Return the value of ``literal``, decoding it on first use."""
+        if literal < 0:
+            raise ERR_UNKNOWN_LITERAL
+        try:
+            value = self._values[literal]
+        except IndexError:
+            raise ERR_UNKNOWN_LITERAL from None
+        if value is None:
+            # Threads racing here store equal values, so no lock is needed.
+            value = self._values[literal] = decode_int(self._texts[literal])
+        return value
+
+    def decoded(self) -> int:
+        """Number of literals whose value has been decoded so far."""
+        return len(self._values) - self._values.count(None)
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def __contains__(self, text: object) -> bool:
+        return text in self._ids
+
+    def __iter__(self) -> Iterator[str]:
+        """Yield the literal texts in id order."""
+        return iter(self._texts)
@@ -0,0 +1,170 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import mmap
+import os
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterator
+from typing import overload
+
+# Errors
+ERR_SLICE_STEP = ValueError("Mapped sources do not support slice steps.")
+ERR_SOURCE_INDEX_OUT_OF_RANGE = IndexError("Source index out of range.")
+ERR_INVALID_CHUNK_SIZE = ValueError("Chunk size must be at least 1 byte.")
+
+# Bytes of UTF-8 decoded at a time.
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+def map_file(path: str | os.PathLike[str]) -> mmap.mmap | bytes:
+    """Map the file at ``path`` read-only (empty files cannot be mapped)."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b""
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def _is_continuation(byte: int) -> bool:
+    return byte & 0xC0 == 0x80
+
+
+class MappedSource:
+    """A UTF-8 source file mapped into memory and decoded chunk by chunk.
+
+    Behaves like a read-only ``str`` for ``len()``, indexing, slicing and
+    iteration, with offsets counted in code points. Only one decoded chunk is
+    held at a time; the rest of the text stays in the page cache. Readers on
+    other threads should each take a ``view``, with a chunk of their own.
+    """
+
+    __slots__ = (
+        "_byte_starts",
+        "_cache",
+        "_char_starts",
+        "_data",
+        "_length",
+        "_owns_data",
+    )
+
+    def __init__(
+        self, data: mmap.mmap | bytes, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> None:
+        if chunk_size < 1:
+            raise ERR_INVALID_CHUNK_SIZE
+        self._data = data
+        self._owns_data = True
+        self._byte_starts = array("Q")
+        self._char_starts = array("Q")
+        self._cache: tuple[int, int, str] = (0, 0, "")
+
+        size = len(data)
+        byte_pos = char_pos = 0
+        while byte_pos < size:
+            end = min(byte_pos + chunk_size, size)
+            boundary = end
+            while byte_pos < boundary < size and _is_continuation(data[boundary]):
+                boundary -= 1
+            if boundary > byte_pos:
+                end = boundary
+            else:
+                # A chunk shorter than its first sequence: take all of it.
+                while end < size and _is_continuation(data[end]):
+                    end += 1
+            chunk = data[byte_pos:end]
+            self._byte_starts.append(byte_pos)
+            self._char_starts.append(char_pos)
+            char_pos += len(chunk) if chunk.isascii() else len(chunk.decode("utf-8"))
+            byte_pos = end
+        self._byte_starts.append(size)
+        self._char_starts.append(char_pos)
+        self._length = char_pos
+
+    @classmethod
+    def open(
+        cls, path: str | os.PathLike[str], chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> "MappedSource":
+        """Map the file at ``path`` read-only."""
+        return cls(map_file(path), chunk_size)
+
+    def view(self) -> "MappedSource":
+        """A source over the same mapping that decodes into its own chunk.
+
+        Closing a view leaves the mapping open; closing the source it was
+        taken from releases it for every view.
+        """
+        view = object.__new__(MappedSource)
+        view._data = self._data
+        view._owns_data = False
+        view._byte_starts = self._byte_starts
+        view._char_starts = self._char_starts
+        view._cache = (0, 0, "")
+        view._length = self._length
+        return view
+
+    def close(self) -> None:
+        """Release the mapping. The source must not be used afterwards."""
+        self._cache = (0, 0, "")
+        if self._owns_data and isinstance(self._data, mmap.mmap):
+            self._data.close()
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _chunk(self, index: int) -> tuple[int, int, str]:
+        """Return ``(char_start, char_end, text)`` of the chunk holding ``index``."""
+        cache = self._cache  # read once: another thread may replace it
+        if cache[0] <= index < cache[1]:
+            return cache
+        k = bisect_right(self._char_starts, index) - 1
+        lo, hi = self._byte_starts[k], self._byte_starts[k + 1]
+        cache = (
+            self._char_starts[k],
+            self._char_starts[k + 1],
+            self._data[lo:hi].decode("utf-8"),
+        )
+        self._cache = cache
+        return cache
+
+    @overload
+    def __getitem__(self, key: int) -> str: ...
+    @overload
+    def __getitem__(self, key: slice) -> str: ...
+    def __getitem__(self, key: int | slice) -> str:
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self._length)
+            if step != 1:
+                raise ERR_SLICE_STEP
+            parts = []
+            while start < stop:
+                lo, hi, text = self._chunk(start)
+                parts.append(text[start - lo : min(stop, hi) - lo])
+                start = hi
+            return "".join(parts)
+        if key < 0:
+            key += self._length
+        if not 0 <= key < self._length:
+            raise ERR_SOURCE_INDEX_OUT_OF_RANGE
+        lo, _, text = self._chunk(key)
+        return text[key - lo]
+
+    def chunks(self) -> Iterator[tuple[int, str]]:
+        """Yield ``(offset, text)`` for each decoded chunk in order."""
+        for k in range(len(self._char_starts) - 1):
+            lo, _, text = self._chunk(self._char_starts[k])
+            yield lo, text
+
+    def __iter__(self) -> Iterator[str]:
+        for _, text in self.chunks():
+            yield from text
@@ -0,0 +1,184 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+from collections.abc import Iterable
+
+from .buffer import ERR_NEGATIVE_MAX_ERRORS, KIND_CODES, TokenBuffer
+from .lines import LineIndex
+from .literals import NO_LITERAL, IntPool
+from .mapped import MappedSource
+from .symbols import SymbolTable
+from .token import NO_SYMBOL, Token, TokenKind
+
+# Version of the token grammar. Bump it whenever scan() would produce
+# different tokens for the same source, so cached results are invalidated.
+LEXER_VERSION = 2
+
+# Characters of a str scanned between checks of the error cap.
+_ERROR_WINDOW = 64 * 1024
+
+# One alternative per token kind, tried in order; whitespace is skipped by
+# the search itself. Must stay in step with the character classes of Lexer.
+_TOKEN_PATTERN = re.compile(
+    r"""
+    ([A-Za-z_]\w*)     # 1: IDENT
+    | (\d+)            # 2: INT
+    | ([^ \t\r\n\w]+)  # 3: ILLEGAL, a whole run
+    """,
+    re.ASCII | re.VERBOSE,
+)
+# Token kind code by match.lastindex; a match always sets one group, never 0.
+_GROUP_CODES = tuple(
+    KIND_CODES[kind]
+    for kind in (TokenKind.ILLEGAL, TokenKind.IDENT, TokenKind.INT, TokenKind.ILLEGAL)
+)
+
+
+def scan(
+    source: str | MappedSource,
+    table: SymbolTable | None = None,
+    max_errors: int | None = None,
+    pool: IntPool | None = None,
+) -> TokenBuffer:
+    """Lex ``source`` into a ``TokenBuffer``, ending with EOF.
+
+    Scans whole runs with one compiled pattern instead of a character at a
+    time and only records kinds and offsets; line/column are resolved from
+    the buffer's ``LineIndex`` when tokens are read. A ``MappedSource`` is
+    scanned one decoded chunk at a time. With a ``table``, identifiers are
+    interned into it as they are scanned, and with a ``pool``, INT literals
+    are added to it, leaving their values to be decoded when asked for.
+
+    With ``max_errors``, scanning stops at the ILLEGAL token after that many,
+    which is extended to the end of the source (see ``cap_errors``), so
+    garbage input costs time in proportion to the cap rather than its size.
+    """
+    if max_errors is not None and max_errors < 0:
+        raise ERR_NEGATIVE_MAX_ERRORS
+    if isinstance(source, str):
+        lines = LineIndex.from_text(source)
+        buffer = TokenBuffer(lines=lines, table=table, pool=pool)
+        if max_errors is None:
+            _scan_text(buffer, source, 0)
+        else:
+            windows = (
+                (offset, source[offset : offset + _ERROR_WINDOW])
+                for offset in range(0, len(source), _ERROR_WINDOW)
+            )
+            _scan_chunks(buffer, windows, max_errors)
+    else:
+        lines = LineIndex.from_chunks(source.chunks(), len(source))
+        buffer = TokenBuffer(lines=lines, table=table, pool=pool)
+        _scan_chunks(buffer, source.chunks(), max_errors)
+    buffer.append(TokenKind.EOF, len(source), len(source))
+    if max_errors is not None:
+        buffer.cap_errors(max_errors)
+    return buffer
+
+
+def _scan_chunks(
+    buffer: TokenBuffer, chunks: Iterable[tuple[int, str]], max_errors: int | None
+) -> None:
+    """Append the tokens of a source given as ``(offset, text)`` chunks.
+
+    Stops early once there are more than ``max_errors`` ILLEGAL tokens.
+    """
+    illegal, code = 0, KIND_CODES[TokenKind.ILLEGAL]
+    carry, carry_offset = "", 0
+    for offset, text in chunks:
+        if carry:
+            text, offset = carry + text, carry_offset
+        # A token touching the end of the chunk may continue in the next
+        # one, so it is held back and rescanned with it.
+        count = len(buffer)
+        held = _scan_text(buffer, text, offset, partial=True)
+        carry, carry_offset = text[held:], offset + held
+        if max_errors is not None:
+            illegal += buffer.kinds[count:].count(code)
+            if illegal > max_errors:
+                return
+    _scan_text(buffer, carry, carry_offset)
+
+
+def _scan_text(
+    buffer: TokenBuffer, text: str, offset: int, partial: bool = False
+) -> int:
+    """Append the tokens of ``text``, which starts at source ``offset``.
+
+    With ``partial``, a final token running up to the end of ``text`` is not
+    appended. Returns the index in ``text`` where appended tokens stop.
+    """
+    if buffer.table is not None or buffer.pool is not None:
+        return _scan_interned(buffer, text, offset, partial)
+    add_kind, add_start, add_end = (
+        buffer.kinds.append,
+        buffer.starts.append,
+        buffer.ends.append,
+    )
+    codes = _GROUP_CODES
+    size = len(text)
+    for match in _TOKEN_PATTERN.finditer(text):
+        start, end = match.span()
+        if partial and end == size:
+            return start
+        add_kind(codes[match.lastindex or 0])
+        add_start(offset + start)
+        add_end(offset + end)
+    return size
+
+
+def _scan_interned(buffer: TokenBuffer, text: str, offset: int, partial: bool) -> int:
+    """``_scan_text`` that also fills the buffer's table and pool.
+
+    Identifiers are interned into ``buffer.table`` and INT literals into
+    ``buffer.pool``, whichever of the two the buffer has.
+    """
+    add_kind, add_start, add_end, add_symbol, add_literal = (
+        buffer.kinds.append,
+        buffer.starts.append,
+        buffer.ends.append,
+        buffer.symbols.append,
+        buffer.literals.append,
+    )
+    table, pool = buffer.table, buffer.pool
+    intern = table.intern if table is not None else None
+    pool_intern = pool.intern if pool is not None else None
+    codes = _GROUP_CODES
+    size = len(text)
+    for match in _TOKEN_PATTERN.finditer(text):
+        start, end = match.span()
+        if partial and end == size:
+            return start
+        add_kind(codes[match.lastindex or 0])
+        add_start(offset + start)
+        add_end(offset + end)
+        if intern is not None:
+            name = match[1]  # the IDENT group, None for other kinds
+            add_symbol(NO_SYMBOL if name is None else intern(name))
+        if pool_intern is not None:
+            digits = match[2]  # the INT group
+            add_literal(NO_LITERAL if digits is None else pool_intern(digits))
+    return size
+
+
+def tokenize(
+    source: str, table: SymbolTable | None = None, max_errors: int | None = None
+) -> list[Token]:
+    """Lex ``source`` into tokens, ending with EOF.
+
+    Produces exactly the tokens of ``Lexer``; see ``scan`` for the compact
+    form these are materialized from, for ``table`` and for ``max_errors``.
+    """
+    return scan(source, table, max_errors).tokens()
@@ -0,0 +1,195 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+One offset space shared by every source file of a build.
+
+A ``SourceManager`` places each registered file at a base offset, after the
+previous file. A global offset then identifies the file as well as the
+position in it, so a span is two ints (or one, packed with ``pack_span``)
+and file, line and column are only looked up when a span is shown.
+"""
+
+import os
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterator
+from types import TracebackType
+from typing import NamedTuple, Self
+
+from .buffer import TokenBuffer
+from .lines import LineIndex
+from .stream import CharStream
+from .token import Span
+
+# Errors
+ERR_OFFSET_NOT_IN_SOURCES = IndexError("Offset is not in any registered source.")
+ERR_UNKNOWN_SOURCE = IndexError("Source id is not registered.")
+ERR_SPAN_TOO_LARGE = ValueError("Span does not fit in a packed span.")
+
+# Bits of a packed span holding its length; its start takes the rest.
+_LENGTH_BITS = 32
+_LENGTH_MASK = (1 << _LENGTH_BITS) - 1
+
+
+def pack_span(start: int, end: int) -> int:
+    """Pack the global range ``[start, end)`` into one int.
+
+    Spans whose start and length are below 2**32 fit an ``array("Q")``.
+    """
+    length = end - start
+    if start < 0 or not 0 <= length <= _LENGTH_MASK:
+        raise ERR_SPAN_TOO_LARGE
+    return start << _LENGTH_BITS | length
+
+
+def unpack_span(packed: int) -> tuple[int, int]:
+    """Return the ``(start, end)`` packed by ``pack_span``."""
+    start = packed >> _LENGTH_BITS
+    return start, start + (packed & _LENGTH_MASK)
+
+
+class SourceFile(NamedTuple):
+    """A source registered with a ``SourceManager``.
+
+    It covers the global offsets ``base`` through ``base + length``; the
+    last one is its EOF, so neighbouring files never share an offset.
+    """
+
+    id: int
+    name: str
+    base: int
+    lines: LineIndex
+
+    @property
+    def length(self) -> int:
+        """Length of the source in characters."""
+        return self.lines.length
+
+    @property
+    def end(self) -> int:
+        """Global offset of the source's EOF."""
+        return self.base + self.lines.length
+
+
+class Location(NamedTuple):
+    """A global offset resolved to its file, line and column."""
+
+    file: SourceFile
+    line: int
+    column: int
+
+
+class SourceManager:
+    """Registry of source files laid out in one global offset space.
+
+    Files are added in order and never move, so global offsets stay valid
+    for the life of the manager. Resolving an offset is a binary search
+    over file bases followed by one over that file's line starts.
+    """
+
+    __slots__ = ("_bases", "_files", "_streams")
+
+    def __init__(self) -> None:
+        self._bases = array("Q")
+        self._files: list[SourceFile] = []
+        self._streams: list[CharStream] = []
+
+    def add(self, name: str, stream: CharStream) -> SourceFile:
+        """Register ``stream`` under ``name`` after every earlier source."""
+        base = self._files[-1].end + 1 if self._files else 0
+        file = SourceFile(len(self._files), name, base, stream.lines)
+        self._bases.append(base)
+        self._files.append(file)
+        self._streams.append(stream)
+        return file
+
+    def open(self, path: str | os.PathLike[str]) -> SourceFile:
+        """Map the UTF-8 file at ``path`` and register it under its path."""
+        return self.add(os.fspath(path), CharStream.from_path(path))
+
+    def close(self) -> None:
+        """Release the mappings of every registered stream."""
+        for stream in self._streams:
+            stream.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def __iter__(self) -> Iterator[SourceFile]:
+        return iter(self._files)
+
+    def __getitem__(self, source_id: int) -> SourceFile:
+        if not 0 <= source_id < len(self._files):
+            raise ERR_UNKNOWN_SOURCE
+        return self._files[source_id]
+
+    def stream(self, file: SourceFile) -> CharStream:
+        """The stream ``file`` was registered with."""
+        return self._streams[file.id]
+
+    def file(self, offset: int) -> SourceFile:
+        """The source holding global ``offset``."""
+        k = bisect_right(self._bases, offset) - 1
+        if k < 0 or offset > self._files[k].end:
+            raise ERR_OFFSET_NOT_IN_SOURCES
+        return self._files[k]
+
+    def locate(self, offset: int) -> Location:
+        """Resolve global ``offset`` to its file, line and column."""
+        file = self.file(offset)
+        line, column = file.lines.locate(offset - file.base)
+        return Location(file, line, column)
+
+    def span(self, start: int, end: int) -> tuple[SourceFile, Span]:
+        """Resolve the global range ``[start, end)`` to a file and local span."""
+        file = self.file(start)
+        return file, file.lines.span(start - file.base, end - file.base)
+
+    def unpack(self, packed: int) -> tuple[SourceFile, Span]:
+        """``span`` of a range packed by ``pack_span``."""
+        return self.span(*unpack_span(packed))
+
+    def text(self, start: int, end: int) -> str:
+        """The source text of the global range ``[start, end)``."""
+        file = self.file(start)
+        return self._streams[file.id].sub(start - file.base, end - file.base)
+
+    def pack(self, file: SourceFile, buffer: TokenBuffer) -> array[int]:
+        """Packed global spans of every token in ``buffer``, lexed from ``file``.
+
+        One 8-byte int per token instead of a ``Span`` of four ints, ready to
+        store or send to another process and ``unpack`` there.
+        """
+        base = file.base
+        if file.end > _LENGTH_MASK:
+            raise ERR_SPAN_TOO_LARGE
+        return array(
+            "Q",
+            [
+                (base + start) << _LENGTH_BITS | (end - start)
+                for start, end in zip(buffer.starts, buffer.ends)
+            ],
+        )
@@ -0,0 +1,221 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Lexing one large source on several processes.
+
+``scan_split`` cuts a file just after whitespace, where no token can
+straddle, and lexes the pieces in a process pool. Workers map the file
+themselves, so only piece bounds go out and compact arrays come back;
+offsets are in bytes of the whole file, so joining the pieces is plain
+concatenation. The result is the ``scan_bytes`` of the whole file.
+
+With ``threads``, a thread pool lexes the pieces of one shared mapping
+instead, and nothing is pickled. Threads only run in parallel on a
+free-threaded build of Python.
+"""
+
+import os
+import re
+from array import array
+from collections import deque
+from collections.abc import Callable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from itertools import islice, pairwise
+
+from .buffer import KIND_CODES, TokenBuffer
+from .lines import LineIndex, shift_offsets
+from .mapped import map_file
+from .token import TokenKind
+from .utf8 import (
+    _NEWLINE,
+    BOM,
+    ByteSource,
+    ByteTokens,
+    Utf8Index,
+    _scan_bytes,
+    scan_bytes,
+)
+
+# Smallest piece a file is split into; smaller files are lexed whole.
+MIN_PIECE = 4 * 1024 * 1024
+
+# Pieces per worker, so a slow piece (say, full of ILLEGAL runs) does not
+# leave the other workers idle.
+_PIECES_PER_JOB = 4
+
+# Bytes searched past a piece's nominal end for a newline to cut after,
+# before settling for any whitespace.
+_NEWLINE_SEARCH = 64 * 1024
+
+_WHITESPACE = re.compile(rb"[ \t\r\n]")
+
+# What a worker returns for its piece: kinds, starts, ends, the ends of its
+# newlines, and its Utf8Index marks and excess (counted from the piece).
+type Piece = tuple[
+    array[int], array[int], array[int], array[int], array[int], array[int]
+]
+
+
+def split_points(data: ByteSource, pieces: int) -> list[int]:
+    """Offsets cutting ``data`` into about ``pieces`` ranges at whitespace.
+
+    The first offset is where lexing starts (past any BOM) and the last is
+    ``len(data)``. Every other one follows a whitespace byte, preferably a
+    newline, so no token crosses it. A source without whitespace to cut at
+    gets fewer ranges.
+    """
+    size = len(data)
+    points = [len(BOM) if data[: len(BOM)] == BOM else 0]
+    for k in range(1, pieces):
+        target = max(size * k // pieces, points[-1])
+        match = _NEWLINE.search(data, target, target + _NEWLINE_SEARCH)
+        if match is None:
+            match = _WHITESPACE.search(data, target)
+            if match is None:
+                break
+        if match.end() < size:
+            points.append(match.end())
+    points.append(size)
+    return points
+
+
+def _scan_range(data: ByteSource, start: int, stop: int) -> Piece:
+    """Lex bytes ``[start, stop)`` of ``data``."""
+    buffer = TokenBuffer(array("B"), array("I"), array("I"))
+    utf8 = Utf8Index()
+    _scan_bytes(buffer, utf8, data, start, stop)
+    newlines = array("Q", (m.end() for m in _NEWLINE.finditer(data, start, stop)))
+    return buffer.kinds, buffer.starts, buffer.ends, newlines, utf8.marks, utf8.excess
+
+
+def _scan_piece(path: str, start: int, stop: int) -> Piece:
+    """Lex bytes ``[start, stop)`` of the file at ``path``, in a worker."""
+    data = map_file(path)
+    try:
+        return _scan_range(data, start, stop)
+    finally:
+        if not isinstance(data, bytes):
+            data.close()
+
+
+def _scan_pieces(
+    pool: Executor,
+    scan: Callable[[int, int], Piece],
+    points: Sequence[int],
+    workers: int,
+    max_errors: int | None,
+) -> list[Piece]:
+    """Lex the ranges between ``points`` on ``pool``, returning pieces in order.
+
+    Only a few pieces per worker are in flight at a time. Once the pieces so
+    far hold more than ``max_errors`` ILLEGAL tokens, the rest are left
+    unlexed, as ``scan_bytes`` would stop there too.
+    """
+    code = KIND_CODES[TokenKind.ILLEGAL]
+    ranges = pairwise(points)
+    pending = deque(
+        pool.submit(scan, *bounds) for bounds in islice(ranges, 2 * workers)
+    )
+    pieces = []
+    illegal = 0
+    while pending:
+        piece = pending.popleft().result()
+        pieces.append(piece)
+        if max_errors is not None:
+            illegal += piece[0].count(code)
+            if illegal > max_errors:
+                for future in pending:
+                    future.cancel()
+                break
+        bounds = next(ranges, None)
+        if bounds is not None:
+            pending.append(pool.submit(scan, *bounds))
+    return pieces
+
+
+def join_pieces(data: ByteSource, pieces: Sequence[Piece]) -> ByteTokens:
+    """The ``ByteTokens`` of ``data`` from its pieces' tokens, in order.
+
+    Only the ``Utf8Index`` excess needs fixing up: each piece counts it
+    from its own start, the whole source from the beginning.
+    """
+    buffer = TokenBuffer(array("B"), array("I"), array("I"))
+    line_starts = array("Q", [0])
+    utf8 = Utf8Index()
+    if data[: len(BOM)] == BOM:
+        utf8.add(len(BOM), len(BOM))
+    for kinds, starts, ends, newlines, marks, excess in pieces:
+        buffer.kinds.extend(kinds)
+        buffer.starts.extend(starts)
+        buffer.ends.extend(ends)
+        line_starts.extend(newlines)
+        utf8.marks.extend(marks)
+        utf8.excess.extend(shift_offsets(excess, utf8.excess[-1] if utf8.excess else 0))
+    size = len(data)
+    buffer = TokenBuffer(
+        buffer.kinds, buffer.starts, buffer.ends, LineIndex(line_starts, size)
+    )
+    buffer.append(TokenKind.EOF, size, size)
+    return ByteTokens(buffer, utf8)
+
+
+def scan_split(
+    path: str,
+    jobs: int | None = None,
+    max_errors: int | None = None,
+    min_piece: int | None = None,
+    threads: bool = False,
+) -> ByteTokens:
+    """``scan_bytes`` of the file at ``path``, on ``jobs`` worker processes.
+
+    ``jobs`` defaults to the CPU count. Pieces are at least ``min_piece``
+    bytes (default ``MIN_PIECE``), so a smaller file gets fewer pieces, and
+    one that makes a single piece is lexed in this process. With
+    ``max_errors``, no more pieces are lexed once those before hold more
+    ILLEGAL tokens; only the newlines of the rest are indexed. With
+    ``threads``, the workers are threads sharing this process's
+    mapping.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    data = map_file(path)
+    try:
+        min_piece = max(min_piece or MIN_PIECE, 1)
+        count = min(jobs * _PIECES_PER_JOB, len(data) // min_piece)
+        points = split_points(data, count) if jobs > 1 and count > 1 else []
+        if len(points) <= 2:
+            return scan_bytes(data, max_errors=max_errors)
+        workers = min(jobs, len(points) - 1)
+        if threads:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                scan = partial(_scan_range, data)
+                pieces = _scan_pieces(pool, scan, points, workers, max_errors)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                scan = partial(_scan_piece, path)
+                pieces = _scan_pieces(pool, scan, points, workers, max_errors)
+        if len(pieces) < len(points) - 1:
+            # Stopped at the cap: the rest still counts for lines.
+            rest = _NEWLINE.finditer(data, points[len(pieces)])
+            newlines = array("Q", (match.end() for match in rest))
+            empty = array("I")
+            pieces.append((array("B"), empty, empty, newlines, array("Q"), array("Q")))
+        tokens = join_pieces(data, pieces)
+        if max_errors is not None:
+            tokens.cap_errors(data, max_errors)
+        return tokens
+    finally:
+        if not isinstance(data, bytes):
+            data.close()
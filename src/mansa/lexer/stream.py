@@ -12,21 +12,50 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from dataclasses import dataclass
-from typing import Iterator
+import os
+import re
+import sys
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from functools import cache
+from types import TracebackType
+from typing import NamedTuple, Self
+
+from .lines import LineIndex
+from .mapped import MappedSource
 from .token import Span
 
 # Errors
 ERR_SUBSTRING_OUT_OF_BOUNDS = IndexError("Substring indices are out of bounds.")
-ERR_INVALID_SOURCE_TYPE = TypeError("Source must be a string.")
+ERR_INVALID_SOURCE_TYPE = TypeError(
+    "Source must be a string, a MappedSource or a SourceText."
+)
 ERR_INVALID_POSITION_RANGE = ValueError("Invalid position range")
 ERR_INVALID_POSITION_LINE_COLUMN = ValueError(
     "Line and column numbers must be positive integers"
 )
+ERR_INVALID_LOOKAHEAD = ValueError("Lookahead distance out of range.")
 
-# EOF character constant
+# EOF character constant. A NUL in the source reads the same, so the end is
+# told apart by the empty Position that comes with it, never by this value.
 EOF = "\0"
 
+# Characters of a MappedSource matched against a run pattern at a time.
+_RUN_WINDOW = 4096
+
+
+@cache
+def run_pattern(chars: str | frozenset[str], negate: bool = False) -> re.Pattern[str]:
+    """Compiled pattern matching a (possibly empty) run of ``chars``.
+
+    With ``negate``, the run is of characters not in ``chars`` instead.
+    """
+    if not chars:
+        # "[]" is no valid class: no characters, or all of them.
+        return re.compile(".*", re.DOTALL) if negate else re.compile("")
+    escaped = "".join(map(re.escape, sorted(chars)))
+    return re.compile(("[^" if negate else "[") + escaped + "]*")
+
 
 @dataclass(frozen=True, slots=True)
 class Position:
@@ -48,69 +77,301 @@ class Position:
         return Span(self.start, self.end, self.line, self.column)
 
 
+class Mark(NamedTuple):
+    """A saved stream position, to go back to with ``CharStream.reset``.
+
+    Holds the stream's cached line along with the offset, so restoring it
+    needs no line lookup.
+    """
+
+    offset: int
+    line: int
+    line_start: int
+    next_line_start: int
+
+    @property
+    def column(self) -> int:
+        """The 1-based column of the marked character."""
+        return self.offset - self.line_start + 1
+
+
+@dataclass(frozen=True, slots=True)
+class SourceText:
+    """A source and its line index, never changed, so threads can share it.
+
+    Each thread reads it through a ``CharStream`` of its own from
+    ``cursor``. Cursors share the text and the index, so taking one costs
+    O(1) whatever the size of the source.
+    """
+
+    text: str | MappedSource
+    lines: LineIndex
+
+    @classmethod
+    def of(cls, text: str | MappedSource) -> "SourceText":
+        """Index the lines of ``text``."""
+        if isinstance(text, str):
+            return cls(text, LineIndex.from_text(text))
+        if isinstance(text, MappedSource):
+            return cls(text, LineIndex.from_chunks(text.chunks(), len(text)))
+        raise ERR_INVALID_SOURCE_TYPE
+
+    @classmethod
+    def open(cls, path: str | os.PathLike[str]) -> "SourceText":
+        """Map the UTF-8 file at ``path`` and index its lines."""
+        return cls.of(MappedSource.open(path))
+
+    def close(self) -> None:
+        """Release the file mapping, if any. Cursors must not be used after."""
+        if isinstance(self.text, MappedSource):
+            self.text.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    def cursor(self) -> "CharStream":
+        """A new stream at the start of the source, for one thread."""
+        return CharStream(self)
+
+
 @dataclass(frozen=True, slots=True)
 class CharStream:
-    """A single character stream with position tracking."""
+    """A single character stream with position tracking.
 
-    source: str
-    chars: list[str]
+    Characters are read by indexing straight into ``source``; no per-character
+    copy of the input is kept, so a stream costs little more than its string.
+    ``source`` may also be a ``MappedSource`` (see ``from_path``).
+
+    Only ``current_index`` moves as the stream advances. ``line`` and
+    ``column`` are resolved from a ``LineIndex`` built on first use, with the
+    current line cached so sequential reads stay O(1).
+
+    A stream is a cursor for one thread at a time. To read a source from
+    several threads, share a ``SourceText`` and give each its own
+    ``cursor``, which starts with the line index already built.
+    """
+
+    source: str | MappedSource
     current_index: int
-    line: int
-    column: int
+    _lines: LineIndex | None = field(default=None, repr=False, compare=False)
+    _line: int = field(default=1, repr=False, compare=False)
+    _line_start: int = field(default=0, repr=False, compare=False)
+    _next_line_start: int = field(default=-1, repr=False, compare=False)
 
-    def __init__(self, source: str):
+    def __init__(self, source: str | MappedSource | SourceText):
+        lines = None
+        if isinstance(source, SourceText):
+            lines, source = source.lines, source.text
+            if isinstance(source, MappedSource):
+                source = source.view()
         object.__setattr__(self, "source", source)
-        object.__setattr__(self, "chars", list(source))
         object.__setattr__(self, "current_index", 0)
-        object.__setattr__(self, "line", 1)
-        object.__setattr__(self, "column", 1)
+        object.__setattr__(self, "_lines", lines)
+        object.__setattr__(self, "_line", 1)
+        object.__setattr__(self, "_line_start", 0)
+        object.__setattr__(self, "_next_line_start", -1)
         self.__post_init__()
 
     def __post_init__(self) -> None:
-        if not isinstance(self.source, str):
+        if not isinstance(self.source, (str, MappedSource)):
             raise ERR_INVALID_SOURCE_TYPE
 
+    @classmethod
+    def from_path(cls, path: str | os.PathLike[str]) -> "CharStream":
+        """Open a UTF-8 file through ``mmap`` and decode it lazily."""
+        return cls(MappedSource.open(path))
+
+    def close(self) -> None:
+        """Release the file mapping, if the stream has one."""
+        if isinstance(self.source, MappedSource):
+            self.source.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    @property
+    def lines(self) -> LineIndex:
+        """The line-start index of the source, built on first access."""
+        lines = self._lines
+        if lines is None:
+            source = self.source
+            if isinstance(source, str):
+                lines = LineIndex.from_text(source)
+            else:
+                lines = LineIndex.from_chunks(source.chunks(), len(source))
+            object.__setattr__(self, "_lines", lines)
+        return lines
+
+    @property
+    def line(self) -> int:
+        """The 1-based line of the current character."""
+        return self._locate(self.current_index)[0]
+
+    @property
+    def column(self) -> int:
+        """The 1-based column of the current character."""
+        return self._locate(self.current_index)[1]
+
+    def _line_end(self, line: int) -> int:
+        """Offset one past the end of ``line``, or ``sys.maxsize`` for the last."""
+        starts = self.lines.starts
+        return starts[line] if line < len(starts) else sys.maxsize
+
+    def _locate(self, index: int) -> tuple[int, int]:
+        """Resolve ``index`` to ``(line, column)`` through the cached line."""
+        if not self._line_start <= index < self._next_line_start:
+            if index == self._next_line_start:
+                line = self._line + 1
+            else:
+                line = self.lines.locate(index)[0]
+            object.__setattr__(self, "_line", line)
+            object.__setattr__(self, "_line_start", self.lines.starts[line - 1])
+            object.__setattr__(self, "_next_line_start", self._line_end(line))
+        return self._line, index - self._line_start + 1
+
+    def span(self, start: int, end: int) -> Span:
+        """Get the span of the source range ``[start, end)``."""
+        line, column = self._locate(start)
+        return Span(start, end, line, column)
+
+    def _run_end(self, pattern: re.Pattern[str]) -> int:
+        """Index just past the run of ``pattern`` at the current index."""
+        source, end = self.source, self.current_index
+        if isinstance(source, str):
+            match = pattern.match(source, end)
+            return match.end() if match else end
+        while window := source[end : end + _RUN_WINDOW]:
+            match = pattern.match(window)
+            n = match.end() if match else 0
+            end += n
+            if n < len(window):
+                break
+        return end
+
+    def skip_while(self, chars: str | frozenset[str]) -> Span:
+        """Consume the run of ``chars`` at the current index; return its span.
+
+        The whole run is matched at once and the stream moves once, so this
+        costs far less than advancing character by character.
+        """
+        start = self.current_index
+        end = self._run_end(run_pattern(chars))
+        object.__setattr__(self, "current_index", end)
+        return self.span(start, end)
+
+    def skip_pattern(self, pattern: re.Pattern[str]) -> Span:
+        """Consume the match of ``pattern`` at the current index; return its span.
+
+        For character classes too large for ``skip_while``; ``pattern``
+        must match a (possibly empty) run of single characters.
+        """
+        start = self.current_index
+        end = self._run_end(pattern)
+        object.__setattr__(self, "current_index", end)
+        return self.span(start, end)
+
+    def take_while(self, chars: str | frozenset[str]) -> tuple[str, Span]:
+        """Like ``skip_while``, also returning the consumed text."""
+        span = self.skip_while(chars)
+        return self.source[span.start : span.end], span
+
+    def skip_until(self, chars: str | frozenset[str]) -> Span:
+        """Consume up to the next character in ``chars``; return the span.
+
+        The counterpart of ``skip_while`` for runs of everything else.
+        """
+        start = self.current_index
+        end = self._run_end(run_pattern(chars, negate=True))
+        object.__setattr__(self, "current_index", end)
+        return self.span(start, end)
+
+    def match_prefix(self, prefix: str) -> Span | None:
+        """Consume ``prefix`` if the input continues with it; return its span."""
+        start = self.current_index
+        end = start + len(prefix)
+        source = self.source
+        if isinstance(source, str):
+            matched = source.startswith(prefix, start)
+        else:
+            matched = source[start:end] == prefix
+        if not matched:
+            return None
+        object.__setattr__(self, "current_index", end)
+        return self.span(start, end)
+
+    def mark(self) -> Mark:
+        """Save the current position, to come back to with ``reset``.
+
+        Costs the same however far the stream moves before the reset, so
+        speculative scanning can back off without copying or re-scanning.
+        """
+        index = self.current_index
+        self._locate(index)
+        return Mark(index, self._line, self._line_start, self._next_line_start)
+
+    def reset(self, mark: Mark) -> None:
+        """Go back (or forward) to ``mark``, taken from this stream."""
+        object.__setattr__(self, "current_index", mark.offset)
+        object.__setattr__(self, "_line", mark.line)
+        object.__setattr__(self, "_line_start", mark.line_start)
+        object.__setattr__(self, "_next_line_start", mark.next_line_start)
+
     def advance(self) -> tuple[int, str, Position]:
         """Advance to the next character and return it with its position."""
-        idx, ch, pos = self.peek()
-        if ch != EOF:
+        peeked = self.peek()
+        if peeked[2].end > peeked[0]:  # not EOF, which has an empty position
             object.__setattr__(self, "current_index", self.current_index + 1)
-
-        if ch == "\n":
-            object.__setattr__(self, "line", self.line + 1)
-            object.__setattr__(self, "column", 1)
-        else:
-            object.__setattr__(self, "column", self.column + 1)
-        return idx, ch, pos
+        return peeked
 
     def is_eof(self) -> bool:
         """Check if the stream has reached EOF."""
-        return self.current_index >= len(self.chars)
-
-    def peek(self) -> tuple[int, str, Position]:
-        """Peek the next character without consuming it."""
-        if self.current_index < len(self.chars):
-            return (
-                self.current_index,
-                self.chars[self.current_index],
-                Position(
-                    self.current_index,
-                    self.current_index + 1,
-                    self.line,
-                    self.column,
-                ),
-            )
+        return self.current_index >= len(self.source)
+
+    def peek(self, n: int = 1) -> tuple[int, str, Position]:
+        """Peek the ``n``-th next character without consuming it.
+
+        ``peek()`` is the character ``advance`` would return. Looking past
+        the end of the input gives EOF, as ``advance`` would there.
+        """
+        idx = self.current_index
+        if n != 1:
+            if n < 1:
+                raise ERR_INVALID_LOOKAHEAD
+            idx = min(idx + n - 1, len(self.source))
+        if self._line_start <= idx < self._next_line_start:
+            line, column = self._line, idx - self._line_start + 1
         else:
-            return (
-                len(self.source),
-                EOF,
-                Position(
-                    len(self.source),
-                    len(self.source),
-                    self.line,
-                    self.column,
-                ),
-            )  # EOF position
+            line, column = self._locate(idx)
+        if idx < len(self.source):
+            return idx, self.source[idx], Position(idx, idx + 1, line, column)
+        else:
+            return idx, EOF, Position(idx, idx, line, column)  # EOF position
+
+    def peek_str(self, n: int) -> str:
+        """The next ``n`` characters without consuming them, fewer at EOF."""
+        if n < 0:
+            raise ERR_INVALID_LOOKAHEAD
+        idx = self.current_index
+        return self.source[idx : idx + n]
 
     def sub(self, start: int, end: int) -> str:
         """Get a substring from the source."""
@@ -119,18 +380,14 @@ class CharStream:
         return self.source[start:end]
 
     def __iter__(self) -> Iterator[tuple[int, str, Position]]:
-        line = col = 1
-        for idx, ch in enumerate(self.source):
-            pos = Position(idx, idx + 1, line, col)
-            yield idx, ch, pos
-            if ch == "\n":
-                line += 1
-                col = 1
-            else:
-                col += 1
+        source = self.source
+        starts = self.lines.starts
+        line_ends = [*starts[1:], len(source)]
+        for line, (line_start, line_end) in enumerate(zip(starts, line_ends), 1):
+            idx = line_start
+            for column, ch in enumerate(source[line_start:line_end], 1):
+                yield idx, ch, Position(idx, idx + 1, line, column)
+                idx += 1
         # EOF character
-        yield (
-            len(self.source),
-            EOF,
-            Position(len(self.source), len(self.source), line, col),
-        )
+        end = len(source)
+        yield end, EOF, Position(end, end, len(starts), end - starts[-1] + 1)
@@ -0,0 +1,302 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import re
+from array import array
+from collections.abc import Iterable, Iterator
+
+from .buffer import TokenBuffer
+from .lines import LineIndex
+from .mapped import DEFAULT_CHUNK_SIZE
+from .scanner import _scan_text
+from .stream import EOF, Position, run_pattern
+from .symbols import SymbolTable
+from .token import Span, Token
+
+# Errors
+ERR_SPAN_BEFORE_LINE = ValueError(
+    "Span starts before the current line, which is no longer kept."
+)
+
+# How a token held back at the end of a chunk can continue into the next
+# one, by its first character.
+_IDENT_TAIL = re.compile(r"\w*", re.ASCII)
+_INT_TAIL = re.compile(r"\d*", re.ASCII)
+_ILLEGAL_TAIL = re.compile(r"[^ \t\r\n\w]*", re.ASCII)
+
+
+def _tail_pattern(first: str) -> re.Pattern[str]:
+    if first == "_" or first.isascii() and first.isalpha():
+        return _IDENT_TAIL
+    if first.isascii() and first.isdigit():
+        return _INT_TAIL
+    return _ILLEGAL_TAIL
+
+
+def iter_chunks(
+    source: Iterable[str] | io.TextIOBase, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[str]:
+    """Yield the non-empty text chunks of ``source`` in order.
+
+    A file object is read ``chunk_size`` characters at a time rather than
+    by line, so one very long line does not become one huge chunk.
+    """
+    if isinstance(source, io.TextIOBase):
+        while text := source.read(chunk_size):
+            yield text
+    else:
+        for text in source:
+            if text:
+                yield text
+
+
+class StreamTokenizer:
+    """Tokenizer fed a source in chunks, keeping only the unfinished tail.
+
+    ``feed`` returns the tokens each chunk completes; a token running up to
+    the end of a chunk is held back until a later chunk shows where it ends.
+    Memory is bounded by the chunk size plus the longest token, whatever the
+    length of the source. Offsets, lines and columns are global. With a
+    ``table``, identifiers are interned into it.
+    """
+
+    __slots__ = ("_held", "_line", "_line_start", "_offset", "_table")
+
+    def __init__(self, table: SymbolTable | None = None) -> None:
+        self._table = table
+        self._held: list[str] = []  # parts of the held-back token
+        self._offset = 0  # source offset of the held-back token
+        self._line = 1
+        self._line_start = 0  # source offset where _line starts
+
+    def feed(self, text: str) -> list[Token]:
+        """Add the next chunk and return the tokens it completes."""
+        held = self._held
+        if held:
+            # While chunks only extend the held token, collect them instead
+            # of rescanning it each time, so a token spanning many chunks
+            # costs linear time.
+            if _tail_pattern(held[0][0]).fullmatch(text):
+                held.append(text)
+                return []
+            held.append(text)
+            text = "".join(held)
+            held.clear()
+        return self._tokens(text, partial=True)
+
+    def finish(self) -> list[Token]:
+        """End the source and return the remaining tokens, ending with EOF."""
+        tokens = self._tokens("".join(self._held), partial=False)
+        self._held.clear()
+        end = self._offset
+        tokens.append(Token.eof(Span(end, end, self._line, end - self._line_start + 1)))
+        return tokens
+
+    def _tokens(self, text: str, partial: bool) -> list[Token]:
+        offset = self._offset
+        scratch = TokenBuffer(starts=array("Q"), ends=array("Q"), table=self._table)
+        held = _scan_text(scratch, text, offset, partial)
+
+        # Lines of the consumed text only; the held tail is rescanned later.
+        line_starts = array("Q", [self._line_start])
+        find = text.find
+        pos = find("\n", 0, held)
+        while pos != -1:
+            line_starts.append(offset + pos + 1)
+            pos = find("\n", pos + 1, held)
+
+        window = TokenBuffer(
+            scratch.kinds,
+            scratch.starts,
+            scratch.ends,
+            LineIndex(line_starts, offset + held),
+            scratch.symbols,
+            scratch.table,
+        )
+        tokens = window._materialize(0, len(window), first_line=self._line)
+        self._line += len(line_starts) - 1
+        self._line_start = line_starts[-1]
+        if held < len(text):
+            self._held.append(text[held:])
+        self._offset = offset + held
+        return tokens
+
+
+def tokenize_stream(
+    source: Iterable[str] | io.TextIOBase,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    table: SymbolTable | None = None,
+) -> Iterator[Token]:
+    """Lex a source given as text chunks or a file object, ending with EOF.
+
+    Yields the same tokens as ``tokenize`` on the joined text, as each chunk
+    arrives, without holding more than a chunk of the source.
+    """
+    tokenizer = StreamTokenizer(table)
+    for text in iter_chunks(source, chunk_size):
+        yield from tokenizer.feed(text)
+    yield from tokenizer.finish()
+
+
+class ChunkedCharStream:
+    """A character stream over text chunks, holding one chunk at a time.
+
+    The streaming counterpart of ``CharStream`` for sources that cannot be
+    read up front, such as pipes and generators. Offsets, lines and columns
+    are global, but lines are counted as characters are consumed rather
+    than looked up, so ``span`` only resolves ranges on the current line.
+    """
+
+    __slots__ = ("_base", "_chunks", "_line", "_line_start", "_text", "current_index")
+
+    def __init__(
+        self,
+        source: Iterable[str] | io.TextIOBase,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        self._chunks = iter_chunks(source, chunk_size)
+        self._text = ""
+        self._base = 0  # source offset of _text[0]
+        self._line = 1
+        self._line_start = 0
+        self.current_index = 0
+
+    @property
+    def line(self) -> int:
+        """The 1-based line of the current character."""
+        return self._line
+
+    @property
+    def column(self) -> int:
+        """The 1-based column of the current character."""
+        return self.current_index - self._line_start + 1
+
+    def _fill(self) -> bool:
+        """Load the chunk holding the current character; False at the end."""
+        while self.current_index - self._base >= len(self._text):
+            text = next(self._chunks, None)
+            if text is None:
+                return False
+            self._base += len(self._text)
+            self._text = text
+        return True
+
+    def is_eof(self) -> bool:
+        """Check if the stream has reached EOF."""
+        return not self._fill()
+
+    def peek(self) -> tuple[int, str, Position]:
+        """Peek the next character without consuming it."""
+        idx = self.current_index
+        column = idx - self._line_start + 1
+        if self._fill():
+            ch = self._text[idx - self._base]
+            return idx, ch, Position(idx, idx + 1, self._line, column)
+        return idx, EOF, Position(idx, idx, self._line, column)  # EOF position
+
+    def advance(self) -> tuple[int, str, Position]:
+        """Advance to the next character and return it with its position."""
+        peeked = self.peek()
+        idx, ch, position = peeked
+        if position.end > idx:  # not EOF
+            self.current_index = idx + 1
+            if ch == "\n":
+                self._line += 1
+                self._line_start = idx + 1
+        return peeked
+
+    def _consume(self, end: int) -> None:
+        """Move to ``end`` within the current chunk, counting line breaks."""
+        text, i, j = self._text, self.current_index - self._base, end - self._base
+        breaks = text.count("\n", i, j)
+        if breaks:
+            self._line += breaks
+            self._line_start = self._base + text.rindex("\n", i, j) + 1
+        self.current_index = end
+
+    def skip_while(self, chars: str | frozenset[str]) -> Span:
+        """Consume the run of ``chars`` at the current index; return its span.
+
+        As ``CharStream.skip_while``; the run may cross chunks.
+        """
+        return self.skip_pattern(run_pattern(chars))
+
+    def skip_until(self, chars: str | frozenset[str]) -> Span:
+        """Consume up to the next character in ``chars``; return the span."""
+        return self.skip_pattern(run_pattern(chars, negate=True))
+
+    def skip_pattern(self, pattern: re.Pattern[str]) -> Span:
+        """Consume the run of ``pattern`` at the current index; return its span.
+
+        As ``CharStream.skip_pattern``; the run may cross chunks.
+        """
+        start, line, column = self.current_index, self._line, self.column
+        while self._fill():
+            text = self._text
+            match = pattern.match(text, self.current_index - self._base)
+            end = match.end() if match else self.current_index - self._base
+            self._consume(self._base + end)
+            if end < len(text):
+                break
+        return Span(start, self.current_index, line, column)
+
+    def take_while(self, chars: str | frozenset[str]) -> tuple[str, Span]:
+        """Like ``skip_while``, also returning the consumed text."""
+        parts = []
+        start, line, column = self.current_index, self._line, self.column
+        pattern = run_pattern(chars)
+        while self._fill():
+            text, i = self._text, self.current_index - self._base
+            match = pattern.match(text, i)
+            end = match.end() if match else i
+            parts.append(text[i:end])
+            self._consume(self._base + end)
+            if end < len(text):
+                break
+        return "".join(parts), Span(start, self.current_index, line, column)
+
+    def match_prefix(self, prefix: str) -> Span | None:
+        """Consume ``prefix`` if the input continues with it; return its span.
+
+        A prefix crossing into the next chunk needs that chunk loaded, so
+        the current one is kept until the match is decided.
+        """
+        start, column = self.current_index, self.column
+        i = start - self._base
+        while len(self._text) - i < len(prefix):
+            text = next(self._chunks, None)
+            if text is None:
+                return None
+            # Drop what was consumed before joining, so the window stays small.
+            self._text, self._base = self._text[i:] + text, start
+            i = 0
+        if not self._text.startswith(prefix, i):
+            return None
+        line = self._line
+        self._consume(start + len(prefix))
+        return Span(start, start + len(prefix), line, column)
+
+    def span(self, start: int, end: int) -> Span:
+        """Get the span of ``[start, end)``, which must start on this line."""
+        if start < self._line_start:
+            raise ERR_SPAN_BEFORE_LINE
+        return Span(start, end, self._line, start - self._line_start + 1)
+
+    def __iter__(self) -> Iterator[tuple[int, str, Position]]:
+        while True:
+            peeked = self.advance()
+            yield peeked
+            if peeked[2].end == peeked[0]:  # EOF is the only empty position
+                return
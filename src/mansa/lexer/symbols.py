@@ -0,0 +1,76 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+from collections.abc import Iterator
+
+# Errors
+ERR_UNKNOWN_SYMBOL = IndexError("Symbol id is not in the table.")
+
+# Serializes adding names, for tables shared between threads. Module-wide,
+# so tables still pickle; lookups of known names never take it.
+_INTERN_LOCK = threading.Lock()
+
+
+class SymbolTable:
+    """Interned identifier names, numbered from 0 in order of first use.
+
+    Share one table across every file of a build: each distinct name is
+    stored once, and identifiers compare and hash as their integer ids.
+    Interning is safe from several threads at once.
+    """
+
+    __slots__ = ("_ids", "_names")
+
+    def __init__(self) -> None:
+        self._ids: dict[str, int] = {}
+        self._names: list[str] = []
+
+    def intern(self, name: str) -> int:
+        """Return the id of ``name``, adding it if it is new."""
+        symbol = self._ids.get(name)
+        if symbol is None:
+            # acquire/release rather than ``with``: this runs once per
+            # distinct name, and the context manager costs twice as much.
+            _INTERN_LOCK.acquire()
+            try:
+                symbol = self._ids.get(name)
+                if symbol is None:
+                    # Named before it is published, so ids always resolve.
+                    symbol = len(self._names)
+                    self._names.append(name)
+                    self._ids[name] = symbol
+            finally:
+                _INTERN_LOCK.release()
+        return symbol
+
+    def lookup(self, name: str) -> int | None:
+        """Return the id of ``name``, or None if it was never interned."""
+        return self._ids.get(name)
+
+    def name(self, symbol: int) -> str:
+        """Return the name interned as ``symbol``."""
+        if not 0 <= symbol < len(self._names):
+            raise ERR_UNKNOWN_SYMBOL
+        return self._names[symbol]
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._ids
+
+    def __iter__(self) -> Iterator[str]:
+        """Yield the names in id order."""
+        return iter(self._names)
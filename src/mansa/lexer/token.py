@@ -12,10 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import StrEnum, auto
 from typing import NamedTuple
 
+# Symbol of tokens that are not interned identifiers.
+NO_SYMBOL = -1
+
 
 class Span(NamedTuple):
     """Zero-cost source location (start, end, line, column)."""
@@ -37,10 +40,16 @@ class TokenKind(StrEnum):
 
 @dataclass(slots=True, frozen=True, eq=True)
 class Token:
-    """A token with its kind and span."""
+    """A token with its kind and span.
+
+    ``symbol`` is the id of an IDENT's name in the ``SymbolTable`` it was
+    lexed with, or ``NO_SYMBOL``. It is derived from the span, so it takes
+    no part in comparison or hashing.
+    """
 
     kind: TokenKind
     span: Span
+    symbol: int = field(default=NO_SYMBOL, compare=False)
 
     @staticmethod
     def eof(span: Span) -> "Token":
@@ -0,0 +1,155 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from heapq import merge
+
+from .buffer import TokenBuffer
+from .lines import LineIndex
+from .literals import NO_LITERAL, IntPool
+from .scanner import _GROUP_CODES, _TOKEN_PATTERN
+from .symbols import SymbolTable
+from .token import NO_SYMBOL, TokenKind
+
+# The only trivia of the grammar. No token holds whitespace, so searching the
+# whole source for runs of it finds the trivia exactly.
+_WHITESPACE_RUN = r"[ \t\r\n]+"
+_TRIVIA_PATTERN = re.compile(_WHITESPACE_RUN)
+
+# The scanner's _TOKEN_PATTERN, with whitespace runs as one more group.
+_WHITESPACE_GROUP = _TOKEN_PATTERN.groups + 1
+_LOSSLESS_PATTERN = re.compile(
+    f"{_TOKEN_PATTERN.pattern}| ({_WHITESPACE_RUN})\n", _TOKEN_PATTERN.flags
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Trivia:
+    """Whitespace of a source, in a side table beside its tokens.
+
+    One entry per whitespace run, in source order: ``starts``/``ends`` hold
+    source offsets and ``tokens`` the index of the token the run comes
+    before. The leading trivia of a token are thus a contiguous range of
+    entries, and trivia at the end of the source lead EOF. An entry costs 12
+    bytes, and the token stream is left with only the tokens a parser needs.
+    """
+
+    starts: array[int] = field(default_factory=lambda: array("I"))
+    ends: array[int] = field(default_factory=lambda: array("I"))
+    tokens: array[int] = field(default_factory=lambda: array("I"))
+
+    @classmethod
+    def of(cls, buffer: TokenBuffer, source: str) -> "Trivia":
+        """Collect the trivia of ``source`` around the tokens of ``buffer``.
+
+        For buffers lexed without their trivia, such as cached ones; this
+        costs a second pass over ``source``. ``buffer`` is ``scan(source)``,
+        possibly with capped errors, whose last ILLEGAL token swallows any
+        trivia after it.
+        """
+        trivia = cls()
+        add_start, add_end, add_token = (
+            trivia.starts.append,
+            trivia.ends.append,
+            trivia.tokens.append,
+        )
+        starts, ends = buffer.starts, buffer.ends
+        last = len(starts) - 1  # EOF
+        token = 0
+        for match in _TRIVIA_PATTERN.finditer(source):
+            start, end = match.span()
+            token = bisect_right(starts, start, token, last)
+            if token and ends[token - 1] > start:
+                break  # inside a capped ILLEGAL token, which runs to the end
+            add_start(start)
+            add_end(end)
+            add_token(token)
+        return trivia
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def leading(self, token: int) -> range:
+        """Indices of the entries between token ``token`` and the one before."""
+        tokens = self.tokens
+        first = bisect_left(tokens, token)
+        return range(first, bisect_right(tokens, token, first))
+
+    def pieces(self, buffer: TokenBuffer) -> Iterator[tuple[int, int]]:
+        """Yield ``(start, end)`` of every token and entry in source order.
+
+        Together they cover the source end to end, without overlaps.
+        """
+        return merge(zip(buffer.starts, buffer.ends), zip(self.starts, self.ends))
+
+    def rebuild(self, buffer: TokenBuffer, source: str) -> str:
+        """Join the text of every token and entry, which gives ``source``.
+
+        Formatters can rewrite some of the pieces on the way instead.
+        """
+        return "".join(source[start:end] for start, end in self.pieces(buffer))
+
+
+def scan_trivia(
+    source: str, table: SymbolTable | None = None, pool: IntPool | None = None
+) -> tuple[TokenBuffer, Trivia]:
+    """``scan`` that also keeps the trivia of ``source`` in a side table.
+
+    One pass matches tokens and whitespace runs alike and sends each to its
+    own arrays. The buffer is exactly ``scan(source, table, pool=pool)``, so
+    a parser sees only significant tokens. For an error cap, use ``scan`` and
+    ``Trivia.of``.
+    """
+    buffer = TokenBuffer(lines=LineIndex.from_text(source), table=table, pool=pool)
+    trivia = Trivia()
+    add_kind, add_start, add_end, add_symbol, add_literal = (
+        buffer.kinds.append,
+        buffer.starts.append,
+        buffer.ends.append,
+        buffer.symbols.append,
+        buffer.literals.append,
+    )
+    add_trivia_start, add_trivia_end, add_trivia_token = (
+        trivia.starts.append,
+        trivia.ends.append,
+        trivia.tokens.append,
+    )
+    intern = table.intern if table is not None else None
+    pool_intern = pool.intern if pool is not None else None
+    codes = _GROUP_CODES
+    count = 0  # tokens so far: the index of the next one
+    for match in _LOSSLESS_PATTERN.finditer(source):
+        start, end = match.span()
+        group = match.lastindex or 0
+        if group == _WHITESPACE_GROUP:
+            add_trivia_start(start)
+            add_trivia_end(end)
+            add_trivia_token(count)
+            continue
+        add_kind(codes[group])
+        add_start(start)
+        add_end(end)
+        count += 1
+        if intern is not None:
+            name = match[1]
+            add_symbol(NO_SYMBOL if name is None else intern(name))
+        if pool_intern is not None:
+            digits = match[2]
+            add_literal(NO_LITERAL if digits is None else pool_intern(digits))
+    buffer.append(TokenKind.EOF, len(source), len(source))
+    return buffer, trivia
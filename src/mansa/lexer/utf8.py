@@ -0,0 +1,335 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Byte-oriented lexing of UTF-8 sources.
+
+``scan_bytes`` lexes UTF-8 ``bytes`` (or a ``memoryview`` or ``mmap``)
+without decoding it: the grammar outside ILLEGAL tokens is pure ASCII, so
+non-ASCII bytes only ever occur inside ILLEGAL runs and the scanner can work
+in byte offsets. A ``Utf8Index`` of how many bytes those runs have beyond
+their code points converts offsets to the code-point offsets and columns
+users see.
+"""
+
+import mmap
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from typing import NamedTuple
+
+from .buffer import ERR_NEGATIVE_MAX_ERRORS, KIND_CODES, TokenBuffer
+from .lines import LineIndex, shift_offsets
+from .literals import NO_LITERAL, IntPool
+from .scanner import _GROUP_CODES
+from .symbols import SymbolTable
+from .token import NO_SYMBOL, Span, Token, TokenKind
+
+type ByteSource = bytes | bytearray | memoryview | mmap.mmap
+
+# A UTF-8 byte order mark, skipped at the start of a source.
+BOM = b"\xef\xbb\xbf"
+
+# Leading bytes searched for a NUL by ``looks_binary``, as git does.
+BINARY_PREFIX = 8 * 1024
+
+# Bytes scanned between checks of the error cap.
+_ERROR_WINDOW = 64 * 1024
+
+# The scanner's grammar over bytes: _TOKEN_PATTERN's groups, with ILLEGAL
+# runs split in two. ASCII runs (group 3) are taken possessively and only
+# if no non-ASCII byte follows; any other run (group 4) holds non-ASCII
+# bytes, and its width in code points is recorded in the Utf8Index. Runs
+# end at ASCII bytes, which no UTF-8 sequence, valid or not, spans.
+_BYTE_TOKEN_PATTERN = re.compile(
+    rb"""
+    ([A-Za-z_]\w*)                          # 1: IDENT
+    | (\d+)                                 # 2: INT
+    | ([^ \t\r\n\w\x80-\xff]++(?![\x80-\xff]))  # 3: ILLEGAL, ASCII
+    | ([^ \t\r\n\w]+)                        # 4: ILLEGAL
+    """,
+    re.ASCII | re.VERBOSE,
+)
+_BYTE_GROUP_CODES = (*_GROUP_CODES, KIND_CODES[TokenKind.ILLEGAL])
+_NEWLINE = re.compile(rb"\n")
+
+
+def looks_binary(data: ByteSource, prefix: int = BINARY_PREFIX) -> bool:
+    """Whether ``data`` has a NUL byte in its first ``prefix`` bytes.
+
+    Text never does, so this tells binary files apart in O(prefix) time,
+    before lexing them into a mass of ILLEGAL tokens.
+    """
+    return b"\0" in data[:prefix]
+
+
+def _code_points(data: ByteSource, start: int, end: int) -> int:
+    """Code points in ``data[start:end]``, invalid sequences counting as one."""
+    return len(str(data[start:end], "utf-8", "replace"))
+
+
+@dataclass(frozen=True, slots=True)
+class Utf8Index:
+    """Converts byte offsets of a UTF-8 source to code-point offsets.
+
+    ``marks`` holds the byte offset just past every ILLEGAL run with more
+    bytes than code points (and past the BOM), and ``excess`` the bytes in
+    excess of code points up to that mark. Offsets outside such runs, which
+    are all a token or line can start or end at, convert exactly. An ASCII
+    source has no marks, and its offsets convert to themselves.
+    """
+
+    marks: array[int] = field(default_factory=lambda: array("Q"))
+    excess: array[int] = field(default_factory=lambda: array("Q"))
+
+    @classmethod
+    def from_buffer(cls, buffer: TokenBuffer, data: ByteSource) -> "Utf8Index":
+        """Rebuild the index of a ``scan_bytes`` buffer of ``data``.
+
+        For buffers lexed earlier, such as cached ones: only the ILLEGAL
+        runs of ``data`` are decoded.
+        """
+        index = cls()
+        if data[: len(BOM)] == BOM:
+            index.add(len(BOM), len(BOM))
+        illegal = KIND_CODES[TokenKind.ILLEGAL]
+        line_starts = buffer.lines.starts
+        for code, start, end in zip(buffer.kinds, buffer.starts, buffer.ends):
+            if code == illegal:
+                index.add_run(data, start, end, line_starts)
+        return index
+
+    def add(self, mark: int, excess: int) -> None:
+        """Record ``excess`` more bytes than code points up to ``mark``."""
+        if excess:
+            self.marks.append(mark)
+            self.excess.append((self.excess[-1] if self.excess else 0) + excess)
+
+    def add_run(
+        self, data: ByteSource, start: int, end: int, line_starts: array[int]
+    ) -> None:
+        """Index the run ``data[start:end]``, marking any line starts in it."""
+        first = bisect_right(line_starts, start)
+        cuts = [*line_starts[first : bisect_left(line_starts, end, first)], end]
+        for cut in cuts:
+            self.add(cut, cut - start - _code_points(data, start, cut))
+            start = cut
+
+    def char_offset(self, offset: int) -> int:
+        """The code-point offset of byte ``offset``."""
+        k = bisect_right(self.marks, offset)
+        return offset - self.excess[k - 1] if k else offset
+
+    def char_offsets(self, offsets: array[int]) -> array[int]:
+        """``char_offset`` of every element of sorted ``offsets``, in bulk.
+
+        Offsets between two marks share one shift, so each run is converted
+        with a single ``shift_offsets``.
+        """
+        if not self.marks:
+            return offsets[:]
+        marks, excess = self.marks, self.excess
+        cut = bisect_left(offsets, marks[0])
+        result = offsets[:cut]
+        for k in range(len(marks)):
+            stop = (
+                bisect_left(offsets, marks[k + 1], cut)
+                if k + 1 < len(marks)
+                else len(offsets)
+            )
+            result.extend(shift_offsets(offsets[cut:stop], -excess[k]))
+            cut = stop
+        return result
+
+
+class ByteTokens(NamedTuple):
+    """Tokens of a UTF-8 source, lexed in byte offsets.
+
+    ``buffer`` holds byte offsets and a ``LineIndex`` over bytes; ``span``
+    and ``to_chars`` give the code-point form seen by users.
+    """
+
+    buffer: TokenBuffer
+    utf8: Utf8Index
+
+    def span(self, index: int) -> Span:
+        """The code-point span of the token at ``index``."""
+        buffer, char_offset = self.buffer, self.utf8.char_offset
+        start, end = buffer.starts[index], buffer.ends[index]
+        line_starts = buffer.lines.starts
+        line = bisect_right(line_starts, start)
+        first = char_offset(start)
+        column = first - char_offset(line_starts[line - 1]) + 1
+        return Span(first, char_offset(end), line, column)
+
+    def to_chars(self) -> TokenBuffer:
+        """The buffer with every offset converted to code points.
+
+        Equal to ``scan`` of the decoded text (without its BOM, with invalid
+        sequences replaced by U+FFFD).
+        """
+        buffer, char_offsets = self.buffer, self.utf8.char_offsets
+        lines = buffer.lines
+        length = self.utf8.char_offset(lines.length)
+        return TokenBuffer(
+            buffer.kinds,
+            char_offsets(buffer.starts),
+            char_offsets(buffer.ends),
+            LineIndex(char_offsets(lines.starts), length),
+            buffer.symbols,
+            buffer.table,
+            buffer.literals,
+            buffer.pool,
+        )
+
+    def tokens(self) -> list[Token]:
+        """Materialize every token with code-point spans."""
+        return self.to_chars().tokens()
+
+    def cap_errors(self, data: ByteSource, max_errors: int) -> int:
+        """``TokenBuffer.cap_errors``, keeping the index of ``data`` in step."""
+        buffer, utf8 = self
+        last = buffer.cap_errors(max_errors)
+        if last >= 0:
+            # The last run now reaches the end: reindex it from its start.
+            cut = buffer.starts[last]
+            k = bisect_right(utf8.marks, cut)
+            del utf8.marks[k:], utf8.excess[k:]
+            utf8.add_run(data, cut, len(data), buffer.lines.starts)
+        return last
+
+
+def scan_bytes(
+    data: ByteSource,
+    table: SymbolTable | None = None,
+    max_errors: int | None = None,
+    pool: IntPool | None = None,
+) -> ByteTokens:
+    """Lex UTF-8 ``data`` in byte offsets, ending with EOF.
+
+    The counterpart of ``scan`` that never decodes: a leading BOM is
+    skipped, ASCII is matched directly and bytes that are not ASCII, valid
+    UTF-8 or not, end up in ILLEGAL runs spanning them. ``table``,
+    ``max_errors`` and ``pool`` are as for ``scan``.
+    """
+    if max_errors is not None and max_errors < 0:
+        raise ERR_NEGATIVE_MAX_ERRORS
+    size = len(data)
+    start = len(BOM) if data[: len(BOM)] == BOM else 0
+    line_starts = array("Q", [0])
+    line_starts.extend(match.end() for match in _NEWLINE.finditer(data))
+    buffer = TokenBuffer(
+        array("B"),
+        array("I"),
+        array("I"),
+        LineIndex(line_starts, size),
+        table=table,
+        pool=pool,
+    )
+    utf8 = Utf8Index()
+    utf8.add(start, start)
+    if max_errors is None:
+        _scan_bytes(buffer, utf8, data, start, size)
+    else:
+        illegal, code = 0, KIND_CODES[TokenKind.ILLEGAL]
+        pos = stop = start
+        while stop < size and illegal <= max_errors:
+            # A token running into the end of a window is held back and
+            # rescanned with the next one, which grows until it is complete.
+            stop = min(stop + _ERROR_WINDOW, size)
+            count = len(buffer)
+            pos = _scan_bytes(buffer, utf8, data, pos, stop, partial=stop < size)
+            illegal += buffer.kinds[count:].count(code)
+    buffer.append(TokenKind.EOF, size, size)
+    tokens = ByteTokens(buffer, utf8)
+    if max_errors is not None:
+        tokens.cap_errors(data, max_errors)
+    return tokens
+
+
+def _scan_bytes(
+    buffer: TokenBuffer,
+    utf8: Utf8Index,
+    data: ByteSource,
+    start: int,
+    stop: int,
+    partial: bool = False,
+) -> int:
+    """Append the tokens of ``data[start:stop]`` and index their widths.
+
+    ``partial`` is as for ``_scan_text``; returns where appended tokens stop.
+    """
+    if buffer.table is not None or buffer.pool is not None:
+        return _scan_bytes_interned(buffer, utf8, data, start, stop, partial)
+    add_kind, add_start, add_end = (
+        buffer.kinds.append,
+        buffer.starts.append,
+        buffer.ends.append,
+    )
+    add = utf8.add
+    codes = _BYTE_GROUP_CODES
+    for match in _BYTE_TOKEN_PATTERN.finditer(data, start, stop):
+        lo, hi = match.span()
+        if partial and hi == stop:
+            return lo
+        group = match.lastindex or 0
+        add_kind(codes[group])
+        add_start(lo)
+        add_end(hi)
+        if group == 4:
+            add(hi, hi - lo - _code_points(data, lo, hi))
+    return stop
+
+
+def _scan_bytes_interned(
+    buffer: TokenBuffer,
+    utf8: Utf8Index,
+    data: ByteSource,
+    start: int,
+    stop: int,
+    partial: bool,
+) -> int:
+    """``_scan_bytes`` that also fills the buffer's table and pool."""
+    add_kind, add_start, add_end, add_symbol, add_literal = (
+        buffer.kinds.append,
+        buffer.starts.append,
+        buffer.ends.append,
+        buffer.symbols.append,
+        buffer.literals.append,
+    )
+    add = utf8.add
+    table, pool = buffer.table, buffer.pool
+    intern = table.intern if table is not None else None
+    pool_intern = pool.intern if pool is not None else None
+    codes = _BYTE_GROUP_CODES
+    for match in _BYTE_TOKEN_PATTERN.finditer(data, start, stop):
+        lo, hi = match.span()
+        if partial and hi == stop:
+            return lo
+        group = match.lastindex or 0
+        add_kind(codes[group])
+        add_start(lo)
+        add_end(hi)
+        if group == 4:
+            add(hi, hi - lo - _code_points(data, lo, hi))
+        if intern is not None:
+            name = match[1]  # the IDENT group, None for other kinds
+            add_symbol(NO_SYMBOL if name is None else intern(name.decode("ascii")))
+        if pool_intern is not None:
+            digits = match[2]  # the INT group
+            add_literal(
+                NO_LITERAL if digits is None else pool_intern(digits.decode("ascii"))
+            )
+    return stop
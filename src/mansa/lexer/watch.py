@@ -0,0 +1,323 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Lexed state kept hot across rebuilds, for ``mansa watch``.
+
+A ``Workspace`` keeps the bytes and tokens of the files under its roots and,
+when polled, re-lexes only those whose size, modification time or inode
+changed. A waiter decides when the next poll happens: ``InotifyWaiter``
+wakes as soon as a watched directory changes (Linux only), ``PollWaiter``
+sleeps a fixed interval.
+"""
+
+import ctypes
+import os
+import select
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+from itertools import islice
+from typing import NamedTuple
+
+from .batch import FileResult, discover
+from .token import TokenKind
+from .utf8 import BINARY_PREFIX, ByteTokens, looks_binary, scan_bytes
+
+# Bytes of source and tokens a Workspace holds before evicting.
+DEFAULT_HELD_BYTES = 64 * 1024 * 1024
+
+# Seconds between polls, and the longest an InotifyWaiter sleeps.
+DEFAULT_INTERVAL = 0.5
+
+# Seconds to let a burst of writes (an editor saving) settle after a wake-up.
+_SETTLE = 0.005
+
+# Longest illegal text quoted in a diagnostic.
+_QUOTE_LIMIT = 24
+
+# inotify events that can mean a source changed, appeared or went away:
+# IN_MODIFY, IN_ATTRIB, IN_CLOSE_WRITE, IN_MOVED_FROM, IN_MOVED_TO,
+# IN_CREATE, IN_DELETE, IN_DELETE_SELF and IN_MOVE_SELF.
+_INOTIFY_MASK = 0x2 | 0x4 | 0x8 | 0x40 | 0x80 | 0x100 | 0x200 | 0x400 | 0x800
+
+
+class FileStamp(NamedTuple):
+    """What tells a file's content changed without reading it."""
+
+    mtime_ns: int
+    size: int
+    inode: int
+
+    @classmethod
+    def of(cls, path: str) -> "FileStamp":
+        """Stat ``path``."""
+        st = os.stat(path)
+        return cls(st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+class Changes(NamedTuple):
+    """The outcome of one ``Workspace.poll``."""
+
+    changed: list[str]
+    removed: list[str]
+    seconds: float
+
+
+class WatchedFile:
+    """What a ``Workspace`` knows about one file.
+
+    ``result`` is always kept. ``data`` and ``tokens`` are dropped when the
+    file is evicted and reloaded when it is next used.
+    """
+
+    __slots__ = ("data", "result", "stamp", "tokens")
+
+    def __init__(
+        self,
+        stamp: FileStamp,
+        result: FileResult,
+        data: bytes | None = None,
+        tokens: ByteTokens | None = None,
+    ) -> None:
+        self.stamp = stamp
+        self.result = result
+        self.data = data
+        self.tokens = tokens
+
+    @property
+    def held_bytes(self) -> int:
+        """Approximate memory held by the file's data and tokens."""
+        if self.data is None or self.tokens is None:
+            return 0
+        buffer, utf8 = self.tokens
+        # 9 bytes per token (see TokenBuffer), 8 per line and 16 per mark.
+        return (
+            len(self.data)
+            + 9 * len(buffer)
+            + 8 * len(buffer.lines)
+            + 16 * len(utf8.marks)
+        )
+
+
+class Workspace:
+    """The files under ``roots``, lexed and kept in memory between polls.
+
+    Files are held in least recently used order: once their data and tokens
+    exceed ``max_bytes``, the oldest are evicted, keeping only their
+    ``FileResult`` so totals stay right without re-lexing them.
+    """
+
+    __slots__ = ("_files", "_held", "max_bytes", "max_errors", "roots")
+
+    def __init__(
+        self,
+        roots: Sequence[str],
+        max_bytes: int = DEFAULT_HELD_BYTES,
+        max_errors: int | None = None,
+    ) -> None:
+        self.roots = list(roots)
+        self.max_bytes = max_bytes
+        self.max_errors = max_errors
+        self._files: OrderedDict[str, WatchedFile] = OrderedDict()
+        self._held = 0
+
+    def poll(self) -> Changes:
+        """Re-lex the files that changed since the last poll."""
+        start = time.perf_counter()
+        stamps = {}
+        for path in discover(self.roots):
+            try:
+                stamps[path] = FileStamp.of(path)
+            except OSError:
+                continue  # gone, or never there: treated as absent
+        changed = []
+        for path, stamp in stamps.items():
+            file = self._files.get(path)
+            if file is None or file.stamp != stamp:
+                self._load(path, stamp)
+                changed.append(path)
+        removed = [path for path in self._files if path not in stamps]
+        for path in removed:
+            self._held -= self._files.pop(path).held_bytes
+        self._evict()
+        return Changes(changed, removed, time.perf_counter() - start)
+
+    def _load(self, path: str, stamp: FileStamp) -> WatchedFile:
+        """Read and lex ``path``, making it the most recently used file."""
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError as error:
+            file = WatchedFile(stamp, FileResult(path, 0, 0, 0, error=str(error)))
+        else:
+            if looks_binary(data):
+                message = f"{path}: binary file (NUL in first {BINARY_PREFIX} bytes)"
+                result = FileResult(path, len(data), 0, 0, error=message)
+                file = WatchedFile(stamp, result)
+            else:
+                tokens = scan_bytes(data, max_errors=self.max_errors)
+                buffer = tokens.buffer
+                result = FileResult(
+                    path, len(data), len(buffer) - 1, buffer.count(TokenKind.ILLEGAL)
+                )
+                file = WatchedFile(stamp, result, data, tokens)
+        old = self._files.pop(path, None)
+        if old is not None:
+            self._held -= old.held_bytes
+        self._files[path] = file
+        self._held += file.held_bytes
+        return file
+
+    def _evict(self) -> None:
+        """Drop data and tokens of least recently used files over the budget.
+
+        The most recently used file is always kept, however large.
+        """
+        for file in islice(self._files.values(), max(len(self._files) - 1, 0)):
+            if self._held <= self.max_bytes:
+                return
+            self._held -= file.held_bytes
+            file.data = file.tokens = None
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    @property
+    def held_bytes(self) -> int:
+        """Approximate memory held by data and tokens of all files."""
+        return self._held
+
+    def is_held(self, path: str) -> bool:
+        """Whether the data and tokens of ``path`` are in memory."""
+        file = self._files.get(path)
+        return file is not None and file.tokens is not None
+
+    def file(self, path: str) -> WatchedFile:
+        """The state of ``path``, reloaded if evicted, as most recently used."""
+        file = self._files[path]
+        if file.tokens is None and file.result.error is None:
+            file = self._load(path, file.stamp)
+            self._evict()
+        else:
+            self._files.move_to_end(path)
+        return file
+
+    def results(self) -> list[FileResult]:
+        """The result of every file, in path order."""
+        return [self._files[path].result for path in sorted(self._files)]
+
+    def directories(self) -> set[str]:
+        """Directories whose changes can affect the workspace."""
+        found = {root for root in self.roots if os.path.isdir(root)}
+        found.update(os.path.dirname(path) or "." for path in self._files)
+        return found
+
+    def diagnostics(self, path: str) -> list[str]:
+        """One line per problem in ``path``, as ``path:line:column: message``."""
+        file = self.file(path)
+        if file.result.error is not None:
+            return [file.result.error]
+        assert file.data is not None and file.tokens is not None
+        data, tokens = file.data, file.tokens
+        buffer = tokens.buffer
+        if not file.result.illegal:
+            return []
+        lines = []
+        for i in range(len(buffer)):
+            if buffer.kind(i) is not TokenKind.ILLEGAL:
+                continue
+            span = tokens.span(i)
+            text = str(data[buffer.starts[i] : buffer.ends[i]], "utf-8", "replace")
+            if len(text) > _QUOTE_LIMIT:
+                text = text[:_QUOTE_LIMIT] + "..."
+            lines.append(f"{path}:{span.line}:{span.column}: illegal {text!r}")
+        return lines
+
+
+class PollWaiter:
+    """Waits a fixed ``interval`` between polls."""
+
+    __slots__ = ("interval",)
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL) -> None:
+        self.interval = interval
+
+    def watch(self, directories: Iterable[str]) -> None:
+        """Nothing to register: every poll looks at every file."""
+
+    def wait(self) -> None:
+        """Sleep until the next poll is due."""
+        time.sleep(self.interval)
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+
+class InotifyWaiter:
+    """Wakes as soon as a watched directory changes, through Linux inotify.
+
+    It only tells when to poll; the ``Workspace`` still finds what changed
+    by comparing stamps, so missed or coalesced events cost latency, never
+    correctness. It also wakes after ``interval`` at the latest.
+    """
+
+    __slots__ = ("_add_watch", "_fd", "_watched", "interval")
+
+    def __init__(self, interval: float = DEFAULT_INTERVAL) -> None:
+        libc = ctypes.CDLL(None, use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self._fd: int = fd
+        self._add_watch = libc.inotify_add_watch
+        self._watched: set[str] = set()
+        self.interval = interval
+
+    def watch(self, directories: Iterable[str]) -> None:
+        """Watch ``directories`` too; ones already watched are skipped."""
+        for directory in set(directories) - self._watched:
+            path = os.fsencode(directory)
+            if self._add_watch(self._fd, path, _INOTIFY_MASK) >= 0:
+                self._watched.add(directory)
+
+    def wait(self) -> None:
+        """Sleep until a watched directory changes or ``interval`` passes."""
+        ready, _, _ = select.select([self._fd], [], [], self.interval)
+        if ready:
+            time.sleep(_SETTLE)
+            self._drain()
+
+    def _drain(self) -> None:
+        try:
+            while os.read(self._fd, 64 * 1024):
+                pass
+        except BlockingIOError:
+            pass
+
+    def close(self) -> None:
+        """Stop watching."""
+        os.close(self._fd)
+
+
+def make_waiter(interval: float = DEFAULT_INTERVAL) -> PollWaiter | InotifyWaiter:
+    """An ``InotifyWaiter`` where inotify is available, else a ``PollWaiter``."""
+    if sys.platform == "linux":
+        try:
+            return InotifyWaiter(interval)
+        except (OSError, AttributeError):
+            pass
+    return PollWaiter(interval)
@@ -0,0 +1,160 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for the asyncio token stream.
+"""
+
+import asyncio
+import random
+import time
+from collections.abc import AsyncIterator
+
+import pytest
+
+from mansa.lexer.aio import atokenize
+from mansa.lexer.scanner import tokenize
+from mansa.lexer.token import Token, TokenKind
+from mansa.lexer.utf8 import BOM, scan_bytes
+
+SOURCE = "alpha_beta 12345\r\nx+y\n\n  héllo 𝔘 007\r\n_tail"
+
+
+async def chunks_of(text: str, size: int) -> AsyncIterator[str]:
+    for i in range(0, len(text), size):
+        yield text[i : i + size]
+
+
+async def collect(tokens: AsyncIterator[Token]) -> list[Token]:
+    return [token async for token in tokens]
+
+
+# ----
+# atokenize Tests
+# ----
+@pytest.mark.parametrize("size", [1, 3, 1000])
+def test_atokenize_matches_tokenize(size):
+    tokens = asyncio.run(collect(atokenize(chunks_of(SOURCE, size))))
+
+    assert tokens == tokenize(SOURCE)
+
+
+@pytest.mark.parametrize("size", [1, 2, 5])
+def test_atokenize_stream_reader_decodes_split_characters(size):
+    async def run() -> list[Token]:
+        reader = asyncio.StreamReader()
+        data = SOURCE.encode("utf-8")
+        for i in range(0, len(data), size):
+            reader.feed_data(data[i : i + size])
+        reader.feed_eof()
+        return await collect(atokenize(reader, chunk_size=size))
+
+    assert asyncio.run(run()) == tokenize(SOURCE)
+
+
+@pytest.mark.parametrize("size", [1, 2, 5])
+def test_atokenize_stream_reader_matches_scan_bytes(size):
+    data = BOM + b"ab \xff\xfe c\xc3 " + SOURCE.encode("utf-8") + b"\xe2\x82"
+
+    async def run() -> list[Token]:
+        reader = asyncio.StreamReader()
+        for i in range(0, len(data), size):
+            reader.feed_data(data[i : i + size])
+        reader.feed_eof()
+        return await collect(atokenize(reader, chunk_size=size))
+
+    assert asyncio.run(run()) == list(scan_bytes(data).to_chars())
+
+
+def test_atokenize_yields_to_event_loop():
+    source = "x " * 5000
+
+    async def run() -> tuple[int, int]:
+        ticks = 0
+        done = False
+
+        async def heartbeat() -> None:
+            nonlocal ticks
+            while not done:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        beat = asyncio.create_task(heartbeat())
+        await asyncio.sleep(0)
+        tokens = atokenize(chunks_of(source, 10_000), yield_tokens=100)
+        count = len(await collect(tokens))
+        done = True
+        await beat
+        return count, ticks
+
+    count, ticks = asyncio.run(run())
+    assert count == 5001
+    assert ticks >= count // 100
+
+
+def test_atokenize_concurrent_documents_keep_latency_low():
+    rng = random.Random(0)
+    documents = [
+        "".join(rng.choice(["let ", "x1 ", "42 ", "+", "\n"]) for _ in range(50_000))
+        for _ in range(2)
+    ]
+
+    async def run() -> tuple[list[list[Token]], float]:
+        gaps = []
+        done = False
+
+        async def heartbeat() -> None:
+            last = time.perf_counter()
+            while not done:
+                await asyncio.sleep(0)
+                now = time.perf_counter()
+                gaps.append(now - last)
+                last = now
+
+        beat = asyncio.create_task(heartbeat())
+        results = await asyncio.gather(
+            *(collect(atokenize(chunks_of(doc, 1 << 20))) for doc in documents)
+        )
+        done = True
+        await beat
+        return results, max(gaps)
+
+    results, worst_gap = asyncio.run(run())
+    assert results == [tokenize(doc) for doc in documents]
+    assert worst_gap < 0.1  # lexing either document whole takes far longer
+
+
+def test_atokenize_cancellation_mid_file():
+    async def endless() -> AsyncIterator[str]:
+        while True:
+            yield "name 123 "
+
+    async def run() -> list[Token]:
+        seen = []
+
+        async def consume() -> None:
+            async for token in atokenize(endless(), yield_tokens=10):
+                seen.append(token)
+
+        task = asyncio.create_task(consume())
+        while len(seen) < 100:
+            await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        return seen
+
+    seen = asyncio.run(run())
+    assert 100 <= len(seen) < 200
+    assert all(token.kind is not TokenKind.EOF for token in seen)
@@ -0,0 +1,179 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for lexing many files at once.
+
+Results must come back in a deterministic order and agree with lexing each
+file on its own, whether or not worker processes are used.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from mansa.instrument import Recorder
+from mansa.lexer.batch import FileResult, discover, lex_file, lex_files
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    (tmp_path / "b").mkdir()
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b" / "two.mansa").write_text("beta 2 $\n")
+    (tmp_path / "a" / "one.mansa").write_text("alpha 1\n")
+    (tmp_path / "a" / "notes.txt").write_text("not source")
+    (tmp_path / "top.mansa").write_text("")
+    return tmp_path
+
+
+# ----
+# discover Tests
+# ----
+def test_discover_walks_directories_in_sorted_order(tree):
+    assert discover([tree]) == [
+        str(tree / "top.mansa"),
+        str(tree / "a" / "one.mansa"),
+        str(tree / "b" / "two.mansa"),
+    ]
+
+
+def test_discover_keeps_explicit_files(tree):
+    notes = tree / "a" / "notes.txt"
+
+    assert discover([notes, tree / "b"]) == [str(notes), str(tree / "b" / "two.mansa")]
+
+
+# ----
+# lex_file / lex_files Tests
+# ----
+def test_lex_file_counts(tree):
+    path = str(tree / "b" / "two.mansa")
+
+    assert lex_file(path) == FileResult(path, 9, 3, 1)
+
+
+def test_lex_file_reports_errors(tmp_path):
+    assert lex_file(str(tmp_path / "missing.mansa")).error is not None
+
+
+def test_lex_file_invalid_utf8_is_illegal(tmp_path):
+    bad = tmp_path / "bad.mansa"
+    bad.write_bytes(b"ok \xff\xfe 1")
+
+    assert lex_file(str(bad)) == FileResult(str(bad), 7, 3, 1)
+
+
+def test_lex_file_rejects_binary_files(tmp_path):
+    blob = tmp_path / "blob.mansa"
+    blob.write_bytes(b"\x7fELF\x02\x01\x00\x00" + bytes(range(256)) * 100)
+
+    result = lex_file(str(blob))
+    assert result.tokens == 0
+    assert result.error is not None and "binary" in result.error
+
+
+def test_lex_file_caps_errors(tmp_path):
+    noisy = tmp_path / "noisy.mansa"
+    noisy.write_text("x $ " * 1000)
+
+    assert lex_file(str(noisy), max_errors=10) == FileResult(str(noisy), 4000, 22, 11)
+
+
+def test_lex_file_caps_cached_errors(tmp_path):
+    noisy = tmp_path / "noisy.mansa"
+    noisy.write_text("x $ " * 1000)
+    cache_dir = str(tmp_path / "cache")
+
+    full = lex_file(str(noisy), cache_dir)
+    capped = lex_file(str(noisy), cache_dir, max_errors=10)
+    assert not full.cached and full.stored and full.illegal == 1000
+    assert capped == FileResult(str(noisy), 4000, 22, 11, cached=True)
+    # A capped result is not cached, so the full one is still there.
+    again = lex_file(str(noisy), cache_dir)
+    assert again == full._replace(cached=True, stored=False)
+
+
+def test_lex_file_uses_cache(tree, tmp_path):
+    path = str(tree / "b" / "two.mansa")
+    cache_dir = str(tmp_path / "cache")
+
+    first = lex_file(path, cache_dir)
+    second = lex_file(path, cache_dir)
+    assert not first.cached and first.stored
+    assert second.cached and not second.stored
+    assert second == first._replace(cached=True, stored=False)
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_lex_files_preserves_order(tree, jobs):
+    paths = discover([tree]) * 3
+
+    results = lex_files(paths, jobs)
+    assert [r.path for r in results] == paths
+    assert results == [lex_file(path) for path in paths]
+
+
+def test_lex_files_on_threads(tree):
+    paths = discover([tree]) * 3
+
+    assert lex_files(paths, 2, threads=True) == [lex_file(path) for path in paths]
+
+
+def test_lex_files_on_threads_reports_to_recorder(tree):
+    paths = discover([tree])
+
+    with Recorder() as recorder:
+        lex_files(paths, 2, threads=True)
+    assert recorder.phases["file.scan"][0] == 3
+    assert recorder.counters["files"] == 3
+    assert recorder.counters["tokens.illegal"] == 1
+
+
+def test_lex_file_survives_unwritable_cache(tree, tmp_path):
+    path = str(tree / "b" / "two.mansa")
+    cache_dir = tmp_path / "cache"
+    cache_dir.write_text("not a directory")
+
+    with Recorder() as recorder:
+        result = lex_file(path, str(cache_dir))
+    assert result == lex_file(path)
+    assert not result.stored
+    assert recorder.counters["cache.put_errors"] == 1
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_lex_files_with_cache(tree, tmp_path, jobs):
+    paths = discover([tree])
+    cache_dir = str(tmp_path / "cache")
+
+    cold = lex_files(paths, jobs, cache_dir)
+    warm = lex_files(paths, jobs, cache_dir)
+    assert not any(r.cached for r in cold)
+    assert all(r.cached for r in warm)
+    assert [r._replace(cached=False, stored=True) for r in warm] == cold
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_lex_files_reports_to_recorder(tree, jobs):
+    paths = discover([tree])
+
+    with Recorder() as recorder:
+        lex_files(paths, jobs)
+    assert recorder.phases["file.scan"][0] == 3
+    assert recorder.counters["files"] == 3
+    assert recorder.counters["bytes"] == 17
+    assert recorder.counters["tokens.ident"] == 2
+    assert recorder.counters["tokens.illegal"] == 1
+    assert recorder.counters["tokens.eof"] == 3
@@ -0,0 +1,184 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for the struct-of-arrays TokenBuffer.
+
+A buffer must read back exactly the tokens it was filled with, whichever
+way it is accessed.
+"""
+
+import pickle
+
+import pytest
+
+from mansa.lexer.buffer import KIND_CODES, TOKEN_KINDS, TokenBuffer
+from mansa.lexer.lexer import Lexer
+from mansa.lexer.scanner import scan
+from mansa.lexer.stream import CharStream
+from mansa.lexer.symbols import SymbolTable
+from mansa.lexer.token import NO_SYMBOL, Span, Token, TokenKind
+
+SOURCE = "let x1 = 42\n  y + $\n\nzz 7"
+
+
+def reference(source: str) -> list[Token]:
+    return list(Lexer(CharStream(source)))
+
+
+# ----
+# TokenBuffer Tests
+# ----
+def test_kind_codes_round_trip():
+    assert len(TOKEN_KINDS) == len(TokenKind)
+    for kind in TokenKind:
+        assert TOKEN_KINDS[KIND_CODES[kind]] is kind
+
+
+def test_buffer_reads_back_tokens():
+    buffer = scan(SOURCE)
+    expected = reference(SOURCE)
+
+    assert len(buffer) == len(expected)
+    assert list(buffer) == expected
+    assert buffer.tokens() == expected
+    assert [buffer[i] for i in range(len(buffer))] == expected
+    assert buffer[-1] == expected[-1]
+    assert [buffer.kind(i) for i in range(len(buffer))] == [t.kind for t in expected]
+    assert [buffer.span(i) for i in range(len(buffer))] == [t.span for t in expected]
+
+
+def test_buffer_records_are_offsets_only():
+    buffer = scan("ab 12")
+
+    assert list(buffer.records()) == [
+        (TokenKind.IDENT, 0, 2),
+        (TokenKind.INT, 3, 5),
+        (TokenKind.EOF, 5, 5),
+    ]
+
+
+def test_buffer_slice_is_a_buffer():
+    buffer = scan(SOURCE)
+    expected = reference(SOURCE)
+
+    part = buffer[3:6]
+    assert isinstance(part, TokenBuffer)
+    assert list(part) == expected[3:6]
+    assert list(buffer[::2]) == expected[::2]
+    assert list(buffer[5:5]) == []
+
+
+def test_buffer_count():
+    buffer = scan("a b 1 $ %")
+
+    assert buffer.count(TokenKind.IDENT) == 2
+    assert buffer.count(TokenKind.INT) == 1
+    assert buffer.count(TokenKind.ILLEGAL) == 2
+    assert buffer.count(TokenKind.EOF) == 1
+
+
+def test_buffer_cap_errors():
+    buffer = scan("a $ b % c # d\n@")
+
+    assert buffer.cap_errors(1) == 3
+    assert [buffer.kind(i) for i in range(len(buffer))] == [
+        TokenKind.IDENT,
+        TokenKind.ILLEGAL,
+        TokenKind.IDENT,
+        TokenKind.ILLEGAL,
+        TokenKind.EOF,
+    ]
+    assert buffer.span(3) == Span(6, 15, 1, 7)
+    assert buffer.cap_errors(1) == 3
+    assert len(buffer) == 5
+
+
+def test_buffer_cap_errors_within_cap():
+    buffer = scan("a $ b")
+
+    assert buffer.cap_errors(1) == -1
+    assert buffer == scan("a $ b")
+
+
+def test_buffer_append():
+    buffer = TokenBuffer()
+    buffer.append(TokenKind.INT, 0, 0)
+
+    assert list(buffer) == [Token(TokenKind.INT, Span(0, 0, 1, 1))]
+
+
+def test_buffer_iterates_in_blocks():
+    source = "a\n" * 10_000
+    buffer = scan(source)
+
+    assert list(buffer) == reference(source)
+
+
+def test_buffer_pickles_compactly():
+    buffer = scan(SOURCE * 100)
+
+    data = pickle.dumps(buffer)
+    assert pickle.loads(data) == buffer
+    assert len(data) < len(pickle.dumps(buffer.tokens())) / 2
+
+
+def test_buffer_is_frozen():
+    buffer = scan(SOURCE)
+
+    with pytest.raises(AttributeError):
+        buffer.kinds = buffer.kinds  # type: ignore
+
+
+def test_buffer_bytes_round_trip():
+    buffer = scan(SOURCE)
+    data = buffer.to_bytes()
+
+    assert TokenBuffer.from_bytes(data) == buffer
+    assert TokenBuffer.from_bytes(memoryview(data)) == buffer
+    assert TokenBuffer.from_bytes(scan("").to_bytes()) == scan("")
+
+
+def test_buffer_from_bytes_rejects_bad_data():
+    data = scan(SOURCE).to_bytes()
+
+    for bad in (b"", data[:10], data[:-1], data + b"\0", b"XXXX" + data[4:]):
+        with pytest.raises(ValueError):
+            TokenBuffer.from_bytes(bad)
+
+
+def test_buffer_symbols_follow_indexing_and_slicing():
+    table = SymbolTable()
+    buffer = scan(SOURCE, table)
+
+    assert buffer[1].symbol == buffer.symbol(1) == table.lookup("x1")
+    assert buffer[3].symbol == NO_SYMBOL
+    part = buffer[1:5]
+    assert part.table is table
+    assert [t.symbol for t in part] == [t.symbol for t in buffer.tokens()[1:5]]
+
+
+def test_buffer_intern_matches_scanning_with_table():
+    buffer = scan(SOURCE)
+
+    assert buffer.intern(SOURCE, SymbolTable()) == scan(SOURCE, SymbolTable())
+
+
+def test_buffer_bytes_leave_out_symbols():
+    table = SymbolTable()
+    buffer = scan(SOURCE, table)
+
+    loaded = TokenBuffer.from_bytes(buffer.to_bytes())
+    assert loaded == scan(SOURCE)
+    assert loaded.intern(SOURCE, table) == buffer
@@ -0,0 +1,99 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for the content-addressed on-disk token cache.
+"""
+
+import os
+
+from mansa.lexer.cache import TokenCache, default_cache_dir
+from mansa.lexer.scanner import scan
+
+
+# ----
+# Key Tests
+# ----
+def test_cache_key_depends_on_content_only():
+    assert TokenCache.key(b"alpha 1") == TokenCache.key(bytearray(b"alpha 1"))
+    assert TokenCache.key(b"alpha 1") != TokenCache.key(b"alpha 2")
+    assert len(TokenCache.key(b"")) == 40
+
+
+def test_cache_key_depends_on_lexer_version(monkeypatch):
+    import mansa.lexer.cache as cache_module
+
+    before = TokenCache.key(b"x")
+    monkeypatch.setattr(cache_module, "_KEY_SALT", b"mansa-tokens:next")
+    assert TokenCache.key(b"x") != before
+
+
+def test_default_cache_dir(monkeypatch, tmp_path):
+    monkeypatch.setenv("MANSA_CACHE_DIR", str(tmp_path / "explicit"))
+    assert default_cache_dir() == str(tmp_path / "explicit")
+
+    monkeypatch.delenv("MANSA_CACHE_DIR")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert default_cache_dir() == str(tmp_path / "mansa")
+
+
+# ----
+# TokenCache Tests
+# ----
+def test_cache_round_trip_and_counts(tmp_path):
+    cache = TokenCache(str(tmp_path))
+    buffer = scan("let x 1\n")
+    key = TokenCache.key(b"let x 1\n")
+
+    assert cache.get(key) is None
+    cache.put(key, buffer)
+    assert cache.get(key) == buffer
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_cache_treats_corrupt_entries_as_misses(tmp_path):
+    cache = TokenCache(str(tmp_path))
+    key = TokenCache.key(b"x")
+    cache.put(key, scan("x"))
+    path = cache._path(key)
+    with open(path, "r+b") as f:
+        f.truncate(7)
+    assert cache.get(key) is None
+    with open(path, "r+b") as f:
+        f.truncate(0)
+    assert cache.get(key) is None
+
+    cache.put(key, scan("x"))
+    assert cache.get(key) == scan("x")
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    sources = [b"a", b"b b", b"c c c"]
+    keys = [TokenCache.key(s) for s in sources]
+    cache = TokenCache(str(tmp_path))
+    for age, (key, source) in enumerate(zip(keys, sources)):
+        cache.put(key, scan(source.decode()))
+        os.utime(cache._path(key), ns=(age * 10**9, age * 10**9))
+    cache.get(keys[0])  # now the most recently used
+
+    sizes = [os.path.getsize(cache._path(key)) for key in keys]
+    cache.max_bytes = sizes[0] + sizes[2]
+    assert cache.evict() == 1
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[2]) is not None
+
+
+def test_cache_evict_empty_directory(tmp_path):
+    assert TokenCache(str(tmp_path / "missing"), max_bytes=0).evict() == 0
@@ -0,0 +1,112 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for the Unicode identifier and digit classes.
+
+The generated tables must agree with Python's own classification, which
+they are generated from.
+"""
+
+import importlib.util
+import re
+import sys
+import unicodedata
+from pathlib import Path
+
+import pytest
+
+from mansa.lexer import unicode_tables
+from mansa.lexer.chars import class_run, is_digit, is_xid_continue, is_xid_start
+
+SCRIPT = Path(__file__).parents[3] / "scripts" / "gen_unicode_tables.py"
+
+# Python's own Unicode data only agrees with the tables at their version.
+same_unicode = pytest.mark.skipif(
+    unicode_tables.UNICODE_VERSION != unicodedata.unidata_version,
+    reason="tables were generated for another Unicode version",
+)
+
+
+def run_length(pattern: re.Pattern[str], text: str) -> int:
+    match = pattern.match(text)
+    assert match is not None  # runs may be empty, but always match
+    return match.end()
+
+
+def code_points() -> list[int]:
+    """Every BMP code point, and every table boundary and its neighbors."""
+    points = set(range(0x10000))
+    for table in (unicode_tables.XID_START, unicode_tables.XID_CONTINUE):
+        points.update(code + d for code in table for d in (-1, 0, 1))
+    points.update(unicode_tables.DIGIT)
+    return sorted(code for code in points if code <= sys.maxunicode)
+
+
+@same_unicode
+def test_classes_match_python():
+    for code in code_points():
+        ch = chr(code)
+        assert is_xid_start(ch) == (ch != "_" and ch.isidentifier()), hex(code)
+        assert is_xid_continue(ch) == ("a" + ch).isidentifier(), hex(code)
+        assert is_digit(ch) == (unicodedata.category(ch) == "Nd"), hex(code)
+
+
+def test_ascii_classes():
+    assert all(map(is_xid_start, "azAZ")) and not any(map(is_xid_start, "_09$ "))
+    assert all(map(is_xid_continue, "azAZ_09")) and not is_xid_continue("$")
+    assert all(map(is_digit, "0123456789")) and not is_digit("a")
+
+
+def test_non_ascii_classes():
+    assert is_xid_start("é") and is_xid_start("λ") and is_xid_start("東")
+    assert is_xid_continue("\u0301") and not is_xid_start("\u0301")
+    assert is_digit("١") and is_xid_continue("١") and not is_xid_start("١")
+    assert not any(map(is_xid_continue, "€🙂 "))
+
+
+@pytest.mark.parametrize(
+    ("name", "member"),
+    [
+        ("XID_START", is_xid_start),
+        ("XID_CONTINUE", is_xid_continue),
+        ("DIGIT", is_digit),
+    ],
+)
+@same_unicode
+def test_class_run_matches_members(name, member):
+    run, other = class_run(name), class_run(name, negate=True)
+    for code in code_points()[::7]:
+        ch = chr(code)
+        assert run_length(run, ch) == member(ch), hex(code)
+        assert run_length(other, ch) == (not member(ch)), hex(code)
+
+
+def test_class_run_matches_whole_runs():
+    assert run_length(class_run("XID_CONTINUE"), "café_9𝐀x $") == 8
+    assert run_length(class_run("DIGIT", extra="."), "١.2𝟎x") == 4
+    assert run_length(class_run("XID_CONTINUE", negate=True, extra=" "), "€🙂$ x") == 3
+    starts = ("XID_START", "DIGIT")
+    assert run_length(class_run(starts), "a١𝐀·b") == 3
+    assert run_length(class_run(starts, negate=True), "·\u0301€𝟎a") == 3
+
+
+@same_unicode
+def test_tables_are_up_to_date():
+    spec = importlib.util.spec_from_file_location("gen_unicode_tables", SCRIPT)
+    assert spec is not None and spec.loader is not None
+    script = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(script)
+
+    assert Path(unicode_tables.__file__).read_text() == script.render()
@@ -0,0 +1,144 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for incremental re-lexing.
+
+Whatever the edit, re-lexing incrementally must give exactly the buffer a
+full re-lex of the edited source gives.
+"""
+
+import random
+from array import array
+
+import pytest
+
+from mansa.lexer.incremental import Edit, relex
+from mansa.lexer.lines import LineIndex, shift_offsets
+from mansa.lexer.scanner import scan
+from mansa.lexer.symbols import SymbolTable
+
+SOURCE = "let alpha = 10\nlet beta = alpha + 2\n\nprint beta $\n"
+
+
+def check(source: str, edit: Edit) -> None:
+    new_source = edit.apply(source)
+    assert relex(scan(source), new_source, edit) == scan(new_source)
+
+
+# ----
+# Edit Tests
+# ----
+def test_edit_apply_and_delta():
+    edit = Edit(4, 9, "gamma!")
+
+    assert edit.apply(SOURCE).startswith("let gamma! = 10\n")
+    assert edit.delta == 1
+    assert Edit(0, 3, "").delta == -3
+
+
+def test_edit_out_of_range():
+    with pytest.raises(ValueError):
+        Edit(2, 1, "").apply("abc")
+
+    with pytest.raises(ValueError):
+        Edit(0, 4, "").apply("abc")
+
+
+# ----
+# relex Tests
+# ----
+@pytest.mark.parametrize(
+    "edit",
+    [
+        Edit(0, 0, "x"),  # extends the first identifier
+        Edit(9, 9, " "),  # splits an identifier
+        Edit(3, 4, ""),  # joins two identifiers
+        Edit(12, 14, "3"),  # shrinks an integer
+        Edit(14, 15, ""),  # joins two lines
+        Edit(15, 15, "new line\n"),  # inserts a line
+        Edit(0, len(SOURCE), ""),  # deletes everything
+        Edit(len(SOURCE), len(SOURCE), "tail 1"),  # appends at EOF
+        Edit(43, 44, "é"),  # replaces the illegal character
+        Edit(5, 5, "$$"),  # inserts illegal characters mid-token
+    ],
+)
+def test_relex_matches_full_relex(edit):
+    check(SOURCE, edit)
+
+
+@pytest.mark.parametrize("seed", range(25))
+def test_relex_matches_full_relex_random(seed):
+    rng = random.Random(seed)
+    alphabet = "ab_19 \n+é"
+    source = "".join(rng.choice(alphabet) for _ in range(rng.randrange(60)))
+    for _ in range(10):
+        start = rng.randrange(len(source) + 1)
+        end = rng.randrange(start, min(len(source), start + 6) + 1)
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randrange(5)))
+        edit = Edit(start, end, text)
+        check(source, edit)
+        source = edit.apply(source)
+
+
+@pytest.mark.parametrize(
+    "edit", [Edit(4, 9, "gamma"), Edit(0, 0, "new "), Edit(15, 40, "")]
+)
+def test_relex_interns_into_the_buffer_table(edit):
+    table = SymbolTable()
+    new_source = edit.apply(SOURCE)
+
+    result = relex(scan(SOURCE, table), new_source, edit)
+    assert result.table is table
+    assert result == scan(new_source, table)
+
+
+def test_relex_reuses_tokens_after_the_edit():
+    source = "a b c d e"
+    edit = Edit(2, 3, "zz")
+    result = relex(scan(source), edit.apply(source), edit)
+
+    assert list(result.starts) == [0, 2, 5, 7, 9, 10]
+
+
+def test_relex_rejects_mismatched_source():
+    buffer = scan("abc")
+
+    with pytest.raises(ValueError):
+        relex(buffer, "abcd", Edit(0, 1, "x"))
+
+    with pytest.raises(ValueError):
+        relex(buffer, "abc", Edit(2, 5, "x"))
+
+
+# ----
+# Offset shifting Tests
+# ----
+@pytest.mark.parametrize("typecode", ["I", "Q"])
+@pytest.mark.parametrize("delta", [0, 1, 7, -3, 2**20])
+def test_shift_offsets(typecode, delta):
+    values = array(typecode, [3, 5, 255, 256, 65535, 2**24, 10**6])
+
+    assert shift_offsets(values, delta) == array(typecode, [v + delta for v in values])
+
+
+def test_line_index_splice_matches_rebuild():
+    rng = random.Random(0)
+    for _ in range(500):
+        source = "".join(rng.choice("ab\n") for _ in range(rng.randrange(20)))
+        start = rng.randrange(len(source) + 1)
+        end = rng.randrange(start, len(source) + 1)
+        text = "".join(rng.choice("x\n") for _ in range(rng.randrange(4)))
+        spliced = LineIndex.from_text(source).splice(start, end, text)
+        assert spliced == LineIndex.from_text(Edit(start, end, text).apply(source))
@@ -0,0 +1,143 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for the reference lexer built on CharStream.
+
+The reference lexer defines the token grammar every faster engine must
+reproduce, so its behavior is pinned down token by token.
+"""
+
+from mansa.lexer.lexer import Lexer
+from mansa.lexer.stream import CharStream
+from mansa.lexer.token import Span, Token, TokenKind
+
+
+def lex(source: str) -> list[Token]:
+    return list(Lexer(CharStream(source)))
+
+
+# ----
+# Lexer Tests
+# ----
+def test_lexer_empty_source():
+    assert lex("") == [Token.eof(Span(0, 0, 1, 1))]
+
+
+def test_lexer_whitespace_only():
+    assert lex(" \t\r\n ") == [Token.eof(Span(5, 5, 2, 2))]
+
+
+def test_lexer_identifiers_and_integers():
+    assert lex("foo _bar9 42") == [
+        Token(TokenKind.IDENT, Span(0, 3, 1, 1)),
+        Token(TokenKind.IDENT, Span(4, 9, 1, 5)),
+        Token(TokenKind.INT, Span(10, 12, 1, 11)),
+        Token.eof(Span(12, 12, 1, 13)),
+    ]
+
+
+def test_lexer_integer_followed_by_identifier():
+    assert lex("12ab") == [
+        Token(TokenKind.INT, Span(0, 2, 1, 1)),
+        Token(TokenKind.IDENT, Span(2, 4, 1, 3)),
+        Token.eof(Span(4, 4, 1, 5)),
+    ]
+
+
+def test_lexer_coalesces_illegal_runs():
+    assert lex("a+é\n$ 1#%b") == [
+        Token(TokenKind.IDENT, Span(0, 1, 1, 1)),
+        Token.illegal(Span(1, 3, 1, 2)),
+        Token.illegal(Span(4, 5, 2, 1)),
+        Token(TokenKind.INT, Span(6, 7, 2, 3)),
+        Token.illegal(Span(7, 9, 2, 4)),
+        Token(TokenKind.IDENT, Span(9, 10, 2, 6)),
+        Token.eof(Span(10, 10, 2, 7)),
+    ]
+
+
+def test_lexer_nul_is_an_illegal_character():
+    assert lex("a\0\0b\0") == [
+        Token(TokenKind.IDENT, Span(0, 1, 1, 1)),
+        Token.illegal(Span(1, 3, 1, 2)),
+        Token(TokenKind.IDENT, Span(3, 4, 1, 4)),
+        Token.illegal(Span(4, 5, 1, 5)),
+        Token.eof(Span(5, 5, 1, 6)),
+    ]
+
+
+def test_lexer_positions_across_lines():
+    tokens = lex("a\n\n  b\r\nc")
+
+    assert [t.span for t in tokens] == [
+        Span(0, 1, 1, 1),
+        Span(5, 6, 3, 3),
+        Span(8, 9, 4, 1),
+        Span(9, 9, 4, 2),
+    ]
+
+
+def test_lexer_next_token_stays_at_eof():
+    lexer = Lexer(CharStream("x"))
+
+    assert lexer.next_token().kind is TokenKind.IDENT
+    assert lexer.next_token() == lexer.next_token() == Token.eof(Span(1, 1, 1, 2))
+
+
+# ----
+# Unicode identifier Tests
+# ----
+def lex_unicode(source: str) -> list[Token]:
+    return list(Lexer(CharStream(source), unicode_identifiers=True))
+
+
+def test_lexer_unicode_identifiers():
+    assert lex_unicode("café _λ1 x\u0301") == [
+        Token(TokenKind.IDENT, Span(0, 4, 1, 1)),
+        Token(TokenKind.IDENT, Span(5, 8, 1, 6)),
+        Token(TokenKind.IDENT, Span(9, 11, 1, 10)),
+        Token.eof(Span(11, 11, 1, 12)),
+    ]
+
+
+def test_lexer_unicode_digits_and_illegal_runs():
+    assert lex_unicode("١٢x €$é 7") == [
+        Token(TokenKind.INT, Span(0, 2, 1, 1)),
+        Token(TokenKind.IDENT, Span(2, 3, 1, 3)),
+        Token(TokenKind.ILLEGAL, Span(4, 6, 1, 5)),
+        Token(TokenKind.IDENT, Span(6, 7, 1, 7)),
+        Token(TokenKind.INT, Span(8, 9, 1, 9)),
+        Token.eof(Span(9, 9, 1, 10)),
+    ]
+
+
+def test_lexer_unicode_illegal_runs_take_non_start_characters():
+    # XID_Continue characters that cannot start a token stay in the run.
+    assert lex_unicode("$··\u0301 x") == [
+        Token(TokenKind.ILLEGAL, Span(0, 4, 1, 1)),
+        Token(TokenKind.IDENT, Span(5, 6, 1, 6)),
+        Token.eof(Span(6, 6, 1, 7)),
+    ]
+    assert lex_unicode("···") == lex("···")
+    assert [t.kind for t in lex_unicode("\u0301·\u203f€")] == [
+        TokenKind.ILLEGAL,
+        TokenKind.EOF,
+    ]
+
+
+def test_lexer_unicode_identifiers_agree_on_ascii():
+    source = "let x_1 = 42;\n\t$% foo9 _ 0 \0 end"
+
+    assert lex_unicode(source) == lex(source)
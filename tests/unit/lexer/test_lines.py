@@ -0,0 +1,130 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for the line-start index and lazy line/column resolution.
+
+Positions resolved through the index must match counting lines and columns
+character by character.
+"""
+
+import pytest
+
+from mansa.lexer.lines import LineIndex
+from mansa.lexer.stream import CharStream
+from mansa.lexer.token import Span
+
+SOURCES = ["", "a", "\n", "\n\n", "ab\nc", "line1\r\nline2\n\nλ3\n", "x\n" * 50]
+
+
+def brute_force(source: str) -> list[tuple[int, int]]:
+    """Return ``(line, column)`` for every offset including EOF."""
+    result = []
+    line = column = 1
+    for ch in source:
+        result.append((line, column))
+        if ch == "\n":
+            line += 1
+            column = 1
+        else:
+            column += 1
+    result.append((line, column))
+    return result
+
+
+# ----
+# LineIndex Tests
+# ----
+@pytest.mark.parametrize("source", SOURCES)
+def test_line_index_locate_matches_brute_force(source):
+    lines = LineIndex.from_text(source)
+
+    expected = brute_force(source)
+    assert [lines.locate(i) for i in range(len(source) + 1)] == expected
+    assert len(lines) == source.count("\n") + 1
+
+
+def test_line_index_starts():
+    lines = LineIndex.from_text("ab\nc\n\nd")
+
+    assert list(lines.starts) == [0, 3, 5, 6]
+    assert lines.length == 7
+
+
+def test_line_index_from_chunks_matches_from_text():
+    source = "one\ntwo\n\nthree\nfour"
+    chunks = [(0, source[:5]), (5, source[5:9]), (9, source[9:])]
+
+    assert LineIndex.from_chunks(chunks, len(source)) == LineIndex.from_text(source)
+
+
+def test_line_index_span():
+    lines = LineIndex.from_text("ab\ncd")
+
+    assert lines.span(3, 5) == Span(3, 5, 2, 1)
+    assert lines.span(5, 5) == Span(5, 5, 2, 3)
+
+
+def test_line_index_spans_batch_keeps_order():
+    source = "alpha\nbeta\ngamma\n"
+    lines = LineIndex.from_text(source)
+    ranges = [(11, 16), (0, 5), (6, 10), (2, 3), (17, 17)]
+
+    assert lines.spans(ranges) == [lines.span(s, e) for s, e in ranges]
+
+
+def test_line_index_out_of_range():
+    lines = LineIndex.from_text("abc")
+
+    with pytest.raises(IndexError):
+        lines.locate(-1)
+
+    with pytest.raises(IndexError):
+        lines.locate(4)
+
+    with pytest.raises(IndexError):
+        lines.spans([(0, 1), (5, 6)])
+
+
+# ----
+# CharStream line/column Tests
+# ----
+@pytest.mark.parametrize("source", SOURCES)
+def test_char_stream_positions_match_brute_force(source):
+    expected = brute_force(source)
+    stream = CharStream(source)
+
+    assert [(p.line, p.column) for _, _, p in stream] == expected
+    for i in range(len(source) + 1):
+        assert (stream.line, stream.column) == expected[i]
+        assert stream.advance()[2].span() == stream.span(i, min(i + 1, len(source)))
+
+
+def test_char_stream_span_random_access():
+    source = "ab\ncd\nef"
+    stream = CharStream(source)
+
+    assert stream.span(7, 8) == Span(7, 8, 3, 2)
+    assert stream.span(0, 2) == Span(0, 2, 1, 1)
+    assert stream.span(4, 5) == Span(4, 5, 2, 2)
+
+
+def test_char_stream_eof_position_is_stable():
+    stream = CharStream("a\n")
+
+    for _ in range(5):
+        stream.advance()
+
+    assert (stream.line, stream.column) == (2, 1)
+    assert stream.peek()[2] == stream.advance()[2]
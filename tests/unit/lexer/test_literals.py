@@ -0,0 +1,221 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for the INT literal constant pool.
+"""
+
+import pickle
+import random
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from mansa.lexer.incremental import Edit, relex
+from mansa.lexer.literals import NO_LITERAL, IntPool, decode_int
+from mansa.lexer.mapped import MappedSource
+from mansa.lexer.scanner import scan
+from mansa.lexer.symbols import SymbolTable
+from mansa.lexer.token import TokenKind
+from mansa.lexer.utf8 import scan_bytes
+
+
+# ----
+# IntPool Tests
+# ----
+def test_int_pool_interns_in_order_of_first_use():
+    pool = IntPool()
+
+    assert [pool.intern(text) for text in ["8", "0", "8", "255", "0"]] == [
+        0,
+        1,
+        0,
+        2,
+        1,
+    ]
+    assert list(pool) == ["8", "0", "255"]
+    assert len(pool) == 3
+    assert "255" in pool
+    assert pool.lookup("16") is None
+
+
+def test_int_pool_decodes_values_lazily_once():
+    pool = IntPool()
+    first, second = pool.intern("0042"), pool.intern("42")
+
+    assert pool.decoded() == 0
+    assert pool.value(first) == 42
+    assert pool.value(first) == 42
+    assert pool.decoded() == 1
+    assert pool.value(second) == 42
+    assert pool.decoded() == 2
+    assert pool.text(first) == "0042"
+
+
+def test_int_pool_unknown_ids():
+    pool = IntPool()
+    pool.intern("1")
+
+    for literal in (1, -1):
+        with pytest.raises(IndexError):
+            pool.text(literal)
+        with pytest.raises(IndexError):
+            pool.value(literal)
+
+
+def test_int_pool_pickles():
+    pool = IntPool()
+    pool.value(pool.intern("7"))
+    pool.intern("9")
+
+    copy = pickle.loads(pickle.dumps(pool))
+    assert list(copy) == ["7", "9"]
+    assert copy.value(1) == 9
+    assert copy.intern("10") == 2
+
+
+def test_int_pool_from_threads():
+    pool = IntPool()
+    texts = [str(i) for i in range(2000)]
+
+    def intern_all(seed: int) -> list[int]:
+        order = texts[:]
+        random.Random(seed).shuffle(order)
+        for text in order:
+            pool.value(pool.intern(text))
+        return [pool.intern(text) for text in texts]
+
+    with ThreadPoolExecutor(max_workers=8) as threads:
+        results = list(threads.map(intern_all, range(8)))
+    assert all(ids == results[0] for ids in results)
+    assert sorted(results[0]) == list(range(len(texts)))
+    assert [pool.value(literal) for literal in results[0]] == list(range(2000))
+    assert pool.decoded() == len(texts)
+
+
+# ----
+# decode_int Tests
+# ----
+@pytest.mark.parametrize("size", [1, 639, 640, 641, 4300, 4301, 20_000])
+def test_decode_int_ignores_the_str_digits_limit(size):
+    digits = ("1234567890" * (size // 10 + 1))[:size]
+    limit = sys.get_int_max_str_digits()
+    sys.set_int_max_str_digits(0)
+    try:
+        expected = int(digits)
+    finally:
+        sys.set_int_max_str_digits(limit)
+
+    assert decode_int(digits) == expected
+
+
+def test_decode_int_keeps_leading_zeros_out_of_the_value():
+    assert decode_int("0" * 5000 + "12") == 12
+    assert decode_int("١٢") == 12  # Arabic-Indic digits, as Unicode mode lexes
+
+
+# ----
+# Pooled Scan Tests
+# ----
+def test_scan_pools_int_literals():
+    pool = IntPool()
+    source = "mask 255 width 8 255 + x"
+    buffer = scan(source, pool=pool)
+
+    for index, token in enumerate(buffer):
+        if token.kind is TokenKind.INT:
+            text = source[token.span.start : token.span.end]
+            assert pool.text(buffer.literal(index)) == text
+            assert buffer.value(index) == int(text)
+        else:
+            assert buffer.literal(index) == NO_LITERAL
+            assert buffer.value(index) is None
+    assert buffer.literal(1) == buffer.literal(4)
+    assert list(pool) == ["255", "8"]
+    assert pool.decoded() == 2
+
+
+def test_one_pool_shared_across_sources_and_with_a_table():
+    pool, table = IntPool(), SymbolTable()
+    first = scan("a 1 b 2", table, pool=pool)
+    second = scan("2 c 3", table, pool=pool)
+
+    assert list(first.literals) == [NO_LITERAL, 0, NO_LITERAL, 1, NO_LITERAL]
+    assert list(second.literals) == [1, NO_LITERAL, 2, NO_LITERAL]
+    assert list(second.symbols) == [-1, 2, -1, -1]
+    assert list(pool) == ["1", "2", "3"]
+
+
+def test_scan_without_pool_records_no_literals():
+    buffer = scan("1 2 3")
+
+    assert len(buffer.literals) == 0
+    assert buffer.literal(0) == NO_LITERAL
+    assert buffer.value(0) is None
+
+
+def test_pooled_scan_of_mapped_source_matches_str(tmp_path):
+    source = "x 12 y 34\n" * 2000
+    path = tmp_path / "big.mn"
+    path.write_text(source)
+    mapped = MappedSource.open(path, chunk_size=1000)
+    try:
+        assert scan(mapped, pool=IntPool()).literals == (
+            scan(source, pool=IntPool()).literals
+        )
+    finally:
+        mapped.close()
+
+
+def test_scan_bytes_pools_int_literals():
+    data = "é 10 x 20 10".encode()
+    pool = IntPool()
+    tokens = scan_bytes(data, pool=pool)
+
+    assert tokens.buffer.literals == scan(data.decode(), pool=IntPool()).literals
+    assert tokens.to_chars().value(1) == 10
+    assert list(pool) == ["10", "20"]
+
+
+def test_intern_literals_on_a_plain_buffer():
+    source = "a 5 b 6 5"
+    plain = scan(source)
+    pool = IntPool()
+
+    assert plain.intern_literals(source, pool).literals == (
+        scan(source, pool=IntPool()).literals
+    )
+
+
+def test_pooled_buffer_slices_and_caps_errors():
+    buffer = scan("1 $ 2 $ 3 $ 4", pool=IntPool(), max_errors=1)
+
+    assert buffer.kind(len(buffer) - 2) is TokenKind.ILLEGAL
+    assert len(buffer.literals) == len(buffer)
+    assert buffer[1:3].value(1) == 2
+
+
+def test_relex_keeps_literals_pooled():
+    pool = IntPool()
+    old = "a 1 b 2 c 3 d 4"
+    buffer = scan(old, pool=pool)
+    edit = Edit(4, 5, "77 e")
+    source = edit.apply(old)
+
+    updated = relex(buffer, source, edit)
+    assert updated.literals == scan(source, pool=pool).literals
+    assert updated.value(2) == 77
+    assert updated.value(4) == 2
+    assert "77" in pool
@@ -0,0 +1,117 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for memory-mapped, lazily decoded sources.
+
+A mapped source must behave exactly like the decoded ``str`` it stands for.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from mansa.lexer.mapped import MappedSource
+from mansa.lexer.stream import CharStream
+
+TEXT = "héllo wörld\nλ = 42\n𝔘nicode at chunk edges\n"
+
+
+def write(tmp_path: Path, text: str) -> Path:
+    path = tmp_path / "input.mansa"
+    path.write_bytes(text.encode("utf-8"))
+    return path
+
+
+# ----
+# MappedSource Tests
+# ----
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 4, 5, 7, 64 * 1024])
+def test_mapped_source_matches_str(tmp_path, chunk_size):
+    source = MappedSource.open(write(tmp_path, TEXT), chunk_size=chunk_size)
+
+    assert len(source) == len(TEXT)
+    assert "".join(source) == TEXT
+    assert [source[i] for i in range(len(TEXT))] == list(TEXT)
+    assert source[-1] == TEXT[-1]
+    assert source[3:17] == TEXT[3:17]
+    assert source[:] == TEXT
+    assert "".join(text for _, text in source.chunks()) == TEXT
+
+
+def test_mapped_source_rejects_empty_chunks():
+    with pytest.raises(ValueError):
+        MappedSource(b"abc", chunk_size=0)
+
+
+def test_mapped_source_chunk_offsets(tmp_path):
+    source = MappedSource.open(write(tmp_path, TEXT), chunk_size=5)
+
+    for offset, text in source.chunks():
+        assert TEXT[offset : offset + len(text)] == text
+
+
+def test_mapped_source_empty_file(tmp_path):
+    source = MappedSource.open(write(tmp_path, ""))
+
+    assert len(source) == 0
+    assert source[:] == ""
+    assert list(source.chunks()) == []
+
+
+def test_mapped_source_index_errors(tmp_path):
+    source = MappedSource.open(write(tmp_path, "abc"))
+
+    with pytest.raises(IndexError):
+        source[3]
+
+    with pytest.raises(ValueError):
+        source[::2]
+
+
+def test_mapped_source_invalid_utf8(tmp_path):
+    path = tmp_path / "bad.mansa"
+    path.write_bytes(b"ok \xff\xfe")
+
+    with pytest.raises(UnicodeDecodeError):
+        MappedSource.open(path)
+
+
+def test_mapped_source_view(tmp_path):
+    source = MappedSource.open(write(tmp_path, TEXT), chunk_size=4)
+    view = source.view()
+
+    assert view[:] == source[:] == TEXT
+    assert view[len(TEXT) - 1] == TEXT[-1] and source[0] == TEXT[0]
+    view.close()
+    assert source[:] == TEXT  # the view did not own the mapping
+    source.close()
+
+
+# ----
+# CharStream.from_path Tests
+# ----
+def test_char_stream_from_path_matches_str(tmp_path):
+    with CharStream.from_path(write(tmp_path, TEXT)) as stream:
+        assert list(stream) == list(CharStream(TEXT))
+        assert stream.sub(6, 11) == "wörld"
+
+
+def test_char_stream_from_path_advance(tmp_path):
+    expected = CharStream(TEXT)
+    with CharStream.from_path(write(tmp_path, TEXT)) as stream:
+        while not expected.is_eof():
+            assert stream.advance() == expected.advance()
+        assert stream.is_eof()
+        assert stream.advance() == expected.advance()
@@ -0,0 +1,146 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for the bulk tokenizer.
+
+``tokenize`` must produce exactly the tokens and spans of the reference
+lexer, on hand-picked edge cases and on random input.
+"""
+
+import random
+
+import pytest
+
+from mansa.lexer.lexer import Lexer
+from mansa.lexer.mapped import MappedSource
+from mansa.lexer.scanner import scan, tokenize
+from mansa.lexer.stream import CharStream
+from mansa.lexer.token import Span, Token, TokenKind
+from mansa.lexer.utf8 import scan_bytes
+
+EDGE_CASES = [
+    "",
+    "   ",
+    "\n\n\n",
+    "a",
+    "0",
+    "_",
+    "abc def",
+    "x1 1x 007",
+    "a+b*c",
+    "a++b -=- (){};",
+    "\0nul\0\0",
+    "héllo wörld",
+    "tab\tsep\r\nnext\n",
+    "trailing\n",
+    "\n  leading",
+    "ünïcödé 42 𝔘",
+]
+
+
+def reference(source: str) -> list[Token]:
+    return list(Lexer(CharStream(source)))
+
+
+def random_source(rng: random.Random, length: int) -> str:
+    alphabet = "abcXYZ_019 \t\r\n+-(){}é€𝔘"
+    return "".join(rng.choice(alphabet) for _ in range(length))
+
+
+# ----
+# tokenize Tests
+# ----
+@pytest.mark.parametrize("source", EDGE_CASES)
+def test_tokenize_matches_reference(source):
+    assert tokenize(source) == reference(source)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_tokenize_matches_reference_random(seed):
+    rng = random.Random(seed)
+    source = random_source(rng, rng.randrange(200))
+
+    assert tokenize(source) == reference(source)
+
+
+def test_tokenize_tokens_behave_like_constructed_tokens():
+    tokens = tokenize("abc")
+
+    assert tokens[0] == Token(tokens[0].kind, tokens[0].span)
+    assert hash(tokens[0]) == hash(Token(tokens[0].kind, tokens[0].span))
+    assert "IDENT" in repr(tokens[0])
+    with pytest.raises(AttributeError):
+        tokens[0].kind = tokens[1].kind  # type: ignore
+
+
+@pytest.mark.parametrize("chunk_size", [4, 5, 16])
+def test_scan_mapped_source_matches_str(tmp_path, chunk_size):
+    source = "identifier_spanning_chunks 1234567890 é$\nx  yy\n" * 3
+    path = tmp_path / "input.mansa"
+    path.write_bytes(source.encode("utf-8"))
+
+    mapped = MappedSource.open(path, chunk_size=chunk_size)
+    assert scan(mapped) == scan(source)
+
+
+# ----
+# max_errors Tests
+# ----
+def test_scan_max_errors_covers_the_rest_with_one_token():
+    tokens = tokenize("a $ b %% c\n# d", max_errors=1)
+
+    assert [t.kind for t in tokens] == [
+        TokenKind.IDENT,
+        TokenKind.ILLEGAL,
+        TokenKind.IDENT,
+        TokenKind.ILLEGAL,
+        TokenKind.EOF,
+    ]
+    assert tokens[3].span == Span(6, 14, 1, 7)
+    assert tokens[4].span == Span(14, 14, 2, 4)
+
+
+@pytest.mark.parametrize("max_errors", [0, 3, 10_000])
+def test_scan_max_errors_is_a_prefix_of_scan(max_errors):
+    source = "x1 $ 22 é€\n" * 50
+    full = scan(source)
+
+    capped = scan(source, max_errors=max_errors)
+    last = len(capped) - 2
+    if max_errors < full.count(TokenKind.ILLEGAL):
+        assert capped.count(TokenKind.ILLEGAL) == max_errors + 1
+        assert capped.ends[last] == len(source)
+        assert capped.kinds[:last] == full.kinds[:last]
+    else:
+        assert capped == full
+
+
+def test_negative_max_errors_is_rejected():
+    with pytest.raises(ValueError):
+        scan("x $ y", max_errors=-1)
+    with pytest.raises(ValueError):
+        scan("x $ y").cap_errors(-1)
+    with pytest.raises(ValueError):
+        scan_bytes(b"x $ y", max_errors=-1)
+
+
+@pytest.mark.parametrize("chunk_size", [4, 5, 16])
+def test_scan_mapped_source_max_errors_matches_str(tmp_path, chunk_size):
+    source = "ab $$ 12 é€ + 3\n" * 20
+    path = tmp_path / "input.mansa"
+    path.write_bytes(source.encode("utf-8"))
+
+    mapped = MappedSource.open(path, chunk_size=chunk_size)
+    assert scan(mapped, max_errors=7) == scan(source, max_errors=7)
@@ -0,0 +1,124 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for the SourceManager and its global offset space.
+"""
+
+import pickle
+
+import pytest
+
+from mansa.lexer.scanner import scan
+from mansa.lexer.sources import (
+    ERR_OFFSET_NOT_IN_SOURCES,
+    ERR_SPAN_TOO_LARGE,
+    Location,
+    SourceManager,
+    pack_span,
+    unpack_span,
+)
+from mansa.lexer.stream import CharStream
+from mansa.lexer.token import Span
+
+FIRST = "alpha\nbeta"
+SECOND = "x = 1\n\n  y"
+
+
+@pytest.fixture
+def manager() -> SourceManager:
+    manager = SourceManager()
+    manager.add("first.mansa", CharStream(FIRST))
+    manager.add("second.mansa", CharStream(SECOND))
+    return manager
+
+
+# ----
+# pack_span Tests
+# ----
+def test_pack_span_round_trip():
+    assert unpack_span(pack_span(0, 0)) == (0, 0)
+    assert unpack_span(pack_span(123_456_789, 123_456_800)) == (
+        123_456_789,
+        123_456_800,
+    )
+
+
+def test_pack_span_rejects_bad_ranges():
+    with pytest.raises(ValueError) as exc_info:
+        pack_span(5, 4)
+    assert exc_info.value is ERR_SPAN_TOO_LARGE
+    with pytest.raises(ValueError):
+        pack_span(0, 1 << 32)
+
+
+# ----
+# SourceManager Tests
+# ----
+def test_files_follow_each_other(manager):
+    first, second = manager
+
+    assert (first.id, first.base, first.end) == (0, 0, 10)
+    assert (second.id, second.base, second.end) == (1, 11, 21)
+    assert manager[1] is second
+    assert len(manager) == 2
+
+
+def test_file_of_offset(manager):
+    first, second = manager
+
+    assert manager.file(0) is first
+    assert manager.file(10) is first  # its EOF
+    assert manager.file(11) is second
+    assert manager.file(21) is second
+    with pytest.raises(IndexError) as exc_info:
+        manager.file(22)
+    assert exc_info.value is ERR_OFFSET_NOT_IN_SOURCES
+
+
+def test_locate(manager):
+    first, second = manager
+
+    assert manager.locate(7) == Location(first, 2, 2)
+    assert manager.locate(11) == Location(second, 1, 1)
+    assert manager.locate(20) == Location(second, 3, 3)
+
+
+def test_span_and_text(manager):
+    second = manager[1]
+
+    assert manager.span(15, 16) == (second, Span(4, 5, 1, 5))
+    assert manager.text(15, 16) == "1"
+    assert manager.text(0, 5) == "alpha"
+
+
+def test_pack_tokens_resolves_to_token_spans(manager):
+    second = manager[1]
+    buffer = scan(SECOND)
+
+    packed = manager.pack(second, buffer)
+    assert packed.itemsize == 8
+    assert [manager.unpack(p) for p in packed] == [(second, t.span) for t in buffer]
+    assert pickle.loads(pickle.dumps(packed)) == packed
+
+
+def test_open_maps_files(tmp_path):
+    path = tmp_path / "a.mansa"
+    path.write_text("héllo\nwörld")
+
+    with SourceManager() as manager:
+        file = manager.open(path)
+        assert file.name == str(path)
+        assert manager.locate(8) == Location(file, 2, 3)
+        assert manager.text(6, 11) == "wörld"
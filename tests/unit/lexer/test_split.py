@@ -0,0 +1,158 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for lexing one source in pieces.
+
+However a source is cut, the joined tokens must equal ``scan_bytes`` of
+the whole of it, down to lines and the UTF-8 index.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from mansa.lexer.batch import lex_file
+from mansa.lexer.split import (
+    Piece,
+    _scan_piece,
+    _scan_range,
+    join_pieces,
+    scan_split,
+    split_points,
+)
+from mansa.lexer.utf8 import BOM, scan_bytes
+
+SOURCES = {
+    "ascii": b"let x = 42\nfoo_bar $ 7\n" * 50,
+    "non-ascii": "café = λ + 1\n東京 €€ x\n".encode() * 50,
+    "invalid utf-8": b"a \xff\xfe b\n\xc3 c\r\n" * 50,
+    "bom": BOM + "é x\n".encode() * 50,
+    "no newlines": b"a $ " * 200,
+}
+
+
+def write(tmp_path: Path, data: bytes) -> str:
+    path = tmp_path / "big.mansa"
+    path.write_bytes(data)
+    return str(path)
+
+
+# ----
+# split_points Tests
+# ----
+def test_split_points_cut_after_newlines():
+    data = b"aaaa bbbb\ncccc dddd\neeee\n"
+
+    assert split_points(data, 2) == [0, 20, len(data)]
+
+
+def test_split_points_fall_back_to_any_whitespace():
+    data = b"aaaa bbbb cccc"
+
+    assert split_points(data, 2) == [0, 10, len(data)]
+
+
+def test_split_points_without_whitespace():
+    assert split_points(b"a" * 100, 4) == [0, 100]
+
+
+def test_split_points_skip_bom():
+    data = BOM + b"x y\n" * 10
+
+    points = split_points(data, 3)
+    assert points[0] == len(BOM) and points[-1] == len(data)
+    assert all(data[point - 1 : point] in b" \t\r\n" for point in points[1:-1])
+
+
+# ----
+# join_pieces / scan_split Tests
+# ----
+@pytest.mark.parametrize("name", SOURCES)
+@pytest.mark.parametrize("pieces", [1, 2, 7, 50])
+def test_join_pieces_matches_scan_bytes(tmp_path, name, pieces):
+    data = SOURCES[name]
+    path = write(tmp_path, data)
+    points = split_points(data, pieces)
+
+    joined = join_pieces(
+        data, list(map(_scan_piece, [path] * pieces, points, points[1:]))
+    )
+
+    assert joined == scan_bytes(data)
+    assert joined.tokens() == scan_bytes(data).tokens()
+
+
+@pytest.mark.parametrize("name", SOURCES)
+def test_scan_split_matches_scan_bytes(tmp_path, name):
+    data = SOURCES[name]
+    path = write(tmp_path, data)
+
+    assert scan_split(path, jobs=2, min_piece=64) == scan_bytes(data)
+
+
+@pytest.mark.parametrize("name", SOURCES)
+def test_scan_split_on_threads(tmp_path, name):
+    data = SOURCES[name]
+    path = write(tmp_path, data)
+
+    assert scan_split(path, 3, min_piece=64, threads=True) == scan_bytes(data)
+
+
+def test_scan_split_max_errors(tmp_path):
+    data = SOURCES["invalid utf-8"]
+    path = write(tmp_path, data)
+
+    for max_errors in (0, 3, 10_000):
+        expected = scan_bytes(data, max_errors=max_errors)
+        assert scan_split(path, 2, max_errors, min_piece=64) == expected
+
+
+@pytest.mark.parametrize("threads", [False, True])
+def test_scan_split_max_errors_stops_early(tmp_path, threads):
+    data = b"$ x\n" * 1000
+    path = write(tmp_path, data)
+
+    tokens = scan_split(path, 2, 0, min_piece=64, threads=threads)
+    assert tokens == scan_bytes(data, max_errors=0)
+
+
+def test_scan_split_max_errors_leaves_later_pieces_unlexed(tmp_path, monkeypatch):
+    data = b"$ x\n" * 1000
+    path = write(tmp_path, data)
+    scanned = []
+
+    def scan_range(data: bytes, start: int, stop: int) -> Piece:
+        scanned.append(start)
+        return _scan_range(data, start, stop)
+
+    monkeypatch.setattr("mansa.lexer.split._scan_range", scan_range)
+    tokens = scan_split(path, 2, 0, min_piece=64, threads=True)
+    assert tokens == scan_bytes(data, max_errors=0)
+    # Of 8 pieces, only those in flight when the first came back (2 per
+    # worker) may have been lexed.
+    assert len(scanned) <= 4
+
+
+def test_scan_split_small_file_is_lexed_whole(tmp_path):
+    path = write(tmp_path, b"x y\n")
+
+    assert scan_split(path, jobs=4) == scan_bytes(b"x y\n")
+
+
+def test_lex_file_with_jobs(tmp_path, monkeypatch):
+    monkeypatch.setattr("mansa.lexer.split.MIN_PIECE", 64)
+    path = write(tmp_path, SOURCES["non-ascii"])
+
+    assert lex_file(path, jobs=2) == lex_file(path)
@@ -18,8 +18,12 @@ Unit tests for the source character stream with position tracking.
 These are essential for accurate lexing and error reporting.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
-from mansa.lexer.stream import CharStream, EOF as StreamEOF, Position
+from mansa.lexer.lexer import Lexer
+from mansa.lexer.stream import CharStream, EOF as StreamEOF, Position, SourceText
+from mansa.lexer.token import Span
 
 
 # ----
@@ -146,6 +150,192 @@ def test_char_stream_substring_out_of_bounds():
         stream.sub(4, 2)
 
 
+def test_char_stream_does_not_copy_source():
+    source = "hello world" * 10
+    stream = CharStream(source)
+
+    assert stream.source is source
+    assert not hasattr(stream, "chars")
+    assert "".join(ch for _, ch, _ in stream)[:-1] == source
+
+
+# ----
+# Bulk cursor Tests
+# ----
+def test_char_stream_take_while():
+    stream = CharStream("12345abc\n  x")
+
+    assert stream.take_while("0123456789") == ("12345", Span(0, 5, 1, 1))
+    assert stream.current_index == 5
+    assert stream.take_while(frozenset("abc")) == ("abc", Span(5, 8, 1, 6))
+    assert stream.take_while("0123456789") == ("", Span(8, 8, 1, 9))
+    assert stream.current_index == 8
+
+
+def test_char_stream_skip_while_updates_line_and_column():
+    stream = CharStream("a \n\t\n  b")
+    stream.advance()
+
+    assert stream.skip_while(" \t\r\n") == Span(1, 7, 1, 2)
+    assert (stream.line, stream.column) == (3, 3)
+    assert stream.advance()[1] == "b"
+    assert stream.skip_while(" ") == Span(8, 8, 3, 4)
+    assert stream.is_eof()
+
+
+def test_char_stream_skip_until():
+    stream = CharStream("+-é\n x")
+
+    assert stream.skip_until(" \n") == Span(0, 3, 1, 1)
+    assert stream.skip_until("\n") == Span(3, 3, 1, 4)
+    stream.advance()
+    assert stream.skip_until("z") == Span(4, 6, 2, 1)
+    assert stream.is_eof()
+
+
+def test_char_stream_runs_of_no_chars():
+    stream = CharStream("ab\nc")
+
+    assert stream.skip_while("") == Span(0, 0, 1, 1)
+    assert stream.take_while(frozenset()) == ("", Span(0, 0, 1, 1))
+    assert stream.skip_until("") == Span(0, 4, 1, 1)
+    assert stream.is_eof()
+
+
+def test_char_stream_nul_is_not_eof():
+    stream = CharStream("a\0b")
+
+    assert [stream.advance()[1] for _ in range(4)] == ["a", "\0", "b", StreamEOF]
+    assert stream.is_eof()
+    assert stream.current_index == 3
+
+
+def test_char_stream_class_with_special_characters():
+    stream = CharStream("]-^\\x")
+
+    assert stream.take_while("\\^-]") == ("]-^\\", Span(0, 4, 1, 1))
+
+
+def test_char_stream_match_prefix():
+    stream = CharStream("let x\nlet")
+
+    assert stream.match_prefix("lex") is None
+    assert stream.current_index == 0
+    assert stream.match_prefix("let") == Span(0, 3, 1, 1)
+    assert stream.match_prefix(" x\n") == Span(3, 6, 1, 4)
+    assert (stream.line, stream.column) == (2, 1)
+    assert stream.match_prefix("letter") is None
+    assert stream.match_prefix("let") == Span(6, 9, 2, 1)
+    assert stream.is_eof()
+
+
+def test_char_stream_bulk_over_mapped_source(tmp_path, monkeypatch):
+    monkeypatch.setattr("mansa.lexer.stream._RUN_WINDOW", 3)
+    source = "identifier_é 123456789\n\n   tail"
+    path = tmp_path / "input.mansa"
+    path.write_text(source, encoding="utf-8")
+
+    with CharStream.from_path(path) as mapped:
+        plain = CharStream(source)
+        for step in ("\\w", " \n", "0123456789", " \n", "\\w"):
+            chars = frozenset("abcdefghijklmnopqrstuvwxyz_é" if step == "\\w" else step)
+            assert mapped.take_while(chars) == plain.take_while(chars)
+            assert mapped.current_index == plain.current_index
+        assert mapped.is_eof()
+
+
+# ----
+# Lookahead and backtracking Tests
+# ----
+def test_char_stream_peek_ahead():
+    stream = CharStream("ab\ncd")
+    stream.advance()
+
+    assert stream.peek(1) == stream.peek() == (1, "b", Position(1, 2, 1, 2))
+    assert stream.peek(3) == (3, "c", Position(3, 4, 2, 1))
+    assert stream.peek(9) == (5, StreamEOF, Position(5, 5, 2, 3))
+    assert stream.current_index == 1 and stream.line == 1 and stream.column == 2
+    with pytest.raises(ValueError):
+        stream.peek(0)
+
+
+def test_char_stream_peek_str():
+    stream = CharStream("let x")
+
+    assert stream.peek_str(3) == "let"
+    assert stream.peek_str(0) == ""
+    assert stream.peek_str(99) == "let x"
+    assert stream.current_index == 0
+    with pytest.raises(ValueError):
+        stream.peek_str(-1)
+
+
+def test_char_stream_mark_and_reset():
+    stream = CharStream("one\ntwo three\nfour")
+    stream.skip_while("one\n")
+    mark = stream.mark()
+
+    assert (mark.offset, mark.line, mark.column) == (4, 2, 1)
+    stream.skip_until("\0")
+    assert (stream.line, stream.column) == (3, 5)
+
+    stream.reset(mark)
+    assert (stream.current_index, stream.line, stream.column) == (4, 2, 1)
+    assert stream.advance() == (4, "t", Position(4, 5, 2, 1))
+
+    # A mark can also be restored forward, and more than once.
+    end = CharStream("one\ntwo three\nfour")
+    end.skip_until("\0")
+    stream.reset(end.mark())
+    assert stream.is_eof() and (stream.line, stream.column) == (3, 5)
+    stream.reset(mark)
+    assert stream.peek_str(3) == "two"
+
+
+def test_char_stream_mark_over_mapped_source(tmp_path):
+    path = tmp_path / "input.mansa"
+    path.write_text("é\nλx", encoding="utf-8")
+
+    with CharStream.from_path(path) as stream:
+        stream.advance()
+        mark = stream.mark()
+        assert stream.peek_str(3) == "\nλx"
+        assert stream.peek(2) == (2, "λ", Position(2, 3, 2, 1))
+        stream.skip_until("x")
+        stream.reset(mark)
+        assert stream.advance() == (1, "\n", Position(1, 2, 1, 2))
+
+
+# ----
+# SourceText Tests
+# ----
+def test_source_text_cursors_are_independent():
+    text = SourceText.of("ab\ncd")
+    first, second = text.cursor(), text.cursor()
+
+    first.skip_until("d")
+    assert (first.line, first.column) == (2, 2)
+    assert second.advance() == (0, "a", Position(0, 1, 1, 1))
+    assert first.lines is second.lines is text.lines
+    assert len(text) == 5
+
+
+def test_source_text_rejects_other_types():
+    with pytest.raises(TypeError):
+        SourceText.of(b"bytes")  # type: ignore[arg-type]
+
+
+def test_source_text_shared_between_threads(tmp_path):
+    source = "let x = 1\n\t$ y 22\n" * 200
+    path = tmp_path / "input.mansa"
+    path.write_text(source, encoding="utf-8")
+    expected = list(Lexer(CharStream(source)))
+
+    with SourceText.open(path) as text, ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda _: list(Lexer(text.cursor())), range(8)))
+    assert results == [expected] * 8
+
+
 # ----
 # Position Tests
 # ----
@@ -0,0 +1,215 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for lexing sources that arrive in chunks.
+
+Whatever the chunking, streamed tokens must equal ``tokenize`` on the
+whole text, including tokens and ``\\r\\n`` split across chunks.
+"""
+
+import io
+import random
+import tracemalloc
+from collections.abc import Iterator
+
+import pytest
+
+from mansa.lexer.lexer import Lexer
+from mansa.lexer.scanner import tokenize
+from mansa.lexer.stream import EOF, CharStream
+from mansa.lexer.streaming import (
+    ChunkedCharStream,
+    StreamTokenizer,
+    iter_chunks,
+    tokenize_stream,
+)
+from mansa.lexer.symbols import SymbolTable
+from mansa.lexer.token import Span
+
+SOURCE = "alpha_beta 12345\r\nx+y\n\n  héllo 𝔘 007\r\n_tail"
+
+
+def split(text: str, rng: random.Random) -> list[str]:
+    chunks = []
+    while text:
+        size = rng.randrange(0, 6)  # empty chunks included
+        chunks.append(text[:size])
+        text = text[size:]
+    return chunks
+
+
+# ----
+# iter_chunks Tests
+# ----
+def test_iter_chunks_reads_files_in_fixed_sizes():
+    assert list(iter_chunks(io.StringIO("abcdefg"), 3)) == ["abc", "def", "g"]
+
+
+def test_iter_chunks_skips_empty_chunks():
+    assert list(iter_chunks(["", "ab", "", "c"])) == ["ab", "c"]
+
+
+# ----
+# tokenize_stream Tests
+# ----
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 1000])
+def test_tokenize_stream_matches_tokenize(size):
+    chunks = [SOURCE[i : i + size] for i in range(0, len(SOURCE), size)]
+
+    assert list(tokenize_stream(chunks)) == tokenize(SOURCE)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_tokenize_stream_random_chunks(seed):
+    rng = random.Random(seed)
+    alphabet = "abcXYZ_019 \t\r\n+-(){}é€𝔘"
+    source = "".join(rng.choice(alphabet) for _ in range(rng.randrange(200)))
+
+    assert list(tokenize_stream(split(source, rng))) == tokenize(source)
+
+
+@pytest.mark.parametrize("long", ["a" * 5000, "9" * 5000, "9" * 2500 + "z" * 2500])
+def test_tokenize_stream_tokens_spanning_many_chunks(long):
+    source = f"x {long} {long}+\n{long}"
+    chunks = [source[i : i + 7] for i in range(0, len(source), 7)]
+
+    assert list(tokenize_stream(chunks)) == tokenize(source)
+
+
+def test_tokenize_stream_interns_identifiers():
+    table, expected = SymbolTable(), SymbolTable()
+    chunks = [SOURCE[i : i + 3] for i in range(0, len(SOURCE), 3)]
+
+    tokens = list(tokenize_stream(chunks, table=table))
+    assert [t.symbol for t in tokens] == [t.symbol for t in tokenize(SOURCE, expected)]
+    assert list(table) == list(expected)
+
+
+def test_tokenize_stream_file_object():
+    assert list(tokenize_stream(io.StringIO(SOURCE), 4)) == tokenize(SOURCE)
+
+
+def test_tokenize_stream_empty():
+    assert list(tokenize_stream([])) == tokenize("")
+
+
+def test_stream_tokenizer_holds_back_unfinished_tokens():
+    tokenizer = StreamTokenizer()
+
+    assert tokenizer.feed("abc 12") == tokenize("abc")[:1]
+    assert tokenizer.feed("34") == []
+    assert [t.span.start for t in tokenizer.feed(" x")] == [4]
+    assert [t.span.start for t in tokenizer.finish()] == [9, 10]
+
+
+def test_tokenize_stream_memory_is_flat():
+    line = "let value_42 = other_name + 12345\n"
+
+    def chunks(count: int) -> Iterator[str]:
+        for _ in range(count):
+            yield line * 30
+
+    def peak(count: int) -> int:
+        tracemalloc.start()
+        try:
+            for _ in tokenize_stream(chunks(count)):
+                pass
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    small, large = peak(5), peak(50)  # 5 KB vs 51 KB of source
+    assert large < small * 2
+
+
+# ----
+# ChunkedCharStream Tests
+# ----
+@pytest.mark.parametrize("size", [1, 3, 1000])
+def test_chunked_stream_iterates_like_char_stream(size):
+    chunks = [SOURCE[i : i + size] for i in range(0, len(SOURCE), size)]
+
+    assert list(ChunkedCharStream(chunks)) == list(CharStream(SOURCE))
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_lexer_over_chunked_stream_matches_tokenize(seed):
+    rng = random.Random(seed)
+
+    stream = ChunkedCharStream(split(SOURCE, rng))
+    assert list(Lexer(stream)) == tokenize(SOURCE)
+
+
+def test_chunked_stream_tracks_lines_across_chunks():
+    stream = ChunkedCharStream(["ab\r", "\ncd"])
+    for _ in range(4):
+        stream.advance()
+
+    assert (stream.line, stream.column) == (2, 1)
+    assert stream.span(4, 6).line == 2
+    with pytest.raises(ValueError):
+        stream.span(1, 2)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_chunked_stream_bulk_cursor_matches_char_stream(seed):
+    rng = random.Random(seed)
+    classes = ["abcdefghijklmnopqrstuvwxyz_", " \t\r\n", "0123456789", "+"]
+    plain, chunked = CharStream(SOURCE), ChunkedCharStream(split(SOURCE, rng))
+
+    while not plain.is_eof():
+        step = rng.randrange(4)
+        if step == 0:
+            chars = frozenset(rng.choice(classes))
+            assert chunked.take_while(chars) == plain.take_while(chars)
+        elif step == 1:
+            chars = frozenset(rng.choice(classes))
+            assert chunked.skip_while(chars) == plain.skip_while(chars)
+        elif step == 2:
+            start = plain.current_index
+            prefix = SOURCE[start : start + rng.randrange(1, 8)]
+            if rng.random() < 0.3:
+                prefix += "?"
+            assert chunked.match_prefix(prefix) == plain.match_prefix(prefix)
+        else:
+            assert chunked.advance() == plain.advance()
+        assert chunked.current_index == plain.current_index
+        assert (chunked.line, chunked.column) == (plain.line, plain.column)
+    assert chunked.is_eof()
+
+
+def test_chunked_stream_nul_is_not_eof():
+    stream = ChunkedCharStream(["a\0", "b"])
+
+    assert [stream.advance()[1] for _ in range(4)] == ["a", "\0", "b", EOF]
+    assert stream.is_eof()
+    assert stream.current_index == 3
+
+
+def test_chunked_stream_runs_of_no_chars():
+    stream = ChunkedCharStream(["ab", "\nc"])
+
+    assert stream.skip_while("") == Span(0, 0, 1, 1)
+    assert stream.skip_until("") == Span(0, 4, 1, 1)
+    assert stream.is_eof()
+
+
+def test_chunked_stream_skip_until_crosses_chunks():
+    stream = ChunkedCharStream(["+-", "é$", "\n x"])
+
+    assert stream.skip_until(" \n") == Span(0, 4, 1, 1)
+    assert stream.advance()[1] == "\n"
+    assert stream.skip_until("x") == Span(5, 6, 2, 1)
+    assert stream.advance()[1] == "x"
@@ -0,0 +1,124 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for the identifier symbol table.
+"""
+
+import pickle
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from mansa.lexer.scanner import scan, tokenize
+from mansa.lexer.symbols import SymbolTable
+from mansa.lexer.token import NO_SYMBOL, TokenKind
+
+
+# ----
+# SymbolTable Tests
+# ----
+def test_symbol_table_interns_in_order_of_first_use():
+    table = SymbolTable()
+
+    assert [table.intern(name) for name in ["b", "a", "b", "c", "a"]] == [
+        0,
+        1,
+        0,
+        2,
+        1,
+    ]
+    assert list(table) == ["b", "a", "c"]
+    assert len(table) == 3
+
+
+def test_symbol_table_lookup_and_name():
+    table = SymbolTable()
+    symbol = table.intern("value")
+
+    assert table.lookup("value") == symbol
+    assert table.lookup("other") is None
+    assert "value" in table
+    assert "other" not in table
+    assert table.name(symbol) == "value"
+    with pytest.raises(IndexError):
+        table.name(1)
+    with pytest.raises(IndexError):
+        table.name(-1)
+
+
+def test_symbol_table_pickles():
+    table = SymbolTable()
+    table.intern("x")
+    table.intern("y")
+
+    copy = pickle.loads(pickle.dumps(table))
+    assert list(copy) == ["x", "y"]
+    assert copy.intern("y") == 1
+    assert copy.intern("z") == 2
+
+
+def test_symbol_table_interns_from_threads():
+    table = SymbolTable()
+    names = [f"name{i}" for i in range(2000)]
+
+    def intern_all(seed: int) -> list[int]:
+        order = names[:]
+        random.Random(seed).shuffle(order)
+        for name in order:
+            table.intern(name)
+        return [table.intern(name) for name in names]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(intern_all, range(8)))
+    assert all(ids == results[0] for ids in results)
+    assert sorted(results[0]) == list(range(len(names)))
+    assert [table.name(symbol) for symbol in results[0]] == names
+
+
+# ----
+# Interning Tests
+# ----
+def test_tokenize_interns_identifiers():
+    table = SymbolTable()
+    source = "alpha beta 1 alpha + beta"
+    tokens = tokenize(source, table)
+
+    for token in tokens:
+        if token.kind is TokenKind.IDENT:
+            text = source[token.span.start : token.span.end]
+            assert table.name(token.symbol) == text
+        else:
+            assert token.symbol == NO_SYMBOL
+    assert tokens[0].symbol == tokens[3].symbol
+    assert tokens[0] == tokenize(source)[0]  # symbols do not affect equality
+
+
+def test_one_table_shared_across_sources():
+    table = SymbolTable()
+    first = scan("main helper", table)
+    second = scan("helper main other", table)
+
+    assert list(first.symbols) == [0, 1, NO_SYMBOL]
+    assert list(second.symbols) == [1, 0, 2, NO_SYMBOL]
+    assert list(table) == ["main", "helper", "other"]
+
+
+def test_scan_without_table_records_no_symbols():
+    buffer = scan("alpha beta")
+
+    assert len(buffer.symbols) == 0
+    assert buffer.symbol(0) == NO_SYMBOL
+    assert all(token.symbol == NO_SYMBOL for token in buffer)
@@ -23,7 +23,7 @@ They must be 100% correct, fast, and memory-efficient.
 """
 
 import pytest
-from mansa.lexer.token import Span, TokenKind, Token
+from mansa.lexer.token import Span, TokenKind, Token, NO_SYMBOL
 
 
 # ----
@@ -148,6 +148,17 @@ def test_token_can_be_used_in_sets():
     assert t3 in token_set
 
 
+def test_token_symbol_defaults_and_is_not_compared():
+    span = Span(0, 2, 1, 1)
+    plain = Token(TokenKind.IDENT, span)
+    interned = Token(TokenKind.IDENT, span, symbol=7)
+
+    assert plain.symbol == NO_SYMBOL
+    assert interned.symbol == 7
+    assert plain == interned
+    assert hash(plain) == hash(interned)
+
+
 def test_token_static_methods():
     span = Span(0, 0, 1, 1)
     eof_token = Token.eof(span)
@@ -0,0 +1,120 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for the trivia side table.
+
+Tokens and trivia must cover the source end to end, so it can be rebuilt
+exactly from them.
+"""
+
+import random
+from itertools import pairwise
+
+import pytest
+
+from mansa.lexer.literals import IntPool
+from mansa.lexer.scanner import scan
+from mansa.lexer.symbols import SymbolTable
+from mansa.lexer.token import TokenKind
+from mansa.lexer.trivia import Trivia, scan_trivia
+
+SOURCES = [
+    "",
+    "   ",
+    "a",
+    "a  \n\tb 12 $ ",
+    "\n\n  x\r\n\t é ü\n  y $ z\n",
+    "+-x\n\n",
+]
+
+
+def entries(trivia: Trivia, source: str) -> list[tuple[str, int]]:
+    return [
+        (source[trivia.starts[i] : trivia.ends[i]], trivia.tokens[i])
+        for i in range(len(trivia))
+    ]
+
+
+# ----
+# Trivia Tests
+# ----
+def test_trivia_entries_lead_the_next_token():
+    source = "a  b\n\t12 c"
+    buffer, trivia = scan_trivia(source)
+
+    assert entries(trivia, source) == [("  ", 1), ("\n\t", 2), (" ", 3)]
+    assert buffer == scan(source)
+    assert trivia.leading(0) == range(0)
+    assert trivia.leading(1) == range(1)
+    assert trivia.leading(3) == range(2, 3)
+
+
+def test_trailing_trivia_lead_eof():
+    source = "x $ \n"
+    buffer, trivia = scan_trivia(source)
+
+    eof = len(buffer) - 1
+    assert buffer.kind(eof) is TokenKind.EOF
+    assert [source[trivia.starts[i] : trivia.ends[i]] for i in trivia.leading(eof)] == [
+        " \n"
+    ]
+
+
+@pytest.mark.parametrize("source", SOURCES)
+def test_rebuild_gives_back_the_source(source):
+    buffer, trivia = scan_trivia(source)
+
+    pieces = trivia.pieces(buffer)
+    assert all(a[1] == b[0] for a, b in pairwise(pieces))
+    assert trivia.rebuild(buffer, source) == source
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_rebuild_gives_back_the_source_random(seed):
+    rng = random.Random(seed)
+    alphabet = "ab_19 \t\r\n+$é"
+    source = "".join(rng.choice(alphabet) for _ in range(rng.randrange(200)))
+    buffer, trivia = scan_trivia(source)
+
+    assert trivia.rebuild(buffer, source) == source
+    assert buffer == scan(source)
+    assert Trivia.of(buffer, source) == trivia
+
+
+@pytest.mark.parametrize("source", SOURCES)
+def test_trivia_of_matches_scan_trivia(source):
+    _, trivia = scan_trivia(source)
+
+    assert Trivia.of(scan(source), source) == trivia
+
+
+def test_scan_trivia_interns_like_scan():
+    source = "a 1 b 2\nc 1 a"
+    table, pool = SymbolTable(), IntPool()
+    buffer, _ = scan_trivia(source, table, pool)
+
+    expected = scan(source, SymbolTable(), pool=IntPool())
+    assert buffer.symbols == expected.symbols
+    assert buffer.literals == expected.literals
+
+
+@pytest.mark.parametrize("max_errors", [0, 1, 2])
+def test_trivia_of_capped_buffer(max_errors):
+    source = "$ a x\n$ b $ c y\n"
+    buffer = scan(source, max_errors=max_errors)
+    trivia = Trivia.of(buffer, source)
+
+    assert trivia.rebuild(buffer, source) == source
+    assert max(trivia.ends, default=0) <= buffer.starts[-2]
@@ -0,0 +1,182 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for byte-oriented lexing of UTF-8 sources.
+
+``scan_bytes`` must agree with ``scan`` of the decoded text once its byte
+offsets are converted to code points.
+"""
+
+import mmap
+import random
+
+import pytest
+
+from mansa.lexer.scanner import scan
+from mansa.lexer.symbols import SymbolTable
+from mansa.lexer.token import Span, TokenKind
+from mansa.lexer.utf8 import BINARY_PREFIX, BOM, Utf8Index, looks_binary, scan_bytes
+
+EDGE_CASES = [
+    b"",
+    b"   \n\n",
+    b"abc def 42",
+    b"tab\tsep\r\nnext\n",
+    "héllo wörld € 𝔘 42".encode(),
+    BOM + b"bom first",
+    BOM,
+    b"mid" + BOM + b"dle",
+    b"\xff\xfe lone bytes",
+    b"cut \xe2\x82",
+    b"cut \xf0\x9f\x98",
+    b"surrogate \xed\xa0\x80",
+    b"overlong \xc0\xaf",
+    b"nul \x00 byte",
+]
+
+# Whole UTF-8 pieces, valid and not, to build random sources from.
+PIECES = [
+    b"a", b"Z", b"_", b"9", b" ", b"\n", b"\t", b"$", b"\xc3\xa9",
+    b"\xe2\x82\xac", b"\xf0\x9f\x98\x80", b"\xff", b"\x80", b"\xe2\x82",
+    b"\xf0\x9f", b"\xed\xa0\x80", b"\xc0\xaf", BOM,
+]  # fmt: skip
+
+
+def decoded(data: bytes) -> str:
+    return data.decode("utf-8-sig", "replace")
+
+
+# ----
+# scan_bytes Tests
+# ----
+@pytest.mark.parametrize("data", EDGE_CASES)
+def test_scan_bytes_matches_scan(data):
+    tokens = scan_bytes(data)
+
+    assert tokens.to_chars() == scan(decoded(data))
+    assert tokens.tokens() == scan(decoded(data)).tokens()
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_scan_bytes_matches_scan_random(seed):
+    rng = random.Random(seed)
+    data = b"".join(rng.choice(PIECES) for _ in range(rng.randrange(100)))
+
+    assert scan_bytes(data).to_chars() == scan(decoded(data))
+
+
+def test_scan_bytes_uses_byte_offsets():
+    buffer = scan_bytes("é x".encode()).buffer
+
+    assert list(buffer.starts) == [0, 3, 4]
+    assert list(buffer.ends) == [2, 4, 4]
+
+
+def test_scan_bytes_span_in_code_points():
+    tokens = scan_bytes("ab\n€€ x".encode())
+
+    assert tokens.span(1) == Span(3, 5, 2, 1)
+    assert tokens.buffer.kind(2) is TokenKind.IDENT
+    assert tokens.span(2) == Span(6, 7, 2, 4)
+
+
+def test_scan_bytes_skips_bom():
+    tokens = scan_bytes(BOM + b"x")
+
+    assert tokens.buffer.starts[0] == 3
+    assert tokens.span(0) == Span(0, 1, 1, 1)
+
+
+@pytest.mark.parametrize(
+    ("data", "width"),
+    [(b"\xff", 1), (b"\xe2\x82", 2), (b"\xf0\x9f\x98", 3), (b"\xed", 1)],
+)
+def test_scan_bytes_invalid_sequence_is_illegal(data, width):
+    buffer = scan_bytes(data + b" x").buffer
+
+    assert buffer.kind(0) is TokenKind.ILLEGAL
+    assert (buffer.starts[0], buffer.ends[0]) == (0, width)
+    assert buffer.kind(1) is TokenKind.IDENT
+
+
+def test_scan_bytes_accepts_memoryview_and_mmap(tmp_path):
+    data = "héllo 42\n$".encode()
+    path = tmp_path / "input.mansa"
+    path.write_bytes(data)
+
+    expected = scan_bytes(data)
+    assert scan_bytes(memoryview(data)) == expected
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        assert scan_bytes(m) == expected
+
+
+def test_scan_bytes_interns_identifiers():
+    data = "é alpha beta alpha".encode()
+    table = SymbolTable()
+
+    buffer = scan_bytes(data, table).to_chars()
+    assert buffer.symbols == scan(decoded(data), SymbolTable()).symbols
+    assert list(table) == ["alpha", "beta"]
+
+
+# ----
+# Utf8Index Tests
+# ----
+def test_ascii_index_is_empty():
+    utf8 = scan_bytes(b"plain ascii 1").utf8
+
+    assert not utf8.marks
+    assert utf8.char_offset(5) == 5
+
+
+@pytest.mark.parametrize("max_errors", [None, 1])
+def test_index_from_buffer_matches_scan(max_errors):
+    data = BOM + "héllo € 𝔘 \xff".encode() + b"\xe2\x82 x\n\xc3\xa9 $"
+    tokens = scan_bytes(data, max_errors=max_errors)
+
+    assert Utf8Index.from_buffer(tokens.buffer, data) == tokens.utf8
+
+
+# ----
+# max_errors Tests
+# ----
+@pytest.mark.parametrize("max_errors", [0, 1, 5, 1000])
+@pytest.mark.parametrize("seed", range(5))
+def test_scan_bytes_max_errors_matches_scan(seed, max_errors):
+    rng = random.Random(seed)
+    data = b"".join(rng.choice(PIECES) for _ in range(rng.randrange(300)))
+
+    tokens = scan_bytes(data, max_errors=max_errors)
+    expected = scan(decoded(data), max_errors=max_errors)
+    assert tokens.to_chars() == expected
+    assert tokens.tokens() == expected.tokens()
+
+
+def test_scan_bytes_max_errors_across_windows():
+    # Long tokens and runs straddle the 64 KiB windows of a capped scan.
+    data = ("ident_" * 5000 + " 1234567 é€ $ \n").encode() * 30
+
+    tokens = scan_bytes(data, max_errors=40)
+    assert tokens.to_chars() == scan(decoded(data), max_errors=40)
+    assert tokens.buffer.count(TokenKind.ILLEGAL) == 41
+
+
+# ----
+# looks_binary Tests
+# ----
+def test_looks_binary():
+    assert looks_binary(b"text\x00")
+    assert not looks_binary("plain text é".encode())
+    assert not looks_binary(b"x" * BINARY_PREFIX + b"\x00")
@@ -0,0 +1,173 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for keeping lexed files hot between polls.
+
+A poll must re-lex exactly the files that changed, and results must agree
+with lexing each file on its own, whether or not it was evicted meanwhile.
+"""
+
+import os
+import threading
+from pathlib import Path
+
+import pytest
+
+from mansa.lexer.batch import lex_file
+from mansa.lexer.watch import InotifyWaiter, PollWaiter, Workspace, make_waiter
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    (tmp_path / "a").mkdir()
+    (tmp_path / "a" / "one.mansa").write_text("alpha 1\n")
+    (tmp_path / "two.mansa").write_text("beta 2 $\n")
+    return tmp_path
+
+
+# ----
+# Workspace Tests
+# ----
+def test_workspace_first_poll_lexes_everything(tree):
+    workspace = Workspace([str(tree)])
+
+    changes = workspace.poll()
+
+    paths = [str(tree / "two.mansa"), str(tree / "a" / "one.mansa")]
+    assert changes.changed == paths
+    assert changes.removed == []
+    assert workspace.results() == [lex_file(path) for path in sorted(paths)]
+
+
+def test_workspace_repoll_relexes_only_changed_files(tree):
+    workspace = Workspace([str(tree)])
+    workspace.poll()
+
+    assert workspace.poll().changed == []
+
+    (tree / "two.mansa").write_text("beta gamma 2\n")
+    (tree / "new.mansa").write_text("x\n")
+    changes = workspace.poll()
+
+    assert changes.changed == [str(tree / "new.mansa"), str(tree / "two.mansa")]
+    assert lex_file(str(tree / "two.mansa")) in workspace.results()
+
+
+def test_workspace_poll_reports_removed_files(tree):
+    workspace = Workspace([str(tree)])
+    workspace.poll()
+
+    os.remove(tree / "two.mansa")
+    changes = workspace.poll()
+
+    assert changes.removed == [str(tree / "two.mansa")]
+    assert len(workspace) == 1
+
+
+def test_workspace_diagnostics(tree):
+    workspace = Workspace([str(tree)])
+    workspace.poll()
+
+    assert workspace.diagnostics(str(tree / "a" / "one.mansa")) == []
+    assert workspace.diagnostics(str(tree / "two.mansa")) == [
+        f"{tree / 'two.mansa'}:1:8: illegal '$'"
+    ]
+
+
+def test_workspace_diagnostics_count_characters(tmp_path):
+    path = tmp_path / "u.mansa"
+    path.write_text("é\n  x €€\n")
+    workspace = Workspace([str(path)])
+    workspace.poll()
+
+    assert workspace.diagnostics(str(path)) == [
+        f"{path}:1:1: illegal 'é'",
+        f"{path}:2:5: illegal '€€'",
+    ]
+
+
+def test_workspace_reports_binary_files(tmp_path):
+    path = tmp_path / "blob.mansa"
+    path.write_bytes(b"a\0b")
+    workspace = Workspace([str(path)])
+    workspace.poll()
+
+    (result,) = workspace.results()
+    assert result.error is not None
+    assert workspace.diagnostics(str(path)) == [result.error]
+
+
+def test_workspace_evicts_least_recently_used(tree):
+    one, two = str(tree / "a" / "one.mansa"), str(tree / "two.mansa")
+    workspace = Workspace([str(tree)], max_bytes=0)
+    workspace.poll()
+
+    # The most recently used file is kept whatever the budget.
+    assert workspace.is_held(one) and not workspace.is_held(two)
+    assert workspace.results() == [lex_file(one), lex_file(two)]
+
+    workspace.file(two)
+    assert workspace.is_held(two) and not workspace.is_held(one)
+    assert workspace.held_bytes == workspace.file(two).held_bytes > 0
+
+
+def test_workspace_reloaded_file_matches(tree):
+    two = str(tree / "two.mansa")
+    workspace = Workspace([str(tree)], max_bytes=0)
+    workspace.poll()
+
+    assert workspace.diagnostics(two) == [f"{two}:1:8: illegal '$'"]
+
+
+def test_workspace_directories(tree):
+    workspace = Workspace([str(tree), str(tree / "two.mansa")])
+    workspace.poll()
+
+    assert workspace.directories() == {str(tree), str(tree / "a")}
+
+
+# ----
+# Waiter Tests
+# ----
+def test_poll_waiter_sleeps_interval():
+    waiter = PollWaiter(0.0)
+    waiter.watch(["."])
+    waiter.wait()
+    waiter.close()
+
+
+def test_inotify_waiter_wakes_on_change(tmp_path):
+    waiter = make_waiter(5.0)
+    if not isinstance(waiter, InotifyWaiter):
+        pytest.skip("inotify is not available")
+    waiter.watch([str(tmp_path)])
+    timer = threading.Timer(0.05, (tmp_path / "new.mansa").write_text, ["x"])
+    timer.start()
+    try:
+        waiter.wait()
+    finally:
+        timer.join()
+        waiter.close()
+
+    assert (tmp_path / "new.mansa").exists()
+
+
+def test_inotify_waiter_times_out(tmp_path):
+    waiter = make_waiter(0.01)
+    if not isinstance(waiter, InotifyWaiter):
+        pytest.skip("inotify is not available")
+    waiter.watch([str(tmp_path)])
+    waiter.wait()
+    waiter.close()
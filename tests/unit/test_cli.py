@@ -0,0 +1,322 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for the ``mansa`` command line.
+"""
+
+import json
+import subprocess
+import sys
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+import pytest
+
+from mansa import __version__
+from mansa.cli import main
+from mansa.lexer.cache import TokenCache
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    path = tmp_path / "cache"
+    monkeypatch.setenv("MANSA_CACHE_DIR", str(path))
+    return path
+
+
+def test_cli_version(capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        main(["--version"])
+
+    assert exit_info.value.code == 0
+    assert capsys.readouterr().out.strip() == f"Mansa Genesis {__version__}"
+
+
+def test_cli_without_command_prints_help(capsys):
+    assert main([]) == 1
+    assert "usage: mansa" in capsys.readouterr().out
+
+
+def test_cli_unknown_command(capsys):
+    assert main(["build"]) == 1
+    assert "'build' not yet implemented" in capsys.readouterr().out
+
+
+# ----
+# Startup Tests
+# ----
+# Wall-clock time `mansa --version` may add on top of a bare interpreter.
+STARTUP_BUDGET = 0.05
+
+
+def run_python(*args: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, *args], capture_output=True, text=True, check=True
+    )
+
+
+def imported_modules(argv: list[str]) -> set[str]:
+    code = (
+        "import sys\n"
+        "from mansa.cli import main\n"
+        "try:\n"
+        f"    main({argv!r})\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print(*sys.modules, file=sys.stderr)\n"
+    )
+    return set(run_python("-c", code).stderr.split())
+
+
+def test_cli_version_imports_nothing_heavy():
+    modules = imported_modules(["--version"])
+
+    assert "mansa.cli" in modules
+    heavy = {"argparse", "dataclasses", "enum", "re", "typing", "mansa.lexer"}
+    assert not modules & heavy
+
+
+def test_cli_help_does_not_import_lexer():
+    modules = imported_modules(["-h"])
+
+    assert "mansa.commands.lex" in modules
+    assert not {name for name in modules if name.startswith("mansa.lexer")}
+
+
+def test_cli_version_startup_budget():
+    def best(*args: str) -> float:
+        times = []
+        for _ in range(5):
+            start = time.perf_counter()
+            run_python(*args)
+            times.append(time.perf_counter() - start)
+        return min(times)
+
+    bare = best("-c", "pass")
+    version = best("-m", "mansa", "--version")
+    assert version - bare < STARTUP_BUDGET
+
+
+# ----
+# mansa lex Tests
+# ----
+def test_cli_lex_reports_totals(tmp_path, capsys):
+    (tmp_path / "one.mansa").write_text("alpha 1\n")
+    (tmp_path / "two.mansa").write_text("beta 22\n")
+
+    assert main(["lex", "-j", "1", str(tmp_path)]) == 0
+    assert capsys.readouterr().out.split() == [
+        "files:",
+        "2",
+        "bytes:",
+        "16",
+        "tokens:",
+        "4",
+        "illegal:",
+        "0",
+        "cache:",
+        "hits:",
+        "0",
+        "misses:",
+        "2",
+    ]
+
+
+def test_cli_lex_fails_on_illegal_tokens(tmp_path, capsys):
+    path = tmp_path / "bad.mansa"
+    path.write_text("x $ y\n")
+
+    assert main(["lex", str(path)]) == 1
+    assert "illegal: 1" in capsys.readouterr().out
+
+
+def test_cli_lex_reports_unreadable_files(tmp_path, capsys):
+    assert main(["lex", str(tmp_path / "missing.mansa")]) == 1
+    assert "missing.mansa" in capsys.readouterr().err
+
+
+def test_cli_lex_without_sources(tmp_path, capsys):
+    assert main(["lex", str(tmp_path)]) == 1
+    assert "No source files found." in capsys.readouterr().err
+
+
+def test_cli_lex_warm_run_hits_cache(tmp_path, capsys, cache_dir, monkeypatch):
+    source = tmp_path / "src"
+    source.mkdir()
+    (source / "one.mansa").write_text("alpha 1\n")
+
+    main(["lex", str(source)])
+    capsys.readouterr()
+    # A run that writes nothing leaves the cache directory alone.
+    monkeypatch.setattr(TokenCache, "evict", None)
+    assert main(["lex", str(source)]) == 0
+    assert "cache: hits: 1  misses: 0" in capsys.readouterr().out
+    assert any(cache_dir.rglob("*.tokens"))
+
+
+def test_cli_lex_no_cache(tmp_path, capsys, cache_dir):
+    (tmp_path / "one.mansa").write_text("alpha 1\n")
+
+    assert main(["lex", "--no-cache", str(tmp_path / "one.mansa")]) == 0
+    assert "cache:" not in capsys.readouterr().out
+    assert not cache_dir.exists()
+
+
+def test_cli_lex_cache_dir_and_size(tmp_path, capsys):
+    (tmp_path / "one.mansa").write_text("alpha 1\n")
+    cache = tmp_path / "explicit"
+
+    args = ["lex", "--cache-dir", str(cache), "--cache-size", "1"]
+    assert main([*args, str(tmp_path / "one.mansa")]) == 0
+    assert any(cache.rglob("*.tokens"))  # well within the 1 MB limit
+
+
+@pytest.mark.parametrize("size", ["0", "-1"])
+def test_cli_lex_rejects_empty_cache_size(tmp_path, capsys, size):
+    with pytest.raises(SystemExit) as exit_info:
+        main(["lex", "--cache-size", size, str(tmp_path)])
+
+    assert exit_info.value.code == 2
+    assert "expected an integer >= 1" in capsys.readouterr().err
+
+
+def test_cli_lex_stats(tmp_path, capsys):
+    (tmp_path / "one.mansa").write_text("alpha 1\n")
+
+    assert main(["lex", "-j", "1", "--stats", str(tmp_path)]) == 0
+    err = capsys.readouterr().err
+    assert "lex.files" in err and "file.scan" in err
+    assert "tokens.ident" in err
+
+
+def test_cli_lex_stats_json_and_trace(tmp_path):
+    (tmp_path / "one.mansa").write_text("alpha 1\n")
+    stats, trace = tmp_path / "stats.json", tmp_path / "trace.json"
+
+    argv = ["lex", "--stats-json", str(stats), "--trace", str(trace)]
+    assert main([*argv, "--trace-memory", str(tmp_path)]) == 0
+    data = json.loads(stats.read_text())
+    assert data["phases"]["lex"]["calls"] == 1
+    assert data["counters"]["chars"] == 8
+    assert data["peak_traced_bytes"] > 0
+    names = {event["name"] for event in json.loads(trace.read_text())["traceEvents"]}
+    assert {"lex", "lex.discover", "lex.files", "file", "file.scan"} <= names
+
+
+def test_cli_lex_max_errors(tmp_path, capsys):
+    (tmp_path / "noisy.mansa").write_text("x $ " * 500)
+
+    assert main(["lex", "--no-cache", "--max-errors", "3", str(tmp_path)]) == 1
+    assert "tokens: 8  illegal: 4" in capsys.readouterr().out
+
+
+@pytest.mark.parametrize("command", ["lex", "watch"])
+def test_cli_rejects_negative_max_errors(tmp_path, capsys, command):
+    with pytest.raises(SystemExit) as exit_info:
+        main([command, "--max-errors", "-1", str(tmp_path)])
+
+    assert exit_info.value.code == 2
+    assert "expected an integer >= 0" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("jobs", ["0", "-2", "two"])
+def test_cli_lex_rejects_bad_job_counts(tmp_path, capsys, jobs):
+    with pytest.raises(SystemExit) as exit_info:
+        main(["lex", "-j", jobs, str(tmp_path)])
+
+    assert exit_info.value.code == 2
+    assert "expected an integer >= 1" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize(
+    ("option", "value", "message"),
+    [
+        ("--interval", "-1", "expected a number >= 0"),
+        ("--interval", "nan", "expected a number >= 0"),
+        ("--interval", "soon", "expected a number >= 0"),
+        ("--memory", "-1", "expected an integer >= 0"),
+    ],
+)
+def test_cli_watch_rejects_bad_limits(tmp_path, capsys, option, value, message):
+    with pytest.raises(SystemExit) as exit_info:
+        main(["watch", option, value, str(tmp_path)])
+
+    assert exit_info.value.code == 2
+    assert message in capsys.readouterr().err
+
+
+def test_cli_lex_threads(tmp_path, capsys):
+    (tmp_path / "a.mansa").write_text("a b\n")
+    (tmp_path / "b.mansa").write_text("c $\n")
+
+    assert main(["lex", "--no-cache", "--threads", "-j", "2", str(tmp_path)]) == 1
+    assert "files: 2  bytes: 8  tokens: 4  illegal: 1" in capsys.readouterr().out
+
+
+def test_cli_lex_skips_binary_files(tmp_path, capsys):
+    (tmp_path / "ok.mansa").write_text("x\n")
+    (tmp_path / "blob.mansa").write_bytes(b"\0" * 64)
+
+    assert main(["lex", "--no-cache", str(tmp_path)]) == 1
+    captured = capsys.readouterr()
+    assert "binary file" in captured.err
+    assert "files: 2" in captured.out
+
+
+# ----
+# watch Tests
+# ----
+class EditingWaiter:
+    """Stands in for a waiter: edits a file on the first wait, then stops."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.waits = 0
+        self.directories: set[str] = set()
+        self.closed = False
+
+    def watch(self, directories: Iterable[str]) -> None:
+        self.directories = set(directories)
+
+    def wait(self) -> None:
+        self.waits += 1
+        if self.waits > 1:
+            raise KeyboardInterrupt
+        self.path.write_text("x $ y\n")
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def test_cli_watch_relexes_changed_files(tmp_path, capsys, monkeypatch):
+    (tmp_path / "a.mansa").write_text("a\n")
+    (tmp_path / "b.mansa").write_text("b c\n")
+    waiter = EditingWaiter(tmp_path / "b.mansa")
+    monkeypatch.setattr("mansa.lexer.watch.make_waiter", lambda interval: waiter)
+
+    assert main(["watch", str(tmp_path)]) == 0
+    captured = capsys.readouterr()
+    first, second = captured.out.splitlines()
+    assert "changed: 2  removed: 0" in first and "tokens: 3  illegal: 0" in first
+    assert "changed: 1  removed: 0" in second and "tokens: 4  illegal: 1" in second
+    assert f"{tmp_path / 'b.mansa'}:1:3: illegal '$'" in captured.err
+    assert waiter.directories == {str(tmp_path)}
+    assert waiter.closed
+
+
+def test_cli_watch_without_sources(tmp_path, capsys):
+    assert main(["watch", "--poll", str(tmp_path)]) == 1
+    assert "No source files found." in capsys.readouterr().err
@@ -0,0 +1,142 @@
+# Copyright [2025] Rufai Limantawa <rufailimantawa@gmail.com>
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Unit tests for ``mansa.instrument``.
+"""
+
+import json
+import pickle
+import threading
+
+from mansa.instrument import NULL_RECORDER, Recorder, current, write_json
+
+
+def test_current_is_null_outside_a_recorder():
+    assert current() is NULL_RECORDER
+    assert not current().enabled
+
+
+def test_null_recorder_records_nothing():
+    with NULL_RECORDER.phase("scan"):
+        NULL_RECORDER.count("files")
+
+    assert NULL_RECORDER.phases == {}
+    assert NULL_RECORDER.counters == {}
+    assert NULL_RECORDER.events == []
+
+
+def test_recorder_is_current_while_entered():
+    with Recorder() as outer:
+        assert current() is outer
+        with Recorder() as inner:
+            assert current() is inner
+        assert current() is outer
+    assert current() is NULL_RECORDER
+
+
+def test_recorder_is_current_on_its_thread_only():
+    seen = []
+    with Recorder() as recorder:
+        thread = threading.Thread(target=lambda: seen.append(current()))
+        thread.start()
+        thread.join()
+        assert current() is recorder
+    assert seen == [NULL_RECORDER]
+
+
+def test_phase_totals_and_trace_events():
+    with Recorder() as recorder:
+        for _ in range(3):
+            with recorder.phase("scan", path="a.mansa"):
+                sum(range(1000))
+
+    calls, wall_ns, cpu_ns = recorder.phases["scan"]
+    assert calls == 3
+    assert wall_ns > 0 and cpu_ns >= 0
+    assert len(recorder.events) == 3
+    event = recorder.events[0]
+    assert event["name"] == "scan" and event["ph"] == "X"
+    assert event["args"] == {"path": "a.mansa"}
+
+
+def test_phases_are_listed_in_start_order():
+    recorder = Recorder()
+    with recorder.phase("outer"), recorder.phase("inner"):
+        pass
+
+    assert list(recorder.phases) == ["outer", "inner"]
+
+
+def test_phase_is_recorded_when_the_block_raises():
+    recorder = Recorder()
+    try:
+        with recorder.phase("scan"):
+            raise ValueError
+    except ValueError:
+        pass
+
+    assert recorder.phases["scan"][0] == 1
+
+
+def test_count():
+    recorder = Recorder()
+    recorder.count("files")
+    recorder.count("files")
+    recorder.count("bytes", 10)
+
+    assert recorder.counters == {"files": 2, "bytes": 10}
+
+
+def test_trace_memory_records_peak():
+    with Recorder(trace_memory=True) as recorder:
+        data = bytearray(1 << 20)
+        del data
+
+    assert recorder.peak_traced is not None
+    assert recorder.peak_traced >= 1 << 20
+    assert Recorder().peak_traced is None
+
+
+def test_merge_pickled_recorder():
+    parent, worker = Recorder(), Recorder()
+    with parent.phase("scan"):
+        parent.count("files")
+    with worker.phase("scan"):
+        worker.count("files", 2)
+    worker.peak_traced = 100
+
+    parent.merge(pickle.loads(pickle.dumps(worker)))
+    assert parent.phases["scan"][0] == 2
+    assert parent.counters == {"files": 3}
+    assert len(parent.events) == 2
+    assert parent.peak_traced == 100
+
+
+def test_stats_trace_and_summary(tmp_path):
+    recorder = Recorder()
+    with recorder.phase("scan"):
+        recorder.count("tokens.ident", 1234)
+
+    stats = json.loads(json.dumps(recorder.stats()))
+    assert stats["phases"]["scan"]["calls"] == 1
+    assert stats["counters"] == {"tokens.ident": 1234}
+    assert stats["peak_traced_bytes"] is None
+    assert recorder.trace()["traceEvents"] == recorder.events
+    summary = recorder.summary()
+    assert "scan" in summary and "1,234" in summary
+
+    path = tmp_path / "trace.json"
+    write_json(str(path), recorder.trace())
+    assert json.loads(path.read_text())["traceEvents"][0]["name"] == "scan"